@@ -0,0 +1,121 @@
+"""Game state for guess my number, separate from any input or output."""
+
+from random import randint
+
+
+# Results of a guess.
+too_high = "too high"
+too_low = "too low"
+correct = "correct"
+
+
+class Game:
+    """Class for a game of guess my number.
+
+    Attributes:
+    lower_bound (int) - lowest number that can be picked.
+    upper_bound (int) - highest number that can be picked.
+    number (int) - number to guess.
+    remaining_guesses (int) - number of guesses left.
+    won (bool) - flag to check if the number has been guessed.
+    """
+    __slots__ = ("lower_bound", "upper_bound", "number", "remaining_guesses",
+            "won")
+
+    def __init__(self, lower_bound, upper_bound, attempts, number=None):
+        """Initialise the new game.
+
+        Arguments:
+        lower_bound (int) - lowest number that can be picked.
+        upper_bound (int) - highest number that can be picked.
+        attempts (int) - number of guesses allowed.
+        number (int) - number to guess, or None to pick one at random.
+        """
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+
+        # Pick a random number and set the remaining guesses.
+        if number is None:
+            number = randint(lower_bound, upper_bound)
+
+        self.number = number
+        self.remaining_guesses = attempts
+        self.won = False
+
+    @property
+    def over(self):
+        """Check if the game has finished."""
+        return self.won or self.remaining_guesses <= 0
+
+    def guess(self, guess):
+        """Make a guess.
+
+        Arguments:
+        guess (int) - the guess.
+
+        Returns:
+        (str) - too_high, too_low or correct.
+        """
+        if guess > self.number:
+            self.remaining_guesses -= 1
+            return too_high
+        elif guess < self.number:
+            self.remaining_guesses -= 1
+            return too_low
+        else:
+            self.won = True
+            return correct
+
+    def invalid_guess(self):
+        """Use up a guess that wasn't a number."""
+        self.remaining_guesses -= 1
+
+
+class AdversarialGame(Game):
+    """Class for a game that avoids committing to a number.
+
+    Each guess is answered so as to leave the most numbers still possible,
+    so the guesser is always in the worst case. Inherits from Game.
+
+    Attributes:
+    low (int) - lowest number still possible.
+    high (int) - highest number still possible.
+    """
+    __slots__ = ("low", "high")
+
+    def __init__(self, lower_bound, upper_bound, attempts):
+        """Initialise the new game.
+
+        Arguments:
+        lower_bound (int) - lowest number that can be picked.
+        upper_bound (int) - highest number that can be picked.
+        attempts (int) - number of guesses allowed.
+        """
+        Game.__init__(self, lower_bound, upper_bound, attempts, lower_bound)
+
+        self.low = lower_bound
+        self.high = upper_bound
+
+    def guess(self, guess):
+        """Make a guess.
+
+        Arguments:
+        guess (int) - the guess.
+
+        Returns:
+        (str) - too_high, too_low or correct.
+        """
+        # Keep whichever side of the guess has more numbers left in it.
+        below = min(guess, self.high + 1) - self.low
+        above = self.high - max(guess, self.low - 1)
+
+        if below <= 0 and above <= 0:
+            self.number = guess
+        elif below >= above:
+            self.high = min(self.high, guess - 1)
+            self.number = self.high
+        else:
+            self.low = max(self.low, guess + 1)
+            self.number = self.low
+
+        return Game.guess(self, guess)
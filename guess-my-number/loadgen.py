@@ -0,0 +1,131 @@
+"""Load generator for the guess my number server.
+
+Opens many connections to a running server at once, each playing a full
+game with the bisection strategy, and reports how many games the server
+got through per second. Run `python loadgen.py --help` for options.
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+
+
+import main
+from strategies import bisection
+
+
+async def play(host, port, lower_bound, upper_bound):
+    """Play one game against the server.
+
+    Arguments:
+    host (str) - address of the server.
+    port (int) - port of the server.
+    lower_bound (int) - lowest number the server can pick.
+    upper_bound (int) - highest number the server can pick.
+
+    Returns:
+    (bool) - True if the game was won.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    low, high = lower_bound, upper_bound
+    guess = None
+    won = False
+
+    try:
+        while True:
+            line = await reader.readline()
+
+            # Server finished the game.
+            if not line:
+                break
+
+            # Narrow down the numbers still possible.
+            if line == b"Too high!\n":
+                high = guess - 1
+            elif line == b"Too low!\n":
+                low = guess + 1
+            elif line == b"Correct!\n":
+                won = True
+            elif line.endswith(b"remaining guesses:\n"):
+                guess = bisection(low, high)
+                writer.write("{}\n".format(guess).encode())
+    finally:
+        writer.close()
+
+    return won
+
+
+async def run(host, port, sessions, concurrency, lower_bound, upper_bound):
+    """Play many games against the server, some at the same time.
+
+    Arguments:
+    host (str) - address of the server.
+    port (int) - port of the server.
+    sessions (int) - number of games to play.
+    concurrency (int) - number of games to play at the same time.
+    lower_bound (int) - lowest number the server can pick.
+    upper_bound (int) - highest number the server can pick.
+
+    Returns:
+    (tuple) - number of games won, number of games that failed, and a
+    sorted list of seconds each game took.
+    """
+    limit = asyncio.Semaphore(concurrency)
+    times = []
+    results = {"won": 0, "failed": 0}
+
+    async def session():
+        """Play a single game, once there is room."""
+        async with limit:
+            start = perf_counter()
+            try:
+                if await play(host, port, lower_bound, upper_bound):
+                    results["won"] += 1
+            except OSError:
+                results["failed"] += 1
+            times.append(perf_counter() - start)
+
+    await asyncio.gather(*(session() for i in range(sessions)))
+
+    return results["won"], results["failed"], sorted(times)
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Load test a guess my "
+            "number server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("-p", "--port", type=int, default=8000)
+    parser.add_argument("-n", "--sessions", type=int, default=10000,
+            help="number of games to play")
+    parser.add_argument("-c", "--concurrency", type=int, default=500,
+            help="number of games to play at the same time")
+    parser.add_argument("--lower-bound", type=int, default=main.lower_bound)
+    parser.add_argument("--upper-bound", type=int, default=main.upper_bound)
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    start = perf_counter()
+    won, failed, times = asyncio.run(run(arguments.host, arguments.port,
+        arguments.sessions, arguments.concurrency, arguments.lower_bound,
+        arguments.upper_bound))
+    elapsed = perf_counter() - start
+
+    print("{} games in {:.2f}s, {:.0f} games per second.".format(
+        len(times), elapsed, len(times) / elapsed))
+    print("{} won, {} failed.".format(won, failed))
+    print("Game time: p50 {:.4f}s, p99 {:.4f}s.".format(
+        times[len(times) // 2], times[min(len(times) - 1,
+            int(len(times) * 0.99))]))
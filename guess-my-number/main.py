@@ -1,5 +1,5 @@
-from os import name, system
-from random import randint
+from engine import Game, too_high, too_low
+from terminal import Terminal
 
 
 # Variables for generating random numbers and number of guesses.
@@ -8,22 +8,21 @@ lower_bound = 1
 upper_bound = 100
 attempts = 10
 
+# Terminal to draw the game to.
+terminal = Terminal()
+
 
 def clear_screen():
-    """Clear a terminal screen by issuing commands."""
-    if name == "nt":
-        system("cls")
-    else:
-        system("clear")
+    """Clear the terminal, if output is going to one."""
+    terminal.clear()
 
 
 # Main program.
 if __name__ == "__main__":
     clear_screen()
 
-    # Pick a random number and set the remaining guesses.
-    number = randint(lower_bound, upper_bound)
-    remaining_guesses = attempts
+    # Start a new game, picking a random number.
+    game = Game(lower_bound, upper_bound, attempts)
 
     # Print information out to the screen.
     print("I'm thinking of a number between {} and {}.".format(lower_bound,
@@ -32,34 +31,32 @@ if __name__ == "__main__":
     print("Can you guess what it is?")
 
     # Until the user has no more guesses...
-    while remaining_guesses > 0:
+    while not game.over:
         try:
             # Attempt to get an integer input from the user.
             guess = int(input("\n{} remaining guesses: ".format(
-                remaining_guesses)))
+                game.remaining_guesses)))
 
             clear_screen()
 
             # Check users guess.
-            if guess > number:
+            result = game.guess(guess)
+            if result == too_high:
                 print("Too high!")
-                remaining_guesses -= 1
-            elif guess < number:
+            elif result == too_low:
                 print("Too low!")
-                remaining_guesses -= 1
             else:
                 print("Correct!")
-                break
 
         except ValueError:
             # User didn't input an integer, report error.
             print("My number is an integer!")
-            remaining_guesses -= 1
+            game.invalid_guess()
 
     # Game over.
-    if remaining_guesses > 0:
+    if game.won:
         # User won.
-        print("The number was {}. Well done. :D".format(number))
+        print("The number was {}. Well done. :D".format(game.number))
     else:
         # User lost.
         print("You couldn't guess my number. Better luck next time!")
@@ -0,0 +1,156 @@
+"""Guess my number server.
+
+Hosts games for many players at once over TCP, one game per connection,
+using asyncio. Players send one guess per line, e.g. with
+`nc localhost 8000`. Run `python server.py --help` for options.
+"""
+
+import argparse
+import asyncio
+
+
+import main
+from engine import Game, too_high, too_low
+
+
+class Server:
+    """Class for a server hosting games of guess my number.
+
+    Attributes:
+    lower_bound (int) - lowest number that can be picked.
+    upper_bound (int) - highest number that can be picked.
+    attempts (int) - number of guesses allowed.
+    timeout (float) - seconds a player can be idle before being dropped.
+    sessions (int) - number of games being played.
+    played (int) - number of games that have finished.
+    """
+    def __init__(self, lower_bound, upper_bound, attempts, timeout):
+        """Initialise the new server.
+
+        Arguments:
+        lower_bound (int) - lowest number that can be picked.
+        upper_bound (int) - highest number that can be picked.
+        attempts (int) - number of guesses allowed.
+        timeout (float) - seconds a player can be idle before being
+        dropped.
+        """
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+        self.attempts = attempts
+        self.timeout = timeout
+
+        self.sessions = 0
+        self.played = 0
+
+    async def handle(self, reader, writer):
+        """Play a game with a connected player.
+
+        Arguments:
+        reader (asyncio.StreamReader) - stream to read guesses from.
+        writer (asyncio.StreamWriter) - stream to write replies to.
+        """
+        self.sessions += 1
+        game = Game(self.lower_bound, self.upper_bound, self.attempts)
+
+        try:
+            # Send information to the player.
+            writer.write("I'm thinking of a number between {} and {}.\n"
+                    "You have {} tries to guess my number.\n"
+                    "Can you guess what it is?\n".format(self.lower_bound,
+                        self.upper_bound, self.attempts).encode())
+
+            # Until the player has no more guesses...
+            while not game.over:
+                writer.write("{} remaining guesses:\n".format(
+                    game.remaining_guesses).encode())
+                await writer.drain()
+
+                # Drop the player if they are idle for too long.
+                try:
+                    line = await asyncio.wait_for(reader.readline(),
+                            self.timeout)
+                except asyncio.TimeoutError:
+                    writer.write(b"Timed out.\n")
+                    return
+
+                # Player disconnected.
+                if not line:
+                    return
+
+                try:
+                    # Check players guess.
+                    result = game.guess(int(line))
+                    if result == too_high:
+                        writer.write(b"Too high!\n")
+                    elif result == too_low:
+                        writer.write(b"Too low!\n")
+                    else:
+                        writer.write(b"Correct!\n")
+                except ValueError:
+                    # Player didn't send an integer, report error.
+                    writer.write(b"My number is an integer!\n")
+                    game.invalid_guess()
+
+            # Game over.
+            if game.won:
+                writer.write("The number was {}. Well done. :D\n".format(
+                    game.number).encode())
+            else:
+                writer.write(b"You couldn't guess my number. Better luck "
+                        b"next time!\n")
+
+            self.played += 1
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            # Connection was lost or player sent a line that was too long.
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    async def serve(self, host, port):
+        """Accept players until cancelled.
+
+        Arguments:
+        host (str) - address to listen on.
+        port (int) - port to listen on.
+        """
+        server = await asyncio.start_server(self.handle, host, port,
+                limit=256)
+
+        async with server:
+            await server.serve_forever()
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Host games of guess my "
+            "number.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("-p", "--port", type=int, default=8000)
+    parser.add_argument("--timeout", type=float, default=60,
+            help="seconds a player can be idle before being dropped")
+    parser.add_argument("--lower-bound", type=int, default=main.lower_bound)
+    parser.add_argument("--upper-bound", type=int, default=main.upper_bound)
+    parser.add_argument("--attempts", type=int, default=main.attempts)
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    server = Server(arguments.lower_bound, arguments.upper_bound,
+            arguments.attempts, arguments.timeout)
+
+    try:
+        asyncio.run(server.serve(arguments.host, arguments.port))
+    except KeyboardInterrupt:
+        pass
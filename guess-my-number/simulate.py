@@ -0,0 +1,160 @@
+"""Simulate many games of guess my number at once.
+
+Requires NumPy. Every game in a batch is stored in arrays and played one
+guess at a time for all games together. Run `python simulate.py --help`
+for options.
+"""
+
+import argparse
+import json
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+import main
+from strategies import strategies
+
+
+def simulate(strategy, games, lower_bound, upper_bound, attempts,
+        adversarial=False, rng=None, chunk_size=1000000):
+    """Simulate many games with a strategy.
+
+    Arguments:
+    strategy (function) - strategy to guess with.
+    games (int) - number of games to play.
+    lower_bound (int) - lowest number that can be picked.
+    upper_bound (int) - highest number that can be picked.
+    attempts (int) - number of guesses allowed.
+    adversarial (bool) - True to answer guesses like engine.AdversarialGame,
+    rather than picking a number at random.
+    rng (numpy.random.Generator) - random number generator to use, or None
+    for a new one.
+    chunk_size (int) - number of games to play at once.
+
+    Returns:
+    (numpy.ndarray) - how many games were won with each number of guesses,
+    indexed by number of guesses. Index 0 counts games that were lost.
+    """
+    if numpy is None:
+        raise ImportError("Simulating games requires NumPy.")
+
+    if rng is None:
+        rng = numpy.random.default_rng()
+
+    counts = numpy.zeros(attempts + 1, dtype=numpy.int64)
+
+    for start in range(0, games, chunk_size):
+        size = min(chunk_size, games - start)
+
+        # Set up the numbers still possible for every game.
+        low = numpy.full(size, lower_bound, dtype=numpy.int64)
+        high = numpy.full(size, upper_bound, dtype=numpy.int64)
+        number = rng.integers(lower_bound, upper_bound + 1, size)
+        playing = numpy.ones(size, dtype=bool)
+
+        for turn in range(1, attempts + 1):
+            guess = strategy(low, high, rng)
+
+            if adversarial:
+                # Answer to keep the larger side, only conceding when one
+                # number is left.
+                below = numpy.minimum(guess, high + 1) - low
+                above = high - numpy.maximum(guess, low - 1)
+                number = numpy.where((below <= 0) & (above <= 0), guess,
+                        numpy.where(below >= above, low, high))
+
+            right = playing & (guess == number)
+            counts[turn] += numpy.count_nonzero(right)
+            playing &= ~right
+
+            # Narrow down the numbers still possible.
+            high = numpy.where(playing & (guess > number), guess - 1, high)
+            low = numpy.where(playing & (guess < number), guess + 1, low)
+
+        counts[0] += numpy.count_nonzero(playing)
+
+    return counts
+
+
+def summarise(counts):
+    """Summarise the results of a simulation.
+
+    Arguments:
+    counts (numpy.ndarray) - counts returned by simulate.
+
+    Returns:
+    (dict) - win rate, mean guesses taken to win and the distribution of
+    guesses taken.
+    """
+    games = int(counts.sum())
+    wins = games - int(counts[0])
+    guesses = numpy.arange(len(counts))
+
+    return {
+            "games": games,
+            "win_rate": wins / games if games else 0.0,
+            "mean_guesses": float((counts * guesses).sum() / wins)
+            if wins else 0.0,
+            "guesses": {str(i): int(counts[i]) for i in range(1, len(counts))},
+            "lost": int(counts[0])
+            }
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Simulate games of guess "
+            "my number.")
+    parser.add_argument("-n", "--games", type=int, default=1000000)
+    parser.add_argument("--strategy", choices=sorted(strategies),
+            default="bisection")
+    parser.add_argument("--adversarial", action="store_true",
+            help="answer guesses adversarially instead of picking a number")
+    parser.add_argument("--lower-bound", type=int, default=main.lower_bound)
+    parser.add_argument("--upper-bound", type=int, default=main.upper_bound)
+    parser.add_argument("--attempts", type=lambda text: [int(attempts)
+        for attempts in text.split(",")], default=[main.attempts],
+        help="comma separated numbers of guesses allowed")
+    parser.add_argument("-s", "--seed", type=int, default=None)
+    parser.add_argument("--json", action="store_true",
+            help="write results as JSON")
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+    rng = numpy.random.default_rng(arguments.seed)
+
+    results = []
+    for attempts in arguments.attempts:
+        counts = simulate(strategies[arguments.strategy], arguments.games,
+                arguments.lower_bound, arguments.upper_bound, attempts,
+                arguments.adversarial, rng)
+
+        result = summarise(counts)
+        result["attempts"] = attempts
+        results.append(result)
+
+    if arguments.json:
+        json.dump(results, sys.stdout, indent=4)
+        print()
+    else:
+        for result in results:
+            print("{} attempts: won {:.2%} of {} games, {:.2f} guesses on "
+                    "average.".format(result["attempts"], result["win_rate"],
+                        result["games"], result["mean_guesses"]))
+            for guesses, count in result["guesses"].items():
+                print("{:>4} {:>10}".format(guesses, count))
+            print("lost {:>10}".format(result["lost"]))
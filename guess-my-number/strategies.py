@@ -0,0 +1,81 @@
+"""Strategies for playing guess my number without a human.
+
+Each strategy takes the lowest and highest numbers still possible and
+returns a guess. They work on plain integers, and on NumPy arrays of many
+games at once.
+"""
+
+import random
+
+
+from engine import correct, too_high
+
+
+def bisection(low, high, rng=None):
+    """Guess the middle of the numbers still possible.
+
+    Arguments:
+    low (int) - lowest number still possible.
+    high (int) - highest number still possible.
+    rng - unused, for the same arguments as other strategies.
+
+    Returns:
+    (int) - the guess.
+    """
+    return (low + high) // 2
+
+
+def random_guess(low, high, rng=None):
+    """Guess any of the numbers still possible.
+
+    Arguments:
+    low (int) - lowest number still possible.
+    high (int) - highest number still possible.
+    rng - random number generator to use, a numpy.random.Generator for
+    arrays, or None for the random module.
+
+    Returns:
+    (int) - the guess.
+    """
+    if rng is None:
+        return random.randint(low, high)
+
+    if isinstance(rng, random.Random):
+        return rng.randint(low, high)
+
+    return rng.integers(low, high + 1)
+
+
+strategies = {
+        "bisection": bisection,
+        "random": random_guess
+        }
+
+
+def play(game, strategy, rng=None):
+    """Play a game to the end with a strategy.
+
+    Arguments:
+    game (engine.Game) - game to play.
+    strategy (function) - strategy to guess with.
+    rng - random number generator to pass to the strategy.
+
+    Returns:
+    guesses (int) - number of guesses made.
+    """
+    low = game.lower_bound
+    high = game.upper_bound
+    guesses = 0
+
+    while not game.over:
+        guess = strategy(low, high, rng)
+        result = game.guess(guess)
+        guesses += 1
+
+        # Narrow down the numbers still possible.
+        if result == too_high:
+            high = guess - 1
+        elif result != correct:
+            low = guess + 1
+
+    return guesses
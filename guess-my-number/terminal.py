@@ -0,0 +1,85 @@
+"""Terminal output using ANSI escape sequences."""
+
+import sys
+from os import name
+
+
+# ANSI escape sequences.
+home = "\033[H"
+clear_display = "\033[2J"
+clear_scrollback = "\033[3J"
+
+
+def enable_ansi(stream):
+    """Turn on ANSI escape sequences for a Windows console.
+
+    Does nothing on other systems, or if the console can't be changed.
+
+    Arguments:
+    stream (file) - stream writing to the console.
+    """
+    if name != "nt":
+        return
+
+    try:
+        import ctypes
+        import msvcrt
+
+        kernel32 = ctypes.windll.kernel32
+        handle = msvcrt.get_osfhandle(stream.fileno())
+        mode = ctypes.c_uint32()
+
+        # Add ENABLE_VIRTUAL_TERMINAL_PROCESSING to the console mode.
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+    except (AttributeError, ImportError, OSError, ValueError):
+        pass
+
+
+class Terminal:
+    """Class for drawing to a terminal.
+
+    Output is written to a buffered stream rather than by running commands.
+    Clearing does nothing when the stream isn't a terminal, so output can be
+    redirected to a file or run without a terminal.
+
+    Attributes:
+    stream (file) - stream to write to.
+    interactive (bool) - flag to check if the stream is a terminal.
+    """
+    def __init__(self, stream=None):
+        """Initialise the new terminal.
+
+        Arguments:
+        stream (file) - stream to write to, or None for standard output.
+        """
+        self.stream = stream or sys.stdout
+
+        try:
+            self.interactive = self.stream.isatty()
+        except (AttributeError, ValueError):
+            self.interactive = False
+
+        if self.interactive:
+            enable_ansi(self.stream)
+
+    def clear(self):
+        """Clear the terminal and move the cursor to the top left."""
+        if self.interactive:
+            self.stream.write(home + clear_display + clear_scrollback)
+
+    def redraw(self, text):
+        """Clear the terminal and draw some text in a single write.
+
+        Arguments:
+        text (str) - text to draw.
+        """
+        if self.interactive:
+            text = home + clear_display + clear_scrollback + text
+
+        self.stream.write(text)
+        self.stream.flush()
+
+    def flush(self):
+        """Flush anything written to the terminal."""
+        self.stream.flush()
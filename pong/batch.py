@@ -0,0 +1,446 @@
+"""Run many Pong matches at once with NumPy.
+
+Requires NumPy. Stores the balls, paddles and scores of every match in
+arrays and moves them all on by one tick together, with the same rules as
+match.Match. Run `python batch.py --help` for options.
+"""
+
+import argparse
+from time import perf_counter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+from settings import *
+
+
+# Sizes and positions of the ball and paddles, as in sprites.py.
+ball_size = 20
+paddle_width = 10
+paddle_height = 100
+paddle_x = (30, screen_width - 40)
+
+# Starting speeds of the ball.
+ball_speeds = (5, 6, 7)
+
+
+def overlap(ball_x, ball_y, left, top):
+    """Check which balls overlap a paddle.
+
+    Arguments:
+    ball_x (numpy.ndarray) - X position of each ball.
+    ball_y (numpy.ndarray) - Y position of each ball.
+    left (int) - X position of the paddle.
+    top (numpy.ndarray) - Y position of the paddle in each match.
+
+    Returns:
+    (numpy.ndarray) - flag for each ball to check if it overlaps.
+    """
+    return ((ball_x < left + paddle_width) & (ball_x + ball_size > left) &
+            (ball_y < top + paddle_height) & (ball_y + ball_size > top))
+
+
+def sweep_arrays(ball_x, ball_y, dx, dy, left, top):
+    """Find when moving balls first hit a paddle.
+
+    Works like physics.sweep, for every match at once.
+
+    Arguments:
+    ball_x (numpy.ndarray) - X position of each ball.
+    ball_y (numpy.ndarray) - Y position of each ball.
+    dx (numpy.ndarray) - distance each ball moves along X.
+    dy (numpy.ndarray) - distance each ball moves along Y.
+    left (int) - X position of the paddle.
+    top (numpy.ndarray) - Y position of the paddle in each match.
+
+    Returns:
+    (tuple) - fraction of the move made before each ball touches the
+    paddle, or infinity if it doesn't, and a flag for each ball to check if
+    it touches along X.
+    """
+    right = left + paddle_width
+    bottom = top + paddle_height
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        # Find when the ball and paddle start and stop overlapping along X.
+        inside_x = (ball_x + ball_size > left) & (ball_x < right)
+        x_entry = numpy.where(dx > 0, (left - ball_x - ball_size) / dx,
+                numpy.where(dx < 0, (right - ball_x) / dx,
+                    numpy.where(inside_x, -numpy.inf, numpy.inf)))
+        x_exit = numpy.where(dx > 0, (right - ball_x) / dx,
+                numpy.where(dx < 0, (left - ball_x - ball_size) / dx,
+                    numpy.where(inside_x, numpy.inf, -numpy.inf)))
+
+        # Find when the ball and paddle start and stop overlapping along Y.
+        inside_y = (ball_y + ball_size > top) & (ball_y < bottom)
+        y_entry = numpy.where(dy > 0, (top - ball_y - ball_size) / dy,
+                numpy.where(dy < 0, (bottom - ball_y) / dy,
+                    numpy.where(inside_y, -numpy.inf, numpy.inf)))
+        y_exit = numpy.where(dy > 0, (bottom - ball_y) / dy,
+                numpy.where(dy < 0, (top - ball_y - ball_size) / dy,
+                    numpy.where(inside_y, numpy.inf, -numpy.inf)))
+
+    # Balls touch the paddle once they overlap along both axes.
+    entry = numpy.maximum(x_entry, y_entry)
+    exit = numpy.minimum(x_exit, y_exit)
+    touching = (entry < exit) & (entry >= 0) & (entry < 1)
+
+    return numpy.where(touching, entry, numpy.inf), x_entry > y_entry
+
+
+class BatchMatch:
+    """Class for many matches of Pong played at once.
+
+    Attributes:
+    size (int) - number of matches.
+    rng (numpy.random.Generator) - random number generator for the balls.
+    ball_x (numpy.ndarray) - X position of each ball.
+    ball_y (numpy.ndarray) - Y position of each ball.
+    ball_dx (numpy.ndarray) - X vector of each ball.
+    ball_dy (numpy.ndarray) - Y vector of each ball.
+    paddle_y (numpy.ndarray) - Y position of each paddle, one row per match.
+    scores (numpy.ndarray) - score of each paddle, one row per match.
+    paddle_hit_count (numpy.ndarray) - number of paddle hits since the last
+    point in each match.
+    ticks (numpy.ndarray) - number of ticks played in each match.
+    """
+    def __init__(self, size, seed=None):
+        """Initialise the new matches.
+
+        Arguments:
+        size (int) - number of matches.
+        seed (int) - seed for the balls, or None for a random one.
+        """
+        if numpy is None:
+            raise ImportError("BatchMatch requires NumPy.")
+
+        self.size = size
+        self.rng = numpy.random.default_rng(seed)
+
+        self.ball_x = numpy.zeros(size, dtype=numpy.int64)
+        self.ball_y = numpy.zeros(size, dtype=numpy.int64)
+        self.ball_dx = self.random_speeds(size, True)
+        self.ball_dy = self.random_speeds(size, True)
+        self.paddle_y = numpy.zeros((size, 2), dtype=numpy.int64)
+        self.scores = numpy.zeros((size, 2), dtype=numpy.int64)
+        self.paddle_hit_count = numpy.zeros(size, dtype=numpy.int64)
+        self.ticks = numpy.zeros(size, dtype=numpy.int64)
+
+        self.reset_sprites(numpy.ones(size, dtype=bool))
+
+    @property
+    def over(self):
+        """Check which matches a player has won."""
+        return (self.scores >= winning_score).any(axis=1)
+
+    def random_speeds(self, count, either_way, sign=1):
+        """Pick random starting speeds for balls.
+
+        Arguments:
+        count (int) - number of speeds to pick.
+        either_way (bool) - True to pick the direction at random too.
+        sign (int) - direction to use if either_way is False.
+
+        Returns:
+        (numpy.ndarray) - the speeds.
+        """
+        speeds = self.rng.choice(ball_speeds, count)
+
+        if either_way:
+            return speeds * self.rng.choice((-1, 1), count)
+
+        return speeds * sign
+
+    def reset_sprites(self, mask):
+        """Reset the paddles and balls of some matches.
+
+        Arguments:
+        mask (numpy.ndarray) - flag for each match to check if it should be
+        reset.
+        """
+        self.paddle_hit_count[mask] = 0
+        self.ball_x[mask] = int(screen_width / 2) - int(ball_size / 2)
+        self.ball_y[mask] = int(screen_height / 2) - int(ball_size / 2)
+        self.paddle_y[mask] = int(screen_height / 2) - int(paddle_height / 2)
+
+    def move_balls(self, playing):
+        """Move the balls for one tick, bouncing them off the paddles.
+
+        Balls are swept along their paths, as in match.Match.move_ball.
+
+        Arguments:
+        playing (numpy.ndarray) - flag for each match to check if it is
+        still being played.
+
+        Returns:
+        hits (numpy.ndarray) - number of times each ball hit a paddle.
+        """
+        hits = numpy.zeros(self.size, dtype=numpy.int64)
+
+        # Push balls out of any paddle that has moved into them.
+        for paddle in range(2):
+            top = self.paddle_y[:, paddle]
+            inside = playing & overlap(self.ball_x, self.ball_y, paddle_x[paddle], top)
+            above = inside & (self.ball_y + ball_size // 2 < top + paddle_height // 2)
+            below = inside & ~above
+
+            self.ball_y = numpy.where(above, top - ball_size, numpy.where(below, top + paddle_height, self.ball_y))
+            self.ball_dy = numpy.where(above, -abs(self.ball_dy), numpy.where(below, abs(self.ball_dy), self.ball_dy))
+            hits += inside
+
+        # Fraction of the tick each ball still has to move for.
+        remaining = numpy.where(playing, 1.0, 0.0)
+        bouncing = playing
+
+        for bounce in range(max_bounces):
+            dx = self.ball_dx * remaining
+            dy = self.ball_dy * remaining
+
+            # Find the first paddle each ball would hit.
+            first = numpy.full(self.size, numpy.inf)
+            first_x = numpy.zeros(self.size, dtype=bool)
+            first_paddle = numpy.zeros(self.size, dtype=numpy.int64)
+
+            for paddle in range(2):
+                time, axis_x = sweep_arrays(self.ball_x, self.ball_y, dx, dy, paddle_x[paddle], self.paddle_y[:, paddle])
+                better = time < first
+                first = numpy.where(better, time, first)
+                first_x = numpy.where(better, axis_x, first_x)
+                first_paddle = numpy.where(better, paddle, first_paddle)
+
+            bouncing = bouncing & numpy.isfinite(first)
+            if not bouncing.any():
+                break
+
+            time = numpy.where(bouncing, first, 0.0)
+            left = numpy.take(paddle_x, first_paddle)
+            top = self.paddle_y[numpy.arange(self.size), first_paddle]
+
+            # Move the balls up to the paddles and bounce them off.
+            bounce_x = bouncing & first_x
+            bounce_y = bouncing & ~first_x
+
+            self.ball_y += numpy.where(bounce_x, numpy.round(dy * time).astype(numpy.int64), 0)
+            self.ball_x = numpy.where(bounce_x, numpy.where(self.ball_dx > 0, left - ball_size, left + paddle_width), self.ball_x)
+            self.ball_dx = numpy.where(bounce_x, -self.ball_dx, self.ball_dx)
+
+            self.ball_x += numpy.where(bounce_y, numpy.round(dx * time).astype(numpy.int64), 0)
+            self.ball_y = numpy.where(bounce_y, numpy.where(self.ball_dy > 0, top - ball_size, top + paddle_height), self.ball_y)
+            self.ball_dy = numpy.where(bounce_y, -self.ball_dy, self.ball_dy)
+
+            remaining = numpy.where(bouncing, remaining * (1 - time), remaining)
+            hits += bouncing
+        else:
+            # Still bouncing, stop the balls for the rest of the tick.
+            remaining = numpy.where(bouncing, 0.0, remaining)
+
+        # Move the balls for the rest of the tick.
+        self.ball_x += numpy.round(self.ball_dx * remaining).astype(numpy.int64)
+        self.ball_y += numpy.round(self.ball_dy * remaining).astype(numpy.int64)
+
+        # Check if balls have contacted the walls of the screen.
+        wall_x = playing & ((self.ball_x >= screen_width - ball_size) | (self.ball_x <= 0))
+        wall_y = playing & ((self.ball_y >= screen_height - ball_size) | (self.ball_y <= 0))
+        self.ball_dx = numpy.where(wall_x, -self.ball_dx, self.ball_dx)
+        self.ball_dy = numpy.where(wall_y, -self.ball_dy, self.ball_dy)
+
+        return hits
+
+    def step(self, directions):
+        """Move every match that is still playing on by one tick.
+
+        Arguments:
+        directions (numpy.ndarray) - direction to move each paddle in, one
+        row per match. -1 for up, 1 for down, 0 for not moving.
+        """
+        playing = ~self.over
+        self.ticks += playing
+
+        # Move the paddles, keeping them on the screen.
+        self.paddle_y += numpy.where(playing[:, None], directions, 0) * paddle_speed
+        numpy.clip(self.paddle_y, 0, screen_height - paddle_height, out=self.paddle_y)
+
+        # Move the balls, bouncing them off the paddles.
+        hits = self.move_balls(playing)
+
+        # Randomly change the balls vectors every third paddle hit.
+        for hit in range(int(hits.max(initial=0))):
+            hitting = hits > hit
+            speed_up = hitting & (self.paddle_hit_count % 3 == 0)
+            self.ball_dx += numpy.where(speed_up, numpy.where(self.ball_dx > 0, 1, -1) *
+                    self.rng.integers(0, 4, self.size), 0)
+            self.ball_dy += numpy.where(speed_up, numpy.where(self.ball_dy > 0, 1, -1) *
+                    self.rng.integers(0, 4, self.size), 0)
+            self.paddle_hit_count += hitting
+
+        # Check if balls have gone past the right side, scoring for paddle 1.
+        scored = playing & (self.ball_x >= screen_width - ball_size)
+        self.scores[:, 0] += scored
+        self.reset_sprites(scored)
+        self.ball_dx[scored] = self.random_speeds(int(scored.sum()), False, -1)
+        self.ball_dy[scored] = self.random_speeds(int(scored.sum()), True)
+
+        # Check if balls have gone past the left side, scoring for paddle 2.
+        scored = playing & (self.ball_x <= 0)
+        self.scores[:, 1] += scored
+        self.reset_sprites(scored)
+        self.ball_dx[scored] = self.random_speeds(int(scored.sum()), False, 1)
+        self.ball_dy[scored] = self.random_speeds(int(scored.sum()), True)
+
+
+def follow_ball(batch):
+    """Controller that moves every paddle towards its ball.
+
+    Arguments:
+    batch (BatchMatch) - matches being played.
+
+    Returns:
+    (numpy.ndarray) - direction to move each paddle in.
+    """
+    ball_centre = (batch.ball_y + ball_size // 2)[:, None]
+    paddle_centre = batch.paddle_y + paddle_height // 2
+
+    return (numpy.where(ball_centre < paddle_centre - paddle_speed, -1, 0) +
+            numpy.where(ball_centre > paddle_centre + paddle_speed, 1, 0))
+
+
+class BatchPredictor:
+    """Controller that moves every paddle to where its ball will reach it.
+
+    Works like controllers.Predictor, for every match at once.
+
+    Attributes:
+    reaction_delay (int) - ticks behind the balls the predictor sees them.
+    error (float) - standard deviation of how far off it aims, in pixels.
+    rng (numpy.random.Generator) - random number generator for the aim.
+    seen (numpy.ndarray) - ball positions and vectors from the last ticks,
+    used as a ring buffer.
+    ticks (int) - number of ticks seen.
+    offsets (numpy.ndarray) - how far off each paddle aims.
+    coming (numpy.ndarray) - flag for each paddle to check if its ball was
+    coming towards it.
+    """
+    def __init__(self, size, reaction_delay=ai_reaction_delay, error=ai_error, seed=None):
+        """Initialise the new predictor.
+
+        Arguments:
+        size (int) - number of matches.
+        reaction_delay (int) - ticks behind the balls the predictor sees them.
+        error (float) - standard deviation of how far off it aims.
+        seed (int) - seed for the aim, or None for a random one.
+        """
+        self.reaction_delay = reaction_delay
+        self.error = error
+        self.rng = numpy.random.default_rng(seed)
+        self.seen = numpy.zeros((reaction_delay + 1, 4, size), dtype=numpy.int64)
+        self.ticks = 0
+        self.offsets = numpy.zeros((size, 2))
+        self.coming = numpy.zeros((size, 2), dtype=bool)
+
+    def __call__(self, batch):
+        """Get the direction to move every paddle in.
+
+        Arguments:
+        batch (BatchMatch) - matches being played.
+
+        Returns:
+        (numpy.ndarray) - direction to move each paddle in.
+        """
+        # Remember the balls, and look at them as they were some ticks ago.
+        balls = (batch.ball_x, batch.ball_y, batch.ball_dx, batch.ball_dy)
+        if self.ticks == 0:
+            self.seen[:] = balls
+        self.seen[self.ticks % len(self.seen)] = balls
+        self.ticks += 1
+        x, y, dx, dy = self.seen[self.ticks % len(self.seen)]
+
+        # Find where the left of the balls will be when they touch the paddles.
+        faces = numpy.array((paddle_x[0] + paddle_width, paddle_x[1] - ball_size))
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            ticks = (faces - x[:, None]) / dx[:, None]
+        coming = (ticks >= 0) & (dx != 0)[:, None]
+
+        # Fold the straight line paths back between the walls.
+        span = screen_height - ball_size
+        target = (y[:, None] + dy[:, None] * numpy.where(coming, ticks, 0)) % (2 * span)
+        target = numpy.where(target > span, 2 * span - target, target) + ball_size / 2
+
+        # Pick a new aim each time a ball starts coming towards a paddle.
+        aiming = coming & ~self.coming
+        self.offsets = numpy.where(aiming, self.rng.normal(0, self.error, self.offsets.shape), self.offsets)
+        self.coming = coming
+
+        # Go back to the middle while the balls are moving away.
+        target = numpy.where(coming, target + self.offsets, screen_height / 2)
+        paddle_centre = batch.paddle_y + paddle_height // 2
+
+        return (numpy.where(target < paddle_centre - paddle_speed // 2, -1, 0) +
+                numpy.where(target > paddle_centre + paddle_speed // 2, 1, 0))
+
+
+def run_batch(batch, controller, max_ticks):
+    """Play every match until a player wins.
+
+    Arguments:
+    batch (BatchMatch) - matches to play.
+    controller (callable) - controller returning the direction of every
+    paddle.
+    max_ticks (int) - number of ticks to stop after.
+
+    Returns:
+    batch (BatchMatch) - the finished matches.
+    """
+    for tick in range(max_ticks):
+        if batch.over.all():
+            break
+
+        batch.step(controller(batch))
+
+    return batch
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Run many Pong matches at "
+            "once.")
+    parser.add_argument("-n", "--matches", type=int, default=1000)
+    parser.add_argument("-s", "--seed", type=int, default=None)
+    parser.add_argument("--max-ticks", type=int, default=100000,
+            help="ticks to stop after")
+    parser.add_argument("--controller", choices=("follow", "predict"),
+            default="follow")
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    controller = follow_ball
+    if arguments.controller == "predict":
+        controller = BatchPredictor(arguments.matches, seed=arguments.seed)
+
+    start = perf_counter()
+    batch = run_batch(BatchMatch(arguments.matches, arguments.seed),
+            controller, arguments.max_ticks)
+    elapsed = perf_counter() - start
+
+    ticks = int(batch.ticks.sum())
+    winners = batch.scores.argmax(axis=1)[batch.over]
+
+    print("{} matches, {} ticks in {:.2f}s, {:.0f} ticks per second.".format(
+        batch.size, ticks, elapsed, ticks / elapsed))
+    print("Player 1 won {}, player 2 won {}, {} unfinished.".format(
+        int((winners == 0).sum()), int((winners == 1).sum()),
+        int((~batch.over).sum())))
@@ -0,0 +1,290 @@
+"""Pong client.
+
+Plays a networked match against another client through a Pong server. The
+client moves its own paddle as soon as an input is made, instead of
+waiting for the server, and corrects it when the server's state arrives by
+replaying the inputs the server hasn't used yet. Run
+`python client.py --help` for options.
+"""
+
+import os
+
+# Don't print the PyGame banner.
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import asyncio
+from collections import deque
+
+
+from controllers import *
+from gui import *
+from match import *
+from protocol import *
+from settings import *
+
+
+class Client:
+    """Class for a client of a Pong server.
+
+    Attributes:
+    controller (callable) - controller for the client's paddle.
+    match (Match) - the client's copy of the match.
+    state (list) - last state of the match received from the server.
+    paddle (Paddle) - paddle the client controls.
+    sequence (int) - sequence number of the last input sent.
+    pending (collections.deque) - inputs the server hasn't used yet, as
+    sequence number, direction and time sent.
+    updated (bool) - flag to check if a state has arrived since the last
+    frame.
+    connected (bool) - flag to check if the client is connected.
+    corrections (int) - number of times the server's state moved the
+    client's paddle from where it predicted.
+    round_trips (list) - seconds between sending inputs and the server
+    using them.
+    received (int) - number of bytes of state received.
+    reader (asyncio.StreamReader) - stream to read states from, or None.
+    writer (asyncio.StreamWriter) - stream to write inputs to, or None.
+    """
+    def __init__(self, controller=keyboard):
+        """Initialise the new client.
+
+        Arguments:
+        controller (callable) - controller for the client's paddle.
+        """
+        self.controller = controller
+        self.match = Match()
+        self.state = match_state(self.match)
+        self.paddle = None
+        self.sequence = 0
+        self.pending = deque()
+        self.updated = False
+        self.connected = False
+        self.corrections = 0
+        self.round_trips = []
+        self.received = 0
+        self.reader = None
+        self.writer = None
+
+    async def connect(self, host, port):
+        """Connect to a server and wait for an opponent.
+
+        Arguments:
+        host (str) - address of the server.
+        port (int) - port of the server.
+
+        Returns:
+        (bool) - True if an opponent was found, False if the server couldn't
+        be reached or closed the connection first.
+        """
+        try:
+            self.reader, self.writer = await asyncio.open_connection(host, port)
+            self.connected = True
+
+            # Find out which paddle the client controls.
+            message_type, side = await read_message(self.reader, self.state)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # Server couldn't be reached or closed the connection.
+            if self.writer is not None:
+                self.writer.close()
+            self.connected = False
+            return False
+
+        if message_type != welcome_type:
+            raise ProtocolError("Expected a welcome message.")
+
+        self.paddle = self.match.paddles[side]
+
+        return True
+
+    async def receive(self):
+        """Receive states from the server until it disconnects."""
+        loop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                message_type, tick, ack, changed = await read_message(self.reader, self.state)
+                self.received += state_header.size + 2 * changed
+                self.reconcile(ack, loop.time())
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # Server has finished the match or gone.
+            pass
+        finally:
+            self.connected = False
+
+    def reconcile(self, ack, now):
+        """Move the match to the server's state, then replay the inputs
+        the server hasn't used yet.
+
+        Arguments:
+        ack (int) - sequence number of the last input the server used.
+        now (float) - time the state arrived.
+        """
+        predicted = self.paddle.rect.y
+        set_match_state(self.match, self.state)
+
+        # Forget the inputs the server has used.
+        while self.pending and self.pending[0][0] <= ack:
+            sequence, direction, sent = self.pending.popleft()
+            if sequence == ack:
+                self.round_trips.append(now - sent)
+
+        # Replay the rest on top of the server's state.
+        for sequence, direction, sent in self.pending:
+            self.paddle.move(direction)
+
+        if self.paddle.rect.y != predicted:
+            self.corrections += 1
+
+        self.updated = True
+
+    def send_input(self, now):
+        """Get the direction of the paddle, move it and send it.
+
+        Arguments:
+        now (float) - time the input is made.
+        """
+        direction = self.controller(self.match, self.paddle)
+
+        # Move the paddle straight away, without waiting for the server.
+        self.sequence += 1
+        self.pending.append((self.sequence, direction, now))
+        self.paddle.move(direction)
+
+        self.writer.write(input_message.pack(self.sequence, direction))
+
+    async def run(self, screen=None, max_frames=None):
+        """Play the match until it is over.
+
+        Arguments:
+        screen (pygame.Surface) - screen to draw to, or None to not draw.
+        max_frames (int) - number of frames to stop after, or None for no
+        limit.
+        """
+        receiver = asyncio.create_task(self.receive())
+        loop = asyncio.get_running_loop()
+        next_frame = loop.time()
+        frames = 0
+
+        if screen is not None:
+            # Create sprite group and textboxes.
+            sprites = pygame.sprite.Group(self.match.paddle_1, self.match.paddle_2, self.match.ball)
+            paddle_1_score = Text("", (screen_width // 2) - 20, screen_height // 2, font_colour=red)
+            paddle_2_score = Text("", (screen_width // 2) + 20, screen_height // 2, font_colour=blue)
+
+        try:
+            while self.connected and not self.match.over:
+                if max_frames is not None and frames >= max_frames:
+                    break
+
+                # Wait for the next frame.
+                next_frame += 1 / fps
+                await asyncio.sleep(max(0, next_frame - loop.time()))
+                frames += 1
+
+                # Keep the ball moving if no state has arrived in time.
+                if not self.updated:
+                    self.match.ball.update()
+                self.updated = False
+
+                if screen is not None:
+                    # Handle events.
+                    for event in pygame.event.get():
+                        if event.type == pygame.QUIT:
+                            return
+
+                self.send_input(loop.time())
+
+                if screen is not None:
+                    # Update the textboxes.
+                    paddle_1_score.update_text(str(self.match.paddle_1.score))
+                    paddle_2_score.update_text(str(self.match.paddle_2.score))
+
+                    # Draw the match to the screen.
+                    screen.fill(black)
+                    pygame.draw.line(screen, white, (screen_width // 2, 0), (screen_width // 2, screen_height), 5)
+                    paddle_1_score.draw(screen)
+                    paddle_2_score.draw(screen)
+                    sprites.draw(screen)
+                    pygame.display.flip()
+        finally:
+            self.writer.close()
+            receiver.cancel()
+
+
+async def play(host, port, controller, screen=None, max_frames=None):
+    """Connect to a server and play a match.
+
+    Arguments:
+    host (str) - address of the server.
+    port (int) - port of the server.
+    controller (callable) - controller for the client's paddle.
+    screen (pygame.Surface) - screen to draw to, or None to not draw.
+    max_frames (int) - number of frames to stop after, or None for no
+    limit.
+
+    Returns:
+    client (Client) - the client, after the match, or None if no opponent
+    was found.
+    """
+    client = Client(controller)
+    if not await client.connect(host, port):
+        return None
+
+    await client.run(screen, max_frames)
+
+    return client
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Play a networked match of "
+            "Pong.")
+    parser.add_argument("--host", default=server_host)
+    parser.add_argument("-p", "--port", type=int, default=server_port)
+    parser.add_argument("--bot", choices=("follow", "predict"),
+            help="play with a controller, without a window")
+    parser.add_argument("--frames", type=int, default=None,
+            help="frames to stop after")
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    if arguments.bot is None:
+        # Setup PyGame and play with the keyboard.
+        pygame.init()
+        screen = pygame.display.set_mode((screen_width, screen_height))
+        pygame.display.set_caption("Pong")
+        client = asyncio.run(play(arguments.host, arguments.port, keyboard,
+            screen, arguments.frames))
+        pygame.quit()
+    else:
+        controller = follow_ball if arguments.bot == "follow" else Predictor()
+        client = asyncio.run(play(arguments.host, arguments.port, controller,
+            None, arguments.frames))
+
+    if client is None:
+        raise SystemExit("No opponent found: couldn't reach the server or it "
+                "closed the connection.")
+
+    # Report how the match went.
+    round_trips = sorted(client.round_trips) or [0]
+    print("Final score {} - {} after {} inputs.".format(
+        client.match.paddle_1.score, client.match.paddle_2.score,
+        client.sequence))
+    print("{} corrections, {:.1f} bytes of state per input.".format(
+        client.corrections, client.received / max(1, client.sequence)))
+    print("Round trip: p50 {:.1f}ms, p99 {:.1f}ms.".format(
+        round_trips[len(round_trips) // 2] * 1000,
+        round_trips[min(len(round_trips) - 1, int(len(round_trips) * 0.99))] * 1000))
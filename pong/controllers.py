@@ -0,0 +1,166 @@
+"""Paddle controllers.
+
+A controller is anything that can be called with a match and one of its
+paddles, and returns the direction to move that paddle in: -1 for up, 1 for
+down, 0 for not moving.
+"""
+
+import random
+import weakref
+from collections import deque
+
+
+from settings import *
+
+
+def still(match, paddle):
+    """Controller that never moves the paddle.
+
+    Arguments:
+    match (Match) - match being played.
+    paddle (Paddle) - paddle being controlled.
+
+    Returns:
+    (int) - direction to move the paddle in.
+    """
+    return 0
+
+
+def keyboard(match, paddle):
+    """Controller that moves the paddle with its keys.
+
+    Arguments:
+    match (Match) - match being played.
+    paddle (Paddle) - paddle being controlled.
+
+    Returns:
+    (int) - direction to move the paddle in.
+    """
+    return paddle.get_direction()
+
+
+def follow_ball(match, paddle):
+    """Controller that moves the paddle towards the ball.
+
+    Arguments:
+    match (Match) - match being played.
+    paddle (Paddle) - paddle being controlled.
+
+    Returns:
+    (int) - direction to move the paddle in.
+    """
+    if match.ball.rect.centery < paddle.rect.centery - paddle_speed:
+        return -1
+    if match.ball.rect.centery > paddle.rect.centery + paddle_speed:
+        return 1
+    return 0
+
+
+def intercept_y(x, y, dx, dy, face_x, ball_size):
+    """Predict where the ball will be when it reaches a paddle.
+
+    Rather than stepping the ball along, its path is unfolded through the
+    top and bottom walls into a straight line, and folded back onto the
+    screen at the paddle.
+
+    Arguments:
+    x (int) - X position of the ball.
+    y (int) - Y position of the ball.
+    dx (int) - X vector of the ball.
+    dy (int) - Y vector of the ball.
+    face_x (int) - X position the left of the ball will be at when it
+    touches the paddle.
+    ball_size (int) - size of the ball.
+
+    Returns:
+    (float) - Y position of the centre of the ball at the paddle, or None if
+    the ball is moving away from it.
+    """
+    # Find how many ticks until the ball reaches the paddle.
+    if dx == 0:
+        return None
+
+    ticks = (face_x - x) / dx
+    if ticks < 0:
+        return None
+
+    # Fold the straight line path back between the walls.
+    span = screen_height - ball_size
+    y = (y + dy * ticks) % (2 * span)
+    if y > span:
+        y = 2 * span - y
+
+    return y + ball_size / 2
+
+
+class Predictor:
+    """Controller that moves the paddle to where the ball will reach it.
+
+    Only sees the ball as it was some ticks ago and aims a little off, so
+    it can be beaten. One predictor can control any number of paddles.
+
+    Attributes:
+    reaction_delay (int) - ticks behind the ball the predictor sees it.
+    error (float) - standard deviation of how far off it aims, in pixels.
+    rng (random.Random) - random number generator for the aim.
+    paddles (weakref.WeakKeyDictionary) - what the predictor has seen and
+    its aim, for each paddle.
+    """
+    def __init__(self, reaction_delay=ai_reaction_delay, error=ai_error, seed=None):
+        """Initialise the new predictor.
+
+        Arguments:
+        reaction_delay (int) - ticks behind the ball the predictor sees it.
+        error (float) - standard deviation of how far off it aims.
+        seed (int) - seed for the aim, or None for a random one.
+        """
+        self.reaction_delay = reaction_delay
+        self.error = error
+        self.rng = random.Random(seed)
+        self.paddles = weakref.WeakKeyDictionary()
+
+    def __call__(self, match, paddle):
+        """Get the direction to move the paddle in.
+
+        Arguments:
+        match (Match) - match being played.
+        paddle (Paddle) - paddle being controlled.
+
+        Returns:
+        (int) - direction to move the paddle in.
+        """
+        ball = match.ball
+
+        # Remember the ball, and look at it as it was some ticks ago.
+        if paddle not in self.paddles:
+            self.paddles[paddle] = {"seen": deque(maxlen=self.reaction_delay + 1),
+                    "offset": 0, "coming": False}
+        state = self.paddles[paddle]
+
+        state["seen"].append((ball.rect.x, ball.rect.y, ball.dx, ball.dy))
+        x, y, dx, dy = state["seen"][0]
+
+        # Find where the left of the ball will be when it touches the paddle.
+        if paddle.rect.centerx < screen_width // 2:
+            face_x = paddle.rect.right
+        else:
+            face_x = paddle.rect.left - ball.size
+
+        target = intercept_y(x, y, dx, dy, face_x, ball.size)
+
+        # Pick a new aim each time the ball starts coming towards the paddle.
+        if target is not None and not state["coming"]:
+            state["offset"] = self.rng.gauss(0, self.error)
+        state["coming"] = target is not None
+
+        # Go back to the middle while the ball is moving away.
+        if target is None:
+            target = screen_height / 2
+        else:
+            target += state["offset"]
+
+        if target < paddle.rect.centery - paddle_speed // 2:
+            return -1
+        if target > paddle.rect.centery + paddle_speed // 2:
+            return 1
+        return 0
@@ -0,0 +1,113 @@
+"""Run Pong matches without a display.
+
+Matches are moved on one fixed tick at a time, as fast as possible, with
+the paddles moved by controllers instead of the keyboard. Run
+`python headless.py --help` for options.
+"""
+
+import os
+
+# Don't open a window or print the PyGame banner.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+from time import perf_counter
+
+
+from controllers import *
+from match import *
+from replay import *
+
+
+controllers = {
+        "still": still,
+        "follow": follow_ball,
+        "predict": Predictor(seed=0)
+        }
+
+
+def run_match(match, controller_1, controller_2, max_ticks=None, recorder=None):
+    """Play a match until a player wins.
+
+    Arguments:
+    match (Match) - match to play.
+    controller_1 (callable) - controller for the left paddle.
+    controller_2 (callable) - controller for the right paddle.
+    max_ticks (int) - number of ticks to stop after, or None for no limit.
+    recorder (Recorder) - recorder to record the match with, or None.
+
+    Returns:
+    match (Match) - the finished match.
+    """
+    while not match.over:
+        if max_ticks is not None and match.ticks >= max_ticks:
+            break
+
+        direction_1 = controller_1(match, match.paddle_1)
+        direction_2 = controller_2(match, match.paddle_2)
+        match.step(direction_1, direction_2)
+
+        if recorder is not None:
+            recorder.record(direction_1, direction_2)
+
+    if recorder is not None:
+        recorder.close()
+
+    return match
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Run Pong matches without "
+            "a display.")
+    parser.add_argument("-n", "--matches", type=int, default=100)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("--player-1", choices=sorted(controllers),
+            default="follow")
+    parser.add_argument("--player-2", choices=sorted(controllers),
+            default="follow")
+    parser.add_argument("--max-ticks", type=int, default=1000000,
+            help="ticks to stop a match after")
+    parser.add_argument("--record", metavar="FOLDER",
+            help="folder to record replays of the matches to")
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    ticks = 0
+    wins = [0, 0]
+    start = perf_counter()
+
+    for i in range(arguments.matches):
+        match = Match(arguments.seed + i)
+
+        recorder = None
+        if arguments.record is not None:
+            recorder = record_match(match, arguments.record)
+
+        match = run_match(match, controllers[arguments.player_1],
+                controllers[arguments.player_2], arguments.max_ticks, recorder)
+
+        ticks += match.ticks
+        if match.paddle_1.score > match.paddle_2.score:
+            wins[0] += 1
+        elif match.paddle_2.score > match.paddle_1.score:
+            wins[1] += 1
+
+    elapsed = perf_counter() - start
+
+    print("{} matches, {} ticks in {:.2f}s, {:.0f} ticks per second.".format(
+        arguments.matches, ticks, elapsed, ticks / elapsed))
+    print("Player 1 won {}, player 2 won {}.".format(*wins))
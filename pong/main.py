@@ -1,10 +1,13 @@
 """Main program."""
 
 import pygame
-import random
 
 
+from controllers import *
 from gui import *
+from profiler import *
+from match import *
+from replay import *
 from settings import *
 from sprites import *
 
@@ -47,6 +50,10 @@ class States:
 
         Arguments:
         screen (pygame.Surface) - screen to draw to.
+
+        Returns:
+        rects (list) - areas of the screen that changed, or None if the
+        whole screen changed.
         """
         pass
 
@@ -66,7 +73,8 @@ class MainMenu(States):
 
         # Create navigation buttons.
         self.start_game = Button("Start Game", self.switch_to_game, screen_width // 2 - 75, 100, 150, 20)
-        self.exit_game = Button("Exit Game", self.exit, screen_width // 2 - 75, 150, 150, 20)
+        self.versus_computer = Button("Versus Computer", self.switch_to_computer_game, screen_width // 2 - 75, 150, 150, 20)
+        self.exit_game = Button("Exit Game", self.exit, screen_width // 2 - 75, 200, 150, 20)
    
     def handle_events(self, event):
         """Handle input and events for the main menu state.
@@ -76,12 +84,14 @@ class MainMenu(States):
         """
         # Check if buttons have been clicked.
         self.start_game.check_clicked(event)
+        self.versus_computer.check_clicked(event)
         self.exit_game.check_clicked(event)
 
     def update(self):
         """Update the main menu state."""
         # Check if buttons have been hovered over.
         self.start_game.check_hover()
+        self.versus_computer.check_hover()
         self.exit_game.check_hover()
 
     def draw(self, screen):
@@ -98,13 +108,22 @@ class MainMenu(States):
 
         # Draw the navigation buttons to the screen.
         self.start_game.draw(screen)
+        self.versus_computer.draw(screen)
         self.exit_game.draw(screen)
 
-        # Update the display.
-        pygame.display.flip()
-
     def switch_to_game(self):
         """Switch the current state to the game state."""
+        # Both paddles are moved by the keyboard.
+        States.share["controllers"] = (keyboard, keyboard)
+
+        self.next = "game"
+        self.running = False
+
+    def switch_to_computer_game(self):
+        """Switch the current state to the game state, against the computer."""
+        # The blue paddle is moved by the computer.
+        States.share["controllers"] = (keyboard, Predictor())
+
         self.next = "game"
         self.running = False
 
@@ -125,132 +144,119 @@ class Game(States):
         self.running = True
         self.next = "game over"
 
-        # Create paddle sprites.
-        self.paddle_1 = Paddle(30, pygame.K_w, pygame.K_s, red)
-        self.paddle_2 = Paddle(screen_width - 40, pygame.K_UP, pygame.K_DOWN, blue)
+        # Create a new match.
+        self.match = Match()
+
+        # Record the match, so it can be replayed.
+        self.recorder = None
+        if replay_folder is not None:
+            self.recorder = record_match(self.match, replay_folder)
+
+        # Get the paddle and ball sprites from the match.
+        self.paddle_1 = self.match.paddle_1
+        self.paddle_2 = self.match.paddle_2
+        self.ball = self.match.ball
+
+        # Get the controllers for the paddles.
+        self.controller_1, self.controller_2 = States.share.get("controllers", (keyboard, keyboard))
 
         # Create paddle score textboxes.
         self.paddle_1_score = Text(str(self.paddle_1.score), (screen_width // 2) - 20, screen_height // 2, font_colour=red)
         self.paddle_2_score = Text(str(self.paddle_1.score), (screen_width // 2) + 20, screen_height // 2, font_colour=blue)
 
-        # Create list to contain paddles.
-        self.paddles = [self.paddle_1, self.paddle_2]
-
-        # Create ball sprite.
-        self.ball = Ball()
-        self.ball.dx = random.choice((-5, -6, -7, 5, 6, 7))
-        self.ball.dy = random.choice((-5, -6, -7, 5, 6, 7))
-
-        # Create sprite group for all sprites.
-        self.sprites = pygame.sprite.Group()
+        # Create sprite group for all sprites, which tracks where they
+        # were drawn so only those areas need updating.
+        self.sprites = pygame.sprite.RenderUpdates()
         self.sprites.add(self.paddle_1)
         self.sprites.add(self.paddle_2)
         self.sprites.add(self.ball)
 
-        # Set flags and counters.
-        self.paddle_hit = False
-        self.paddle_hit_count = 0
+        # Draw the background on the first frame.
+        self.background = None
 
     def update(self):
         """Update the game state."""
-        # Update all the sprites.
-        self.sprites.update()
-
-        # Move ball around the screen.
-        for paddle in self.paddles:
-            # Check if ball has collided with either of the paddles.
-            if self.ball.rect.colliderect(paddle.rect):
-                self.paddle_hit = True
-                # Move the ball depending on the side of the paddle it collided with.
-                if abs(paddle.rect.left - self.ball.rect.right) < collision_tolerance and self.ball.dx > 0:
-                    self.ball.dx *= -1
-                if abs(paddle.rect.right - self.ball.rect.left) < collision_tolerance and self.ball.dx < 0:
-                    self.ball.dx *= -1
-                if abs(paddle.rect.top - self.ball.rect.bottom) < collision_tolerance and self.ball.dy > 0:
-                    self.ball.dy *= -1
-                if abs(paddle.rect.bottom - self.ball.rect.top) < collision_tolerance and self.ball.dy < 0:
-                    self.ball.dy *= -1
-
-            # Move the ball in the opposite direction and randomly change its vectors.
-            if not(self.ball.rect.colliderect(paddle.rect)) and self.paddle_hit:
-                if (self.paddle_hit_count % 3) == 0:
-                    if self.ball.dx > 0:
-                        self.ball.dx += random.randint(0, 3)
-                    else:
-                        self.ball.dx -= random.randint(0, 3)
-    
-                    if self.ball.dy > 0:
-                        self.ball.dy += random.randint(0, 3)
-                    else:
-                        self.ball.dy -= random.randint(0, 3)
-    
-                self.paddle_hit = False
-                self.paddle_hit_count += 1
-   
-        # Check if the ball has gone past the end of the screen on the right side.
-        if self.ball.rect.x >= screen_width - self.ball.size:
-            # Increase paddle 1s score.
-            self.paddle_1.score += 1
-            self.paddle_1_score.update_text(str(self.paddle_1.score))
+        # Move the match on, with the paddles moved by their controllers.
+        direction_1 = self.controller_1(self.match, self.paddle_1)
+        direction_2 = self.controller_2(self.match, self.paddle_2)
+        scorer = self.match.step(direction_1, direction_2)
 
-            # Reset sprites.
-            self.reset_sprites()
-            
-            # Change ball vectors.
-            self.ball.dx = random.choice((-5, -6, -7))
-            self.ball.dy = random.choice((-5, -6, -7, 5, 6, 7))
-    
-        # Check if the ball has gone past the end of the screen on the left side.
-        if self.ball.rect.x <= 0:
-            # Increase paddle 2s score.
-            self.paddle_2.score += 1
-            self.paddle_2_score.update_text(str(self.paddle_2.score))
-
-            # Reset sprites.
-            self.reset_sprites()
+        if self.recorder is not None:
+            self.recorder.record(direction_1, direction_2)
 
-            # Change ball vectors.
-            self.ball.dx = random.choice((5, 6, 7))
-            self.ball.dy = random.choice((-5, -6, -7, 5, 6, 7))
+        # Update the score textbox of the paddle that scored, and redraw
+        # the background with it.
+        if scorer is self.paddle_1:
+            self.paddle_1_score.update_text(str(self.paddle_1.score))
+            self.background = None
+        elif scorer is self.paddle_2:
+            self.paddle_2_score.update_text(str(self.paddle_2.score))
+            self.background = None
 
         # Check if a player has won.
-        if self.paddle_1.score >= 11 or self.paddle_2.score >= 11:
+        if self.match.over:
             # Store scores in the shared dictionary.
             States.share["paddle_1_score"] = self.paddle_1.score
             States.share["paddle_2_score"] = self.paddle_2.score
 
+            # Finish the recording.
+            if self.recorder is not None:
+                self.recorder.close()
+
             # Stop running the game state.
             self.running = False
 
     def draw(self, screen):
         """Draw the game state to the screen.
 
+        Only the areas the sprites were in and are now in are redrawn,
+        unless the background has changed.
+
         Arguments:
         screen (pygame.Surface) - screen to draw to.
+
+        Returns:
+        rects (list) - areas of the screen that changed, or None if the
+        whole screen changed.
         """
-        # Fill the screen with black.
-        screen.fill(black)
-    
-        # Draw a white line in the middle of the screen.
-        pygame.draw.line(screen, white, (screen_width // 2, 0), (screen_width // 2, screen_height), 5)
-        
-        # Draw the paddle score textboxes to the screen.
-        self.paddle_1_score.draw(screen)
-        self.paddle_2_score.draw(screen)
-    
+        redraw = self.background is None
+
+        # Cover the sprites with the background where they were, or draw
+        # the whole background if it has changed.
+        if redraw:
+            self.background = self.draw_background(screen)
+            screen.blit(self.background, (0, 0))
+        else:
+            self.sprites.clear(screen, self.background)
+
         # Draw the sprites to the screen.
-        self.sprites.draw(screen)
-    
-        # Update the display.
-        pygame.display.flip()
+        rects = self.sprites.draw(screen)
+
+        if redraw:
+            return None
+        return rects
 
-    def reset_sprites(self):
-        """Reset the paddle and ball sprites."""
-        # Reset the paddles and balls.
-        self.paddle_hit_count = 0
-        self.ball.reset()
-        for paddle in self.paddles:
-            paddle.reset()
+    def draw_background(self, screen):
+        """Draw everything that doesn't move to a new surface.
+
+        Arguments:
+        screen (pygame.Surface) - screen the background is for.
+
+        Returns:
+        background (pygame.Surface) - the background.
+        """
+        # Fill the background with black.
+        background = pygame.Surface(screen.get_size()).convert(screen)
+        background.fill(black)
+
+        # Draw a white line in the middle of the background.
+        pygame.draw.line(background, white, (screen_width // 2, 0), (screen_width // 2, screen_height), 5)
+
+        # Draw the paddle score textboxes to the background.
+        self.paddle_1_score.draw(background)
+        self.paddle_2_score.draw(background)
+
+        return background
 
 
 class GameOver(States):
@@ -314,9 +320,6 @@ class GameOver(States):
         self.main_menu.draw(screen)
         self.restart.draw(screen)
 
-        # Update the display.
-        pygame.display.flip()
-
     def switch_to_main_menu(self):
         """Switch the current state to the main menu state."""
         self.next = "main menu"
@@ -337,6 +340,7 @@ class Control:
     running (bool) - flag to check if program is running.
     state_dict (dict) - dictionary containing states and their names.
     current_state (str) - name of current state.
+    profiler (FrameProfiler) - profiler timing each frame.
     """
     def __init__(self):
         """Initialise the new control object."""
@@ -351,6 +355,9 @@ class Control:
         self.state_dict = None
         self.current_state = None
 
+        # Create profiler.
+        self.profiler = FrameProfiler()
+
     def setup(self, state_dict, start_state):
         """Setup the control object."""
         # Add state dictionary and start state to control object.
@@ -367,6 +374,9 @@ class Control:
             # Check if program has been closed.
             if event.type == pygame.QUIT:
                 self.running = False
+            # Check if the profiler overlay has been toggled.
+            elif event.type == pygame.KEYDOWN and pygame.key.name(event.key) == profiler_key:
+                self.profiler.toggle()
             # Pass event to current state.
             self.current_state.handle_events(event)
 
@@ -391,19 +401,38 @@ class Control:
         """Perform main loop."""
         while self.running:
             # Update clock.
+            self.profiler.begin_frame()
             self.clock.tick(fps)
+            self.profiler.lap("wait")
 
             # Handle events.
             self.handle_events()
+            self.profiler.lap("events")
 
             # Update the current state.
             self.current_state.update()
-
-            # Draw the current state to the screen.
-            self.current_state.draw(self.screen)
-
-            # Update the screen.
-            pygame.display.flip()
+            self.profiler.lap("update")
+
+            # Draw the current state to the screen, over the last overlay.
+            cleared = self.profiler.clear(self.screen)
+            rects = self.current_state.draw(self.screen)
+            self.profiler.lap("draw")
+
+            # Draw the profiler overlay to the screen.
+            overlay = self.profiler.draw(self.screen)
+            self.profiler.lap("overlay")
+
+            # Update the parts of the screen that changed.
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects + [rect for rect in (cleared, overlay) if rect])
+            self.profiler.lap("display")
+            self.profiler.end_frame()
+
+        # Write the frame times to a file.
+        if profile_file is not None:
+            self.profiler.dump(profile_file)
 
 
 # Main program.
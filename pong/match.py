@@ -0,0 +1,227 @@
+"""Rules of a Pong match, separate from the display and keyboard."""
+
+import random
+
+
+from physics import *
+from settings import *
+from sprites import *
+
+
+class Match:
+    """Class for a match of Pong.
+
+    Holds the paddles, the ball and the scores, and moves them on by one
+    fixed tick at a time. Doesn't need a display, so matches can be run as
+    fast as possible.
+
+    Attributes:
+    seed (int) - seed for the ball.
+    rng (random.Random) - random number generator for the ball.
+    paddle_1 (Paddle) - left paddle.
+    paddle_2 (Paddle) - right paddle.
+    paddles (list) - list of both paddles.
+    ball (Ball) - the ball.
+    paddle_hit_count (int) - number of paddle hits since the last point.
+    ticks (int) - number of ticks played.
+    """
+    def __init__(self, seed=None):
+        """Initialise the new match.
+
+        Arguments:
+        seed (int) - seed for the ball, or None for a random one.
+        """
+        # Pick a seed, so the match can be replayed.
+        if seed is None:
+            seed = random.getrandbits(64)
+
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # Create paddle sprites.
+        self.paddle_1 = Paddle(30, pygame.K_w, pygame.K_s, red)
+        self.paddle_2 = Paddle(screen_width - 40, pygame.K_UP, pygame.K_DOWN, blue)
+
+        # Create list to contain paddles.
+        self.paddles = [self.paddle_1, self.paddle_2]
+
+        # Create ball sprite.
+        self.ball = Ball()
+        self.ball.dx = self.rng.choice((-5, -6, -7, 5, 6, 7))
+        self.ball.dy = self.rng.choice((-5, -6, -7, 5, 6, 7))
+
+        # Set counters.
+        self.paddle_hit_count = 0
+        self.ticks = 0
+
+    @property
+    def over(self):
+        """Check if a player has won."""
+        return (self.paddle_1.score >= winning_score or
+                self.paddle_2.score >= winning_score)
+
+    def step(self, direction_1, direction_2):
+        """Move the match on by one tick.
+
+        Arguments:
+        direction_1 (int) - direction to move the left paddle in, -1 for up,
+        1 for down, 0 for not moving.
+        direction_2 (int) - direction to move the right paddle in.
+
+        Returns:
+        scorer (Paddle) - paddle that scored this tick, or None.
+        """
+        self.ticks += 1
+        scorer = None
+
+        # Move the paddles and the ball.
+        self.paddle_1.move(direction_1)
+        self.paddle_2.move(direction_2)
+        hits = self.move_ball()
+
+        # Randomly change the balls vectors every third paddle hit.
+        for hit in range(hits):
+            if (self.paddle_hit_count % 3) == 0:
+                if self.ball.dx > 0:
+                    self.ball.dx += self.rng.randint(0, 3)
+                else:
+                    self.ball.dx -= self.rng.randint(0, 3)
+
+                if self.ball.dy > 0:
+                    self.ball.dy += self.rng.randint(0, 3)
+                else:
+                    self.ball.dy -= self.rng.randint(0, 3)
+
+            self.paddle_hit_count += 1
+
+        # Check if the ball has gone past the end of the screen on the right side.
+        if self.ball.rect.x >= screen_width - self.ball.size:
+            # Increase paddle 1s score.
+            self.paddle_1.score += 1
+            scorer = self.paddle_1
+
+            # Reset sprites.
+            self.reset_sprites()
+
+            # Change ball vectors.
+            self.ball.dx = self.rng.choice((-5, -6, -7))
+            self.ball.dy = self.rng.choice((-5, -6, -7, 5, 6, 7))
+
+        # Check if the ball has gone past the end of the screen on the left side.
+        if self.ball.rect.x <= 0:
+            # Increase paddle 2s score.
+            self.paddle_2.score += 1
+            scorer = self.paddle_2
+
+            # Reset sprites.
+            self.reset_sprites()
+
+            # Change ball vectors.
+            self.ball.dx = self.rng.choice((5, 6, 7))
+            self.ball.dy = self.rng.choice((-5, -6, -7, 5, 6, 7))
+
+        return scorer
+
+    def move_ball(self):
+        """Move the ball for one tick, bouncing it off the paddles.
+
+        The ball is swept along its path, so it bounces off a paddle at the
+        exact point it touches it, however fast it is going.
+
+        Returns:
+        hits (int) - number of times the ball hit a paddle.
+        """
+        hits = 0
+        ball = self.ball.rect
+
+        # Push the ball out of any paddle that has moved into it.
+        for paddle in self.paddles:
+            if ball.colliderect(paddle.rect):
+                if ball.centery < paddle.rect.centery:
+                    ball.bottom = paddle.rect.top
+                    self.ball.dy = -abs(self.ball.dy)
+                else:
+                    ball.top = paddle.rect.bottom
+                    self.ball.dy = abs(self.ball.dy)
+                hits += 1
+
+        # Fraction of the tick the ball still has to move for.
+        remaining = 1.0
+
+        for bounce in range(max_bounces):
+            dx = self.ball.dx * remaining
+            dy = self.ball.dy * remaining
+
+            # Find the first paddle the ball would hit.
+            first = None
+            for paddle in self.paddles:
+                collision = sweep(ball, dx, dy, paddle.rect)
+                if collision and (first is None or collision[0] < first[0]):
+                    first = collision + (paddle,)
+
+            if first is None:
+                break
+
+            time, axis, paddle = first
+
+            # Move the ball up to the paddle and bounce it off.
+            if axis == "x":
+                ball.y += round(dy * time)
+                if self.ball.dx > 0:
+                    ball.right = paddle.rect.left
+                else:
+                    ball.left = paddle.rect.right
+                self.ball.dx *= -1
+            else:
+                ball.x += round(dx * time)
+                if self.ball.dy > 0:
+                    ball.bottom = paddle.rect.top
+                else:
+                    ball.top = paddle.rect.bottom
+                self.ball.dy *= -1
+
+            remaining *= 1 - time
+            hits += 1
+        else:
+            # Still bouncing, stop the ball for the rest of the tick.
+            remaining = 0
+
+        # Move the ball for the rest of the tick.
+        ball.x += round(self.ball.dx * remaining)
+        ball.y += round(self.ball.dy * remaining)
+
+        self.ball.check_walls()
+
+        return hits
+
+    def snapshot(self):
+        """Save the state of the match.
+
+        Returns:
+        (tuple) - state of the match, to pass to restore.
+        """
+        return (self.ticks, self.paddle_hit_count, self.rng.getstate(),
+                self.ball.rect.topleft, self.ball.dx, self.ball.dy,
+                tuple((paddle.rect.y, paddle.score) for paddle in self.paddles))
+
+    def restore(self, snapshot):
+        """Return the match to a saved state.
+
+        Arguments:
+        snapshot (tuple) - state of the match, from snapshot.
+        """
+        (self.ticks, self.paddle_hit_count, rng_state, self.ball.rect.topleft,
+                self.ball.dx, self.ball.dy, paddles) = snapshot
+        self.rng.setstate(rng_state)
+
+        for paddle, (y, score) in zip(self.paddles, paddles):
+            paddle.rect.y = y
+            paddle.score = score
+
+    def reset_sprites(self):
+        """Reset the paddle and ball sprites."""
+        # Reset the paddles and balls.
+        self.paddle_hit_count = 0
+        self.ball.reset()
+        for paddle in self.paddles:
+            paddle.reset()
@@ -0,0 +1,158 @@
+"""Network emulator for testing networked Pong.
+
+A TCP proxy that sits between clients and a server and delays everything
+passing through it by a latency plus some random jitter. Data is never
+reordered, as with a real TCP connection. Run `python netem.py --help` for
+options.
+"""
+
+import argparse
+import asyncio
+import random
+
+
+from settings import *
+
+
+class LatencyProxy:
+    """Class for a proxy that delays data passing through it.
+
+    Attributes:
+    target_host (str) - address of the server.
+    target_port (int) - port of the server.
+    latency (float) - seconds to delay data by, each way.
+    jitter (float) - most seconds to randomly add to or take from the
+    latency.
+    rng (random.Random) - random number generator for the jitter.
+    """
+    def __init__(self, target_host, target_port, latency, jitter, seed=None):
+        """Initialise the new proxy.
+
+        Arguments:
+        target_host (str) - address of the server.
+        target_port (int) - port of the server.
+        latency (float) - seconds to delay data by, each way.
+        jitter (float) - most seconds to randomly add to or take from the
+        latency.
+        seed (int) - seed for the jitter, or None for a random one.
+        """
+        self.target_host = target_host
+        self.target_port = target_port
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+
+    async def handle(self, reader, writer):
+        """Pass data between a client and the server.
+
+        Arguments:
+        reader (asyncio.StreamReader) - stream to read from the client.
+        writer (asyncio.StreamWriter) - stream to write to the client.
+        """
+        try:
+            target_reader, target_writer = await asyncio.open_connection(
+                    self.target_host, self.target_port)
+        except OSError:
+            writer.close()
+            return
+
+        await asyncio.gather(self.pipe(reader, target_writer),
+                self.pipe(target_reader, writer))
+
+    async def pipe(self, reader, writer):
+        """Pass data one way, delayed.
+
+        Arguments:
+        reader (asyncio.StreamReader) - stream to read from.
+        writer (asyncio.StreamWriter) - stream to write to.
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+
+        async def deliver():
+            """Write the data out once it is due."""
+            try:
+                while True:
+                    due, data = await queue.get()
+                    await asyncio.sleep(max(0, due - loop.time()))
+
+                    if data is None:
+                        break
+
+                    writer.write(data)
+                    await writer.drain()
+            except ConnectionError:
+                pass
+            finally:
+                writer.close()
+
+        delivery = asyncio.create_task(deliver())
+        due = loop.time()
+
+        try:
+            while True:
+                data = await reader.read(4096)
+
+                # Delay the data, but never deliver it before earlier data.
+                due = max(due, loop.time() + self.latency +
+                        self.rng.uniform(-self.jitter, self.jitter))
+
+                if not data:
+                    break
+
+                queue.put_nowait((due, data))
+        except ConnectionError:
+            pass
+        finally:
+            queue.put_nowait((due, None))
+            await delivery
+
+    async def serve(self, host, port):
+        """Accept clients until cancelled.
+
+        Arguments:
+        host (str) - address to listen on.
+        port (int) - port to listen on.
+        """
+        server = await asyncio.start_server(self.handle, host, port)
+
+        async with server:
+            await server.serve_forever()
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Delay traffic to a Pong "
+            "server.")
+    parser.add_argument("--host", default=server_host)
+    parser.add_argument("-p", "--port", type=int, default=server_port + 1,
+            help="port to listen on")
+    parser.add_argument("--target-host", default=server_host)
+    parser.add_argument("--target-port", type=int, default=server_port)
+    parser.add_argument("--latency", type=float, default=50,
+            help="milliseconds to delay data by, each way")
+    parser.add_argument("--jitter", type=float, default=10,
+            help="most milliseconds to randomly change the latency by")
+    parser.add_argument("-s", "--seed", type=int, default=None)
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    proxy = LatencyProxy(arguments.target_host, arguments.target_port,
+            arguments.latency / 1000, arguments.jitter / 1000, arguments.seed)
+
+    try:
+        asyncio.run(proxy.serve(arguments.host, arguments.port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,48 @@
+"""Swept collision detection for moving rectangles."""
+
+
+def sweep(rect, dx, dy, other):
+    """Find when a moving rectangle first hits a still one.
+
+    Arguments:
+    rect (pygame.Rect) - rectangle that is moving.
+    dx (float) - distance moved along X.
+    dy (float) - distance moved along Y.
+    other (pygame.Rect) - rectangle that is still.
+
+    Returns:
+    (tuple) - fraction of the move made before the rectangles touch, and
+    the axis they touch along ("x" or "y"), or None if they don't.
+    """
+    # Find when the rectangles start and stop overlapping along X.
+    if dx > 0:
+        x_entry = (other.left - rect.right) / dx
+        x_exit = (other.right - rect.left) / dx
+    elif dx < 0:
+        x_entry = (other.right - rect.left) / dx
+        x_exit = (other.left - rect.right) / dx
+    elif rect.right > other.left and rect.left < other.right:
+        x_entry, x_exit = float("-inf"), float("inf")
+    else:
+        return None
+
+    # Find when the rectangles start and stop overlapping along Y.
+    if dy > 0:
+        y_entry = (other.top - rect.bottom) / dy
+        y_exit = (other.bottom - rect.top) / dy
+    elif dy < 0:
+        y_entry = (other.bottom - rect.top) / dy
+        y_exit = (other.top - rect.bottom) / dy
+    elif rect.bottom > other.top and rect.top < other.bottom:
+        y_entry, y_exit = float("-inf"), float("inf")
+    else:
+        return None
+
+    # Rectangles touch once they overlap along both axes.
+    entry = max(x_entry, y_entry)
+    exit = min(x_exit, y_exit)
+
+    if entry >= exit or not(0 <= entry < 1):
+        return None
+
+    return entry, "x" if x_entry > y_entry else "y"
@@ -0,0 +1,115 @@
+"""Messages sent between the Pong server and its clients.
+
+Clients send one input message per frame, holding a sequence number and
+the direction of their paddle. The server sends a welcome message saying
+which paddle the client controls, then a state message each tick. State
+messages only hold the fields that changed since the last one sent to that
+client, which is safe as TCP delivers them all, in order.
+"""
+
+import struct
+
+
+# Message types.
+welcome_type = 0
+state_type = 1
+
+# Message layouts.
+welcome_message = struct.Struct("<BB")
+state_header = struct.Struct("<BIIB")
+input_message = struct.Struct("<Ib")
+
+# Fields of the state of a match, in the order of the bits of the mask.
+state_fields = ("ball_x", "ball_y", "ball_dx", "ball_dy", "paddle_1_y",
+        "paddle_2_y", "score_1", "score_2")
+
+
+class ProtocolError(Exception):
+    """Raised when a message can't be understood."""
+    pass
+
+
+def match_state(match):
+    """Get the state of a match to send to clients.
+
+    Arguments:
+    match (Match) - match to get the state of.
+
+    Returns:
+    (list) - value of each field in state_fields.
+    """
+    return [match.ball.rect.x, match.ball.rect.y, match.ball.dx,
+            match.ball.dy, match.paddle_1.rect.y, match.paddle_2.rect.y,
+            match.paddle_1.score, match.paddle_2.score]
+
+
+def set_match_state(match, state):
+    """Set the state of a match from one sent by the server.
+
+    Arguments:
+    match (Match) - match to set the state of.
+    state (list) - value of each field in state_fields.
+    """
+    (match.ball.rect.x, match.ball.rect.y, match.ball.dx, match.ball.dy,
+            match.paddle_1.rect.y, match.paddle_2.rect.y,
+            match.paddle_1.score, match.paddle_2.score) = state
+
+
+def encode_state(tick, ack, state, previous):
+    """Encode a state message holding only the fields that changed.
+
+    Arguments:
+    tick (int) - tick of the match.
+    ack (int) - sequence number of the last input used from the client.
+    state (list) - state of the match.
+    previous (list) - state last sent to the client, or None.
+
+    Returns:
+    (bytes) - the message.
+    """
+    mask = 0
+    values = []
+
+    # Set a bit in the mask for each field that changed.
+    for i, value in enumerate(state):
+        if previous is None or value != previous[i]:
+            mask |= 1 << i
+            values.append(value)
+
+    return (state_header.pack(state_type, tick, ack, mask) +
+            struct.pack("<{}h".format(len(values)), *values))
+
+
+async def read_message(reader, state):
+    """Read a message from the server.
+
+    Arguments:
+    reader (asyncio.StreamReader) - stream to read from.
+    state (list) - state of the match, updated by state messages.
+
+    Returns:
+    (tuple) - type of the message, followed by the side for welcome
+    messages, or the tick, the ack and the number of fields changed for
+    state messages.
+    """
+    message_type = (await reader.readexactly(1))[0]
+
+    if message_type == welcome_type:
+        data = await reader.readexactly(welcome_message.size - 1)
+        return welcome_message.unpack(bytes((message_type,)) + data)
+
+    if message_type != state_type:
+        raise ProtocolError("Unknown message type {}.".format(message_type))
+
+    data = await reader.readexactly(state_header.size - 1)
+    message_type, tick, ack, mask = state_header.unpack(bytes((message_type,)) + data)
+
+    # Read the fields set in the mask.
+    changed = [i for i in range(len(state_fields)) if mask & (1 << i)]
+    values = struct.unpack("<{}h".format(len(changed)),
+            await reader.readexactly(2 * len(changed)))
+
+    for i, value in zip(changed, values):
+        state[i] = value
+
+    return message_type, tick, ack, len(changed)
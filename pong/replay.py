@@ -0,0 +1,379 @@
+"""Record and replay Pong matches.
+
+A match only draws random numbers from its own seeded generator, so the
+seed and the paddle inputs of every tick are all that is needed to play it
+again exactly. Replay files hold a header with the seed, one byte of inputs
+per tick and, once recording stops, a footer with the result to
+check replays against. Run `python replay.py --help` for options.
+"""
+
+import argparse
+import os
+import struct
+import time
+
+
+from gui import *
+from match import *
+from settings import *
+
+
+# Replay file layout.
+replay_magic = b"PONG"
+replay_version = 1
+header = struct.Struct("<4sBQ")
+footer = struct.Struct("<IHHii")
+end_marker = 0xFF
+
+
+class ReplayError(Exception):
+    """Raised when a replay file can't be read."""
+    pass
+
+
+def pack_inputs(direction_1, direction_2):
+    """Pack the directions of both paddles into a byte.
+
+    Arguments:
+    direction_1 (int) - direction of the left paddle, -1, 0 or 1.
+    direction_2 (int) - direction of the right paddle.
+
+    Returns:
+    (int) - the packed byte.
+    """
+    return (direction_1 + 1) | (direction_2 + 1) << 2
+
+
+def unpack_inputs(byte):
+    """Unpack the directions of both paddles from a byte.
+
+    Arguments:
+    byte (int) - byte from pack_inputs.
+
+    Returns:
+    (tuple) - directions of the left and right paddles.
+    """
+    return (byte & 3) - 1, (byte >> 2) - 1
+
+
+def match_result(match):
+    """Get the result of a match, as stored in the footer of a replay.
+
+    Arguments:
+    match (Match) - match to get the result of.
+
+    Returns:
+    (tuple) - ticks played, score of each paddle and position of the ball.
+    """
+    return (match.ticks, match.paddle_1.score, match.paddle_2.score,
+            match.ball.rect.x, match.ball.rect.y)
+
+
+class Recorder:
+    """Class to record a match to a replay file as it is played.
+
+    Attributes:
+    match (Match) - match being recorded.
+    file (file) - binary file the replay is written to.
+    """
+    def __init__(self, match, file):
+        """Initialise the new recorder and write the header.
+
+        Arguments:
+        match (Match) - match to record, before it is started.
+        file (file) - binary file to write the replay to.
+        """
+        if not 0 <= match.seed < 2 ** 64:
+            raise ReplayError("Seed {} doesn't fit in a replay.".format(match.seed))
+
+        self.match = match
+        self.file = file
+        self.file.write(header.pack(replay_magic, replay_version, match.seed))
+
+    def record(self, direction_1, direction_2):
+        """Record the inputs of the tick just played.
+
+        Arguments:
+        direction_1 (int) - direction the left paddle was moved in.
+        direction_2 (int) - direction the right paddle was moved in.
+        """
+        self.file.write(bytes((pack_inputs(direction_1, direction_2),)))
+
+        # Write the replay out every second, in case the game crashes.
+        if self.match.ticks % fps == 0:
+            self.file.flush()
+
+    def close(self):
+        """Write the result of the match and close the file."""
+        self.file.write(bytes((end_marker,)))
+        self.file.write(footer.pack(*match_result(self.match)))
+        self.file.close()
+
+
+def record_match(match, folder=replay_folder):
+    """Start recording a match to a new file in a folder.
+
+    Arguments:
+    match (Match) - match to record, before it is started.
+    folder (str) - folder to write the replay to.
+
+    Returns:
+    (Recorder) - recorder for the match.
+    """
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, "{}-{:016x}.replay".format(
+        time.strftime("%Y%m%d-%H%M%S"), match.seed))
+
+    return Recorder(match, open(path, "wb"))
+
+
+class Replay:
+    """Class for a recorded match.
+
+    Attributes:
+    seed (int) - seed of the match.
+    inputs (bytes) - packed inputs of each tick.
+    result (tuple) - result of the match, or None if it didn't finish.
+    """
+    def __init__(self, seed, inputs, result=None):
+        """Initialise the new replay.
+
+        Arguments:
+        seed (int) - seed of the match.
+        inputs (bytes) - packed inputs of each tick.
+        result (tuple) - result of the match, or None if it didn't finish.
+        """
+        self.seed = seed
+        self.inputs = inputs
+        self.result = result
+
+    @classmethod
+    def load(cls, path):
+        """Load a replay from a file.
+
+        Arguments:
+        path (str) - path of the replay file.
+
+        Returns:
+        (Replay) - the loaded replay.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        # Check the header.
+        if len(data) < header.size:
+            raise ReplayError("{} is too short to be a replay.".format(path))
+
+        magic, version, seed = header.unpack_from(data)
+        if magic != replay_magic or version != replay_version:
+            raise ReplayError("{} isn't a version {} replay.".format(path, replay_version))
+
+        # Split the inputs from the footer, if the match finished.
+        body = data[header.size:]
+        end = body.find(bytes((end_marker,)))
+        if end == -1:
+            return cls(seed, body)
+
+        if len(body) - end - 1 != footer.size:
+            raise ReplayError("{} has a broken footer.".format(path))
+
+        return cls(seed, body[:end], footer.unpack_from(body, end + 1))
+
+    def __len__(self):
+        """Get the number of ticks in the replay."""
+        return len(self.inputs)
+
+
+class ReplayPlayer:
+    """Class to play a replay back, tick by tick.
+
+    Snapshots of the match are kept as it is played, so it can be seeked
+    back and forth without playing it from the start each time.
+
+    Attributes:
+    replay (Replay) - replay being played.
+    match (Match) - match being played again.
+    snapshot_interval (int) - ticks between snapshots.
+    snapshots (dict) - snapshots of the match, by tick.
+    """
+    def __init__(self, replay, snapshot_interval=replay_snapshot_interval):
+        """Initialise the new replay player.
+
+        Arguments:
+        replay (Replay) - replay to play.
+        snapshot_interval (int) - ticks between snapshots.
+        """
+        self.replay = replay
+        self.match = Match(replay.seed)
+        self.snapshot_interval = snapshot_interval
+        self.snapshots = {0: self.match.snapshot()}
+
+    @property
+    def finished(self):
+        """Check if every tick of the replay has been played."""
+        return self.match.ticks >= len(self.replay)
+
+    def step(self):
+        """Play the next tick of the replay.
+
+        Returns:
+        scorer (Paddle) - paddle that scored this tick, or None.
+        """
+        scorer = self.match.step(*unpack_inputs(self.replay.inputs[self.match.ticks]))
+
+        # Keep a snapshot every so often, for seeking.
+        if self.match.ticks % self.snapshot_interval == 0:
+            self.snapshots[self.match.ticks] = self.match.snapshot()
+
+        return scorer
+
+    def seek(self, tick):
+        """Move the match to a tick.
+
+        Arguments:
+        tick (int) - tick to move to, clamped to the length of the replay.
+        """
+        tick = max(0, min(tick, len(self.replay)))
+
+        # Restore the latest snapshot before the tick, unless the match is
+        # already closer to it.
+        nearest = max(ticks for ticks in self.snapshots if ticks <= tick)
+        if not nearest <= self.match.ticks <= tick:
+            self.match.restore(self.snapshots[nearest])
+
+        while self.match.ticks < tick:
+            self.step()
+
+    def verify(self):
+        """Play the whole replay and check it ends with the recorded result.
+
+        Returns:
+        (bool) - True if the results match, None if none was recorded.
+        """
+        self.seek(len(self.replay))
+
+        if self.replay.result is None:
+            return None
+
+        return match_result(self.match) == self.replay.result
+
+
+def watch(player, speed=1, start=0):
+    """Play a replay back in a window.
+
+    Left and right seek back and forward five seconds, up and down double
+    and halve the speed, and space pauses.
+
+    Arguments:
+    player (ReplayPlayer) - player for the replay to watch.
+    speed (int) - ticks to play each frame.
+    start (int) - tick to start from.
+    """
+    pygame.init()
+    screen = pygame.display.set_mode((screen_width, screen_height))
+    pygame.display.set_caption("Pong replay")
+    clock = pygame.time.Clock()
+
+    match = player.match
+    player.seek(start)
+
+    # Create sprite group and textboxes.
+    sprites = pygame.sprite.Group(match.paddle_1, match.paddle_2, match.ball)
+    paddle_1_score = Text("", (screen_width // 2) - 20, screen_height // 2, font_colour=red)
+    paddle_2_score = Text("", (screen_width // 2) + 20, screen_height // 2, font_colour=blue)
+    status = Text("", screen_width // 2, screen_height - 20, font_size=14)
+
+    running = True
+    paused = False
+
+    while running:
+        clock.tick(fps)
+
+        # Handle events.
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_LEFT:
+                    player.seek(match.ticks - fps * 5)
+                elif event.key == pygame.K_RIGHT:
+                    player.seek(match.ticks + fps * 5)
+                elif event.key == pygame.K_UP:
+                    speed *= 2
+                elif event.key == pygame.K_DOWN:
+                    speed = max(1, speed // 2)
+                elif event.key == pygame.K_SPACE:
+                    paused = not paused
+
+        # Play the next ticks.
+        if not paused:
+            for tick in range(speed):
+                if player.finished:
+                    break
+                player.step()
+
+        # Update the textboxes.
+        paddle_1_score.update_text(str(match.paddle_1.score))
+        paddle_2_score.update_text(str(match.paddle_2.score))
+        status.update_text("Tick {}/{}, {}x{}".format(match.ticks,
+            len(player.replay), speed, ", paused" if paused else ""))
+
+        # Draw the match to the screen.
+        screen.fill(black)
+        pygame.draw.line(screen, white, (screen_width // 2, 0), (screen_width // 2, screen_height), 5)
+        paddle_1_score.draw(screen)
+        paddle_2_score.draw(screen)
+        status.draw(screen)
+        sprites.draw(screen)
+        pygame.display.flip()
+
+    pygame.quit()
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Replay a recorded Pong "
+            "match.")
+    parser.add_argument("replay", help="replay file to play")
+    parser.add_argument("-w", "--watch", action="store_true",
+            help="watch the replay in a window instead of checking it")
+    parser.add_argument("--speed", type=int, default=1,
+            help="ticks to play each frame when watching")
+    parser.add_argument("--start", type=int, default=0,
+            help="tick to start watching from")
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    player = ReplayPlayer(Replay.load(arguments.replay))
+
+    if arguments.watch:
+        watch(player, max(1, arguments.speed), arguments.start)
+    else:
+        # Play the replay as fast as possible and check the result.
+        start = time.perf_counter()
+        verified = player.verify()
+        elapsed = time.perf_counter() - start
+
+        print("{} ticks in {:.2f}s, final score {} - {}.".format(
+            player.match.ticks, elapsed, player.match.paddle_1.score,
+            player.match.paddle_2.score))
+
+        if verified is None:
+            print("No result recorded, the match didn't finish.")
+        elif verified:
+            print("Result matches the recording.")
+        else:
+            print("Result doesn't match the recording: {}.".format(player.replay.result))
+            raise SystemExit(1)
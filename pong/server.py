@@ -0,0 +1,218 @@
+"""Pong server.
+
+Hosts networked matches over TCP using asyncio. Clients are paired up as
+they connect, and the server steps each match itself at a fixed tick rate
+from the inputs the clients send. Run `python server.py --help` for
+options.
+"""
+
+import os
+
+# Don't print the PyGame banner.
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import asyncio
+from collections import deque
+
+
+from match import *
+from protocol import *
+from settings import *
+
+
+class Player:
+    """Class for a client connected to the server.
+
+    Attributes:
+    reader (asyncio.StreamReader) - stream to read inputs from.
+    writer (asyncio.StreamWriter) - stream to write states to.
+    inputs (collections.deque) - inputs received but not used yet, as
+    sequence number and direction.
+    ack (int) - sequence number of the last input used.
+    direction (int) - direction of the last input used.
+    previous (list) - state last sent, or None.
+    connected (bool) - flag to check if the client is still connected.
+    """
+    def __init__(self, reader, writer):
+        """Initialise the new player.
+
+        Arguments:
+        reader (asyncio.StreamReader) - stream to read inputs from.
+        writer (asyncio.StreamWriter) - stream to write states to.
+        """
+        self.reader = reader
+        self.writer = writer
+        self.inputs = deque(maxlen=max_queued_inputs)
+        self.ack = 0
+        self.direction = 0
+        self.previous = None
+        self.connected = True
+
+    def next_direction(self):
+        """Use the next input, or repeat the last one if there isn't one.
+
+        Returns:
+        (int) - direction to move the paddle in.
+        """
+        if self.inputs:
+            self.ack, self.direction = self.inputs.popleft()
+
+        return self.direction
+
+    def send_state(self, tick, state):
+        """Send the changes to the state of the match.
+
+        Arguments:
+        tick (int) - tick of the match.
+        state (list) - state of the match.
+        """
+        self.writer.write(encode_state(tick, self.ack, state, self.previous))
+        self.previous = state
+
+
+class Server:
+    """Class for a server hosting matches of Pong.
+
+    Attributes:
+    timeout (float) - seconds a client can be idle before being dropped.
+    waiting (Player) - player waiting for an opponent, or None.
+    matches (int) - number of matches being played.
+    tasks (set) - tasks playing the matches, kept so they aren't garbage
+    collected while running.
+    """
+    def __init__(self, timeout):
+        """Initialise the new server.
+
+        Arguments:
+        timeout (float) - seconds a client can be idle before being
+        dropped.
+        """
+        self.timeout = timeout
+        self.waiting = None
+        self.matches = 0
+        self.tasks = set()
+
+    async def handle(self, reader, writer):
+        """Read the inputs of a connected client until it leaves.
+
+        Arguments:
+        reader (asyncio.StreamReader) - stream to read inputs from.
+        writer (asyncio.StreamWriter) - stream to write states to.
+        """
+        player = Player(reader, writer)
+
+        # Pair the client up, or wait for an opponent.
+        if self.waiting is None or not self.waiting.connected:
+            self.waiting = player
+        else:
+            task = asyncio.create_task(self.play(self.waiting, player))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+            self.waiting = None
+
+        try:
+            while player.connected:
+                # Drop the client if it is idle for too long, but not while
+                # it waits for an opponent, as it has nothing to send yet.
+                timeout = None if self.waiting is player else self.timeout
+                data = await asyncio.wait_for(
+                        reader.readexactly(input_message.size), timeout)
+                sequence, direction = input_message.unpack(data)
+
+                if sequence > player.ack and direction in (-1, 0, 1):
+                    player.inputs.append((sequence, direction))
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            # Connection was lost or client went idle.
+            pass
+        finally:
+            player.connected = False
+            writer.close()
+
+    async def play(self, player_1, player_2):
+        """Play a match between two clients.
+
+        Arguments:
+        player_1 (Player) - client controlling the left paddle.
+        player_2 (Player) - client controlling the right paddle.
+        """
+        self.matches += 1
+        players = (player_1, player_2)
+        match = Match()
+
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        try:
+            # Tell the clients which paddle they control, skipping any
+            # inputs they sent while waiting.
+            for side, player in enumerate(players):
+                if player.inputs:
+                    player.ack = player.inputs[-1][0]
+                    player.inputs.clear()
+
+                player.writer.write(welcome_message.pack(welcome_type, side))
+                player.send_state(match.ticks, match_state(match))
+
+            while not match.over and all(player.connected for player in players):
+                # Wait for the next tick.
+                next_tick += 1 / fps
+                await asyncio.sleep(max(0, next_tick - loop.time()))
+
+                # Move the match on with the inputs of both clients.
+                match.step(player_1.next_direction(), player_2.next_direction())
+
+                state = match_state(match)
+                for player in players:
+                    player.send_state(match.ticks, state)
+                    await player.writer.drain()
+        except ConnectionError:
+            # A client has left.
+            pass
+        finally:
+            self.matches -= 1
+            for player in players:
+                player.connected = False
+                player.writer.close()
+
+    async def serve(self, host, port):
+        """Accept clients until cancelled.
+
+        Arguments:
+        host (str) - address to listen on.
+        port (int) - port to listen on.
+        """
+        server = await asyncio.start_server(self.handle, host, port)
+
+        async with server:
+            await server.serve_forever()
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Host networked matches of "
+            "Pong.")
+    parser.add_argument("--host", default=server_host)
+    parser.add_argument("-p", "--port", type=int, default=server_port)
+    parser.add_argument("--timeout", type=float, default=10,
+            help="seconds a client can be idle before being dropped")
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    try:
+        asyncio.run(Server(arguments.timeout).serve(arguments.host,
+            arguments.port))
+    except KeyboardInterrupt:
+        pass
@@ -12,5 +12,37 @@ red = (255, 0, 0)
 green = (0, 255, 0)
 blue = (0, 0, 255)
 
-# Collision tolerance for ball and paddles.
-collision_tolerance = 10
+# Most times the ball can bounce off paddles in a single tick.
+max_bounces = 3
+
+# Paddle speed, in pixels per tick.
+paddle_speed = 10
+
+# Score needed to win a match.
+winning_score = 11
+
+# Folder to record replays of matches to, or None to not record them.
+replay_folder = "replays"
+
+# Ticks between snapshots of a match being replayed, for seeking.
+replay_snapshot_interval = 600
+
+# Computer paddle reaction delay, in ticks, and aiming error, in pixels.
+ai_reaction_delay = 6
+ai_error = 20
+
+# Address of the server for networked matches.
+server_host = "127.0.0.1"
+server_port = 8010
+
+# Most inputs the server holds for a client before dropping the oldest.
+max_queued_inputs = 6
+
+# Frame profiler settings: frames to keep times for, key to show the
+# overlay, and file to write the times to on exit (.json or .csv) or None.
+profiler_window = 600
+profiler_key = "f3"
+profile_file = None
+
+# Most rendered texts to keep in the text cache.
+text_cache_size = 256
@@ -40,6 +40,10 @@ class Ball(pygame.sprite.Sprite):
         self.rect.x += self.dx
         self.rect.y += self.dy
 
+        self.check_walls()
+
+    def check_walls(self):
+        """Bounce the ball off the walls of the screen."""
         # Check if ball has contacted the left or right walls of the screen.
         if self.rect.x >= screen_width - self.size or self.rect.x <= 0:
             self.dx *= -1
@@ -87,17 +91,31 @@ class Paddle(pygame.sprite.Sprite):
         """Reset the paddle to the center of the screen."""
         self.rect.y = int(screen_height / 2) - int(self.size[1] / 2)
 
-    def update(self):
-        """Update the paddles position."""
-        # Set vector and get pressed keys.
-        self.dy = 0
+    def get_direction(self):
+        """Get the direction the paddle's keys are moving it in.
+
+        Returns:
+        direction (int) - -1 for up, 1 for down, 0 for not moving.
+        """
+        direction = 0
         keystates = pygame.key.get_pressed()
 
-        # Check the pressed keys and change the vector.
+        # Check the pressed keys and change the direction.
         if keystates[self.up_key]:
-            self.dy = -10
+            direction = -1
         if keystates[self.down_key]:
-            self.dy = 10
+            direction = 1
+
+        return direction
+
+    def move(self, direction):
+        """Move the paddle.
+
+        Arguments:
+        direction (int) - -1 for up, 1 for down, 0 for not moving.
+        """
+        # Set vector from the direction.
+        self.dy = direction * paddle_speed
 
         # Move the paddle according to the vector.
         self.rect.y += self.dy
@@ -109,3 +127,7 @@ class Paddle(pygame.sprite.Sprite):
         # Check if the paddle has contacted the bottom of the screen.
         if self.rect.y <= 0:
             self.rect.y = 0
+
+    def update(self):
+        """Update the paddles position from the pressed keys."""
+        self.move(self.get_direction())
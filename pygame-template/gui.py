@@ -1,11 +1,94 @@
 """GUI elements for game."""
 
+from collections import OrderedDict
+
 import pygame
 
 
 from settings import *
 
 
+# Fonts shared between textboxes, by name and size.
+fonts = {}
+
+
+def get_font(name, size):
+    """Get a shared font, loading it the first time it is used.
+
+    Arguments:
+    name (str) - name of the font.
+    size (int) - size of the font.
+
+    Returns:
+    font (pygame.font.Font) - the font.
+    """
+    key = (name, size)
+    if key not in fonts:
+        fonts[key] = pygame.font.Font(name, size)
+
+    return fonts[key]
+
+
+class TextCache:
+    """Class for a cache of rendered text.
+
+    Keeps the most recently used surfaces, dropping the least recently used
+    once it is full.
+
+    Attributes:
+    size (int) - most surfaces to keep.
+    surfaces (collections.OrderedDict) - rendered surfaces, by font, text,
+    colour and antialiasing, least recently used first.
+    hits (int) - number of times a surface was found in the cache.
+    misses (int) - number of times text had to be rendered.
+    """
+    def __init__(self, size=text_cache_size):
+        """Initialise the new cache.
+
+        Arguments:
+        size (int) - most surfaces to keep.
+        """
+        self.size = size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, colour, antialias=True):
+        """Get text rendered in a font, rendering it if it isn't cached.
+
+        Arguments:
+        font (pygame.font.Font) - font to render with.
+        text (str) - text to render.
+        colour (tuple) - colour of the text.
+        antialias (bool) - flag to check if the text should be smoothed.
+
+        Returns:
+        (pygame.Surface) - the rendered text.
+        """
+        if not isinstance(colour, str):
+            colour = tuple(colour)
+        key = (font, text, colour, antialias)
+
+        # Use the cached surface, marking it as recently used.
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        # Render the text, dropping the least recently used surface if full.
+        self.misses += 1
+        surface = self.surfaces[key] = font.render(text, antialias, colour)
+        if len(self.surfaces) > self.size:
+            self.surfaces.popitem(last=False)
+
+        return surface
+
+
+# Cache shared by all textboxes.
+text_cache = TextCache()
+
+
 class Text:
     """Class for textboxes."""
     def __init__(self, text, x_pos, y_pos, font_name=pygame.font.get_default_font(), font_size=18, font_colour=white):
@@ -26,7 +109,7 @@ class Text:
         self.text = text
 
         # Set font and colour.
-        self.font = pygame.font.Font(font_name, font_size)
+        self.font = get_font(font_name, font_size)
         self.font_colour = font_colour
 
     def update_text(self, text):
@@ -44,7 +127,7 @@ class Text:
         surface (pygame.Surface) - surface to draw to.
         """
         # Draw text to surface.
-        rendered_text = self.font.render(self.text, True, self.font_colour)
+        rendered_text = text_cache.render(self.font, self.text, self.font_colour)
         location = rendered_text.get_rect(center=self.rect.center)
         surface.blit(rendered_text, location)
 
@@ -141,7 +224,7 @@ class Button(Text):
         surface.fill(colour, self.rect)
 
         # Draw text to surface.
-        rendered_text = self.font.render(self.text, True, font_colour)
+        rendered_text = text_cache.render(self.font, self.text, font_colour)
         location = rendered_text.get_rect(center=self.rect.center)
 
         surface.blit(rendered_text, location)
@@ -4,6 +4,7 @@ import pygame
 
 
 from gui import *
+from profiler import *
 from settings import *
 from sprites import *
 
@@ -59,6 +60,7 @@ class Control:
     running (bool) - flag to check if program is running.
     state_dict (dict) - dictionary containing states and their names.
     current_state (str) - name of current state.
+    profiler (FrameProfiler) - profiler timing each frame.
     """
     def __init__(self):
         """Initialise the new control object."""
@@ -73,6 +75,9 @@ class Control:
         self.state_dict = None
         self.current_state = None
 
+        # Create profiler.
+        self.profiler = FrameProfiler()
+
     def setup(self, state_dict, start_state):
         """Setup the control object."""
         # Add state dictionary and start state to control object.
@@ -89,6 +94,9 @@ class Control:
             # Check if program has been closed.
             if event.type == pygame.QUIT:
                 self.running = False
+            # Check if the profiler overlay has been toggled.
+            elif event.type == pygame.KEYDOWN and pygame.key.name(event.key) == profiler_key:
+                self.profiler.toggle()
             # Pass event to current state.
             self.current_state.handle_events(event)
 
@@ -113,19 +121,34 @@ class Control:
         """Perform main loop."""
         while self.running:
             # Update clock.
+            self.profiler.begin_frame()
             self.clock.tick(fps)
+            self.profiler.lap("wait")
 
             # Handle events.
             self.handle_events()
+            self.profiler.lap("events")
 
             # Update the current state.
             self.current_state.update()
+            self.profiler.lap("update")
 
             # Draw the current state to the screen.
             self.current_state.draw(self.screen)
+            self.profiler.lap("draw")
+
+            # Draw the profiler overlay to the screen.
+            self.profiler.draw(self.screen)
+            self.profiler.lap("overlay")
 
             # Update the screen.
             pygame.display.flip()
+            self.profiler.lap("display")
+            self.profiler.end_frame()
+
+        # Write the frame times to a file.
+        if profile_file is not None:
+            self.profiler.dump(profile_file)
 
 
 # Main program.
@@ -11,3 +11,12 @@ black = (0, 0, 0)
 red = (255, 0, 0)
 green = (0, 255, 0)
 blue = (0, 0, 255)
+
+# Frame profiler settings: frames to keep times for, key to show the
+# overlay, and file to write the times to on exit (.json or .csv) or None.
+profiler_window = 600
+profiler_key = "f3"
+profile_file = None
+
+# Most rendered texts to keep in the text cache.
+text_cache_size = 256
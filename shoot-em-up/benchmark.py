@@ -0,0 +1,145 @@
+"""Benchmark for finding collisions.
+
+Compares pygame.sprite.groupcollide with the spatial hash, for growing
+numbers of hostiles and bullets scattered over the screen. Run
+`python benchmark.py --help` for options.
+"""
+
+import os
+
+# Don't open a window or print the PyGame banner.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import random
+from time import perf_counter
+
+import pygame
+
+
+from settings import *
+from spatial import *
+from sprites import *
+
+
+def scatter(hostiles, bullets):
+    """Create sprites at random places on the screen.
+
+    Arguments:
+    hostiles (int) - number of hostiles to create.
+    bullets (int) - number of bullets to create.
+
+    Returns:
+    (tuple) - groups of hostiles and bullets, and the player.
+    """
+    hostile_group = pygame.sprite.Group()
+    for i in range(hostiles):
+        hostile = Hostile()
+        hostile.reset()
+        hostile.rect.y = random.randint(0, screen_height - hostile.height)
+        hostile_group.add(hostile)
+
+    bullet_group = pygame.sprite.Group()
+    for i in range(bullets):
+        bullet_group.add(Bullet(random.randint(0, screen_width), random.randint(20, screen_height)))
+
+    return hostile_group, bullet_group, Player()
+
+
+def with_groupcollide(hostiles, bullets, player):
+    """Find collisions by checking every pair of sprites.
+
+    Arguments:
+    hostiles (pygame.sprite.Group) - hostiles to check.
+    bullets (pygame.sprite.Group) - bullets to check.
+    player (Player) - player to check.
+
+    Returns:
+    (tuple) - collisions of the bullets and of the player.
+    """
+    return (pygame.sprite.groupcollide(bullets, hostiles, False, False),
+            pygame.sprite.spritecollide(player, hostiles, False))
+
+
+def with_spatial_hash(hostiles, bullets, player, grid):
+    """Find collisions with a spatial hash of the hostiles.
+
+    Arguments:
+    hostiles (pygame.sprite.Group) - hostiles to check.
+    bullets (pygame.sprite.Group) - bullets to check.
+    player (Player) - player to check.
+    grid (SpatialHash) - spatial hash to put the hostiles in.
+
+    Returns:
+    (tuple) - collisions of the bullets and of the player.
+    """
+    grid.rebuild(hostiles)
+
+    return (groupcollide(bullets, grid, False, False),
+            grid.collide(player, False))
+
+
+def time_ticks(function, ticks):
+    """Time how long a function takes to run.
+
+    Arguments:
+    function (function) - function to time.
+    ticks (int) - number of times to run it.
+
+    Returns:
+    (float) - average milliseconds per run.
+    """
+    start = perf_counter()
+    for i in range(ticks):
+        function()
+
+    return (perf_counter() - start) / ticks * 1000
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark finding "
+            "collisions.")
+    parser.add_argument("--hostiles", type=int, nargs="+",
+            default=[8, 50, 100, 200, 400, 800, 1600])
+    parser.add_argument("--bullets-per-hostile", type=float, default=0.5)
+    parser.add_argument("--ticks", type=int, default=50)
+    parser.add_argument("--cell-size", type=int, default=grid_cell_size)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+    random.seed(arguments.seed)
+    grid = SpatialHash(arguments.cell_size)
+
+    print("{:>8} {:>8} {:>14} {:>14} {:>8}".format("hostiles", "bullets",
+        "groupcollide", "spatial hash", "speedup"))
+
+    for count in arguments.hostiles:
+        hostiles, bullets, player = scatter(count, int(count * arguments.bullets_per_hostile))
+
+        # Check both find the same collisions.
+        expected = with_groupcollide(hostiles, bullets, player)
+        found = with_spatial_hash(hostiles, bullets, player, grid)
+        if ({bullet: set(hit) for bullet, hit in expected[0].items()} !=
+                {bullet: set(hit) for bullet, hit in found[0].items()} or
+                set(expected[1]) != set(found[1])):
+            raise SystemExit("Collisions differ for {} hostiles.".format(count))
+
+        brute_force = time_ticks(lambda: with_groupcollide(hostiles, bullets, player), arguments.ticks)
+        spatial_hash = time_ticks(lambda: with_spatial_hash(hostiles, bullets, player, grid), arguments.ticks)
+
+        print("{:>8} {:>8} {:>12.3f}ms {:>12.3f}ms {:>7.1f}x".format(count,
+            len(bullets), brute_force, spatial_hash, brute_force / spatial_hash))
@@ -0,0 +1,84 @@
+"""Player controllers.
+
+A controller is anything that can be called with a game and its player, and
+returns the direction to move the player in, -1 for left, 1 for right, 0 for
+not moving, and whether the player should shoot.
+"""
+
+from settings import *
+
+
+def still(game, player):
+    """Controller that never moves the player or shoots.
+
+    Arguments:
+    game (Game) - game being played.
+    player (Player) - player being controlled.
+
+    Returns:
+    (tuple) - direction to move the player in, and whether to shoot.
+    """
+    return 0, False
+
+
+def keyboard(game, player):
+    """Controller that moves the player with the arrow keys. Shooting is
+    left to the spacebar.
+
+    Arguments:
+    game (Game) - game being played.
+    player (Player) - player being controlled.
+
+    Returns:
+    (tuple) - direction to move the player in, and whether to shoot.
+    """
+    return player.get_direction(), False
+
+
+def sweep(game, player):
+    """Controller that moves the player from side to side across the
+    screen, shooting all the time.
+
+    Arguments:
+    game (Game) - game being played.
+    player (Player) - player being controlled.
+
+    Returns:
+    (tuple) - direction to move the player in, and whether to shoot.
+    """
+    # Turn around after long enough to cross the screen.
+    crossing = screen_width // 10
+    direction = 1 if (game.ticks // crossing) % 2 == 0 else -1
+
+    return direction, game.ticks % bot_fire_interval == 0
+
+
+def hunt(game, player):
+    """Controller that moves the player under the nearest hostile and
+    shoots at it.
+
+    Arguments:
+    game (Game) - game being played.
+    player (Player) - player being controlled.
+
+    Returns:
+    (tuple) - direction to move the player in, and whether to shoot.
+    """
+    target = game.nearest_hostile()
+    if target is None:
+        return 0, False
+
+    # Move towards the hostile until under it.
+    offset = target.centerx - player.rect.centerx
+    if offset < -5:
+        direction = -1
+    elif offset > 5:
+        direction = 1
+    else:
+        direction = 0
+
+    # Shoot if the hostile is above the player.
+    shoot = abs(offset) < target.width // 2 and game.ticks % bot_fire_interval == 0
+
+    return direction, shoot
+
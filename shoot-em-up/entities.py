@@ -0,0 +1,235 @@
+"""Entity stores for hostiles and bullets.
+
+Requires NumPy. Rather than one sprite object per hostile or bullet, a
+store keeps the positions, vectors, sizes and alive flags of all of them in
+arrays, and moves them all at once, so thousands can be kept on the go.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+from settings import *
+from sprites import get_surface
+
+
+class EntityStore:
+    """Class for a store of rectangular entities held in arrays.
+
+    Methods are meant to be overridden.
+
+    Attributes:
+    colour (tuple) - colour of the entities.
+    x (numpy.ndarray) - X position of each entity.
+    y (numpy.ndarray) - Y position of each entity.
+    dx (numpy.ndarray) - X vector of each entity.
+    dy (numpy.ndarray) - Y vector of each entity.
+    width (numpy.ndarray) - width of each entity.
+    height (numpy.ndarray) - height of each entity.
+    alive (numpy.ndarray) - flag for each slot to check if it holds a live
+    entity.
+    """
+    def __init__(self, colour, capacity=64):
+        """Initialise the new store.
+
+        Arguments:
+        colour (tuple) - colour of the entities.
+        capacity (int) - number of entities to make room for at first.
+        """
+        if numpy is None:
+            raise ImportError("EntityStore requires NumPy.")
+
+        self.colour = colour
+        self.x = numpy.zeros(capacity, dtype=numpy.int64)
+        self.y = numpy.zeros(capacity, dtype=numpy.int64)
+        self.dx = numpy.zeros(capacity, dtype=numpy.int64)
+        self.dy = numpy.zeros(capacity, dtype=numpy.int64)
+        self.width = numpy.zeros(capacity, dtype=numpy.int64)
+        self.height = numpy.zeros(capacity, dtype=numpy.int64)
+        self.alive = numpy.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        """Get the number of live entities."""
+        return int(self.alive.sum())
+
+    def add(self, x, y, width, height, dx, dy):
+        """Add an entity in a free slot, making more room if there isn't one.
+
+        Arguments:
+        x (int) - X position of the entity.
+        y (int) - Y position of the entity.
+        width (int) - width of the entity.
+        height (int) - height of the entity.
+        dx (int) - X vector of the entity.
+        dy (int) - Y vector of the entity.
+
+        Returns:
+        index (int) - slot of the entity.
+        """
+        free = numpy.flatnonzero(~self.alive)
+
+        # Double the size of every array if the store is full.
+        if len(free) == 0:
+            index = len(self.alive)
+            for name in ("x", "y", "dx", "dy", "width", "height", "alive"):
+                array = getattr(self, name)
+                setattr(self, name, numpy.concatenate((array, numpy.zeros_like(array))))
+        else:
+            index = free[0]
+
+        self.x[index], self.y[index] = x, y
+        self.width[index], self.height[index] = width, height
+        self.dx[index], self.dy[index] = dx, dy
+        self.alive[index] = True
+
+        return index
+
+    def colliding(self, rect):
+        """Find the live entities overlapping a rectangle.
+
+        Arguments:
+        rect (pygame.Rect) - rectangle to check.
+
+        Returns:
+        (numpy.ndarray) - slots of the entities overlapping it.
+        """
+        return numpy.flatnonzero(self.alive & (self.x < rect.right) & (self.x + self.width > rect.left) &
+                (self.y < rect.bottom) & (self.y + self.height > rect.top))
+
+    def nearest_above(self, top):
+        """Find the live entity lowest down the screen that is still above a
+        line.
+
+        Arguments:
+        top (int) - Y position of the line.
+
+        Returns:
+        (int) - slot of the entity, or None if there isn't one.
+        """
+        bottom = self.y + self.height
+        above = numpy.flatnonzero(self.alive & (bottom <= top))
+        if len(above) == 0:
+            return None
+
+        return int(above[bottom[above].argmax()])
+
+    def update(self):
+        """Move the entities on by one tick."""
+        pass
+
+    def draw(self, surface):
+        """Draw the live entities that are on the surface.
+
+        Arguments:
+        surface (pygame.Surface) - surface to draw to.
+        """
+        width, height = surface.get_size()
+        visible = numpy.flatnonzero(self.alive & (self.x < width) & (self.x + self.width > 0) &
+                (self.y < height) & (self.y + self.height > 0))
+
+        # Draw them all in a single call.
+        surface.blits([(get_surface((w, h), self.colour), (x, y))
+            for x, y, w, h in zip(self.x[visible].tolist(), self.y[visible].tolist(),
+                self.width[visible].tolist(), self.height[visible].tolist())], False)
+
+
+class HostileStore(EntityStore):
+    """Store of hostiles. Inherits from EntityStore.
+
+    Attributes:
+    rng (numpy.random.Generator) - random number generator for the
+    hostiles.
+    """
+    def __init__(self, seed=None):
+        """Initialise the new store.
+
+        Arguments:
+        seed (int) - seed for the hostiles, or None for a random one. A
+        numpy.random.Generator can be given instead, to keep using it.
+        """
+        EntityStore.__init__(self, red)
+        self.rng = numpy.random.default_rng(seed)
+
+    def spawn(self):
+        """Add a hostile of random size and vector, as sprites.Hostile does.
+
+        Returns:
+        index (int) - slot of the hostile.
+        """
+        width, height = self.rng.integers(4, 8, 2) * 5
+        dx, dy = self.rng.integers((-4, 2), (5, 11))
+
+        return self.add(0, 0, width, height, dx, dy)
+
+    def update(self):
+        """Move the hostiles, resetting those that have left the screen."""
+        self.x += self.dx
+        self.y += self.dy
+
+        # Reset hostiles beyond the boundaries of the screen to the top.
+        gone = numpy.flatnonzero(self.alive & ((self.y > screen_height) |
+            (self.x >= screen_width - self.width) | (self.x <= 0)))
+        self.x[gone] = self.rng.integers(0, screen_width - self.width[gone] + 1)
+        self.y[gone] = -self.height[gone]
+
+
+class BulletStore(EntityStore):
+    """Store of bullets. Inherits from EntityStore."""
+    def __init__(self):
+        """Initialise the new store."""
+        EntityStore.__init__(self, blue)
+
+    def shoot(self, x, y):
+        """Add a bullet, as sprites.Bullet does.
+
+        Arguments:
+        x (int) - X position of the middle of the bullet.
+        y (int) - Y position of the bottom of the bullet.
+
+        Returns:
+        index (int) - slot of the bullet.
+        """
+        return self.add(x - 5, y - 20, 10, 20, 0, -10)
+
+    def update(self):
+        """Move the bullets, removing those that have left the screen."""
+        self.y += self.dy
+        self.alive &= self.y - self.height >= 0
+
+
+def bullet_hits(bullets, hostiles):
+    """Find the bullets that hit hostiles, and kill both.
+
+    Each hostile is hit by the first bullet overlapping it, as with
+    pygame.sprite.groupcollide.
+
+    Arguments:
+    bullets (BulletStore) - bullets to check.
+    hostiles (HostileStore) - hostiles to check.
+
+    Returns:
+    (tuple) - slots of the bullets that hit a hostile, and the number of
+    hostiles hit.
+    """
+    shot = numpy.flatnonzero(bullets.alive)
+    targets = numpy.flatnonzero(hostiles.alive)
+    if len(shot) == 0 or len(targets) == 0:
+        return shot[:0], 0
+
+    # Check every live bullet against every live hostile at once.
+    x, y = bullets.x[shot, None], bullets.y[shot, None]
+    overlap = ((x < hostiles.x[targets] + hostiles.width[targets]) &
+            (x + bullets.width[shot, None] > hostiles.x[targets]) &
+            (y < hostiles.y[targets] + hostiles.height[targets]) &
+            (y + bullets.height[shot, None] > hostiles.y[targets]))
+
+    # Give each hostile hit to the first bullet overlapping it.
+    hit = overlap.any(axis=0)
+    hitters = numpy.unique(overlap[:, hit].argmax(axis=0))
+
+    hostiles.alive[targets[hit]] = False
+    bullets.alive[shot[hitters]] = False
+
+    return shot[hitters], int(hit.sum())
@@ -1,10 +1,16 @@
 """Main program."""
 
+import random
+
 import pygame
 
 
+from controllers import *
+from entities import *
 from gui import *
+from profiler import *
 from settings import *
+from spatial import *
 from sprites import *
 
 
@@ -65,7 +71,8 @@ class MainMenu(States):
 
         # Create navigation buttons.
         self.start_game = Button("Start", self.switch_to_game, screen_width // 2 - 75, 100, 150, 20)
-        self.exit_game = Button("Exit", self.exit, screen_width // 2 - 75, 150, 150, 20)
+        self.watch_bot = Button("Watch Bot", self.switch_to_bot, screen_width // 2 - 75, 150, 150, 20)
+        self.exit_game = Button("Exit", self.exit, screen_width // 2 - 75, 200, 150, 20)
 
     def handle_events(self, event):
         """Handle input and events for the main menu state.
@@ -75,12 +82,14 @@ class MainMenu(States):
         """
         # Check if buttons have been clicked.
         self.start_game.check_clicked(event)
+        self.watch_bot.check_clicked(event)
         self.exit_game.check_clicked(event)
 
     def update(self):
         """Update the main menu state."""
         # Check if buttons have been hovered over.
         self.start_game.check_hover()
+        self.watch_bot.check_hover()
         self.exit_game.check_hover()
 
     def draw(self, screen):
@@ -97,13 +106,19 @@ class MainMenu(States):
 
         # Draw the navigation buttons to the screen.
         self.start_game.draw(screen)
+        self.watch_bot.draw(screen)
         self.exit_game.draw(screen)
 
-        # Update the display.
-        pygame.display.flip()
-
     def switch_to_game(self):
         """Switch the current state to the game state."""
+        States.share["controller"] = keyboard
+        self.next = "game"
+        self.running = False
+
+    def switch_to_bot(self):
+        """Switch the current state to the game state, played by the
+        computer."""
+        States.share["controller"] = hunt
         self.next = "game"
         self.running = False
 
@@ -114,26 +129,68 @@ class MainMenu(States):
 
 
 class Game(States):
-    """Game state."""
-    def __init__(self):
-        """Initialise the game state."""
+    """Game state.
+
+    Attributes:
+    hostile_count (int) - number of hostiles at the start of the game.
+    spawn_interval (int) - ticks between extra hostiles being added, or 0
+    for none.
+    max_hostiles (int) - most hostiles there can be.
+    seed (int) - seed for the hostiles of the first game, or None for a
+    random one.
+    games (int) - number of games set up.
+    """
+    def __init__(self, hostile_count=hostile_count, spawn_interval=hostile_spawn_interval,
+            max_hostiles=max_hostiles, seed=None):
+        """Initialise the game state.
+
+        Arguments:
+        hostile_count (int) - number of hostiles at the start of the game.
+        spawn_interval (int) - ticks between extra hostiles being added, or
+        0 for none.
+        max_hostiles (int) - most hostiles there can be.
+        seed (int) - seed for the hostiles of the first game, or None for a
+        random one.
+        """
         States.__init__(self)
 
+        self.hostile_count = hostile_count
+        self.spawn_interval = spawn_interval
+        self.max_hostiles = max_hostiles
+        self.seed = seed
+        self.games = 0
+
     def setup(self):
         """Setup the main menu state."""
         self.running = True
         self.next = "game over"
 
+        # Seed the hostiles before the first game only, so later games
+        # carry on from it rather than repeating it.
+        if self.seed is not None and self.games == 0:
+            random.seed(self.seed)
+        self.games += 1
+
+        # Get the controller for the player, and count ticks and
+        # collisions.
+        self.controller = States.share.get("controller", keyboard)
+        self.ticks = 0
+        self.hostiles_shot = 0
+        self.hostiles_crashed = 0
+
         # Create the main sprite groups.
         self.sprites = pygame.sprite.Group()
         self.hostiles = pygame.sprite.Group()
         self.bullets = pygame.sprite.Group()
 
+        # Create the spatial hash for finding collisions with hostiles.
+        self.grid = SpatialHash()
+
         # Create the player and hostiles.
         self.player = Player()
         self.sprites.add(self.player)
 
-        for i in range(8):
+        for i in range(self.hostile_count):
             self.new_hostile()
 
         # Create textboxes for showing health and score.
@@ -148,17 +205,22 @@ class Game(States):
         """
         # Check if spacebar has been pressed.
         if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-            bullet = self.player.shoot()
-            self.sprites.add(bullet)
-            self.bullets.add(bullet)
+            self.shoot()
 
     def update(self):
         """Update the game state."""
+        # Move the player and shoot as the controller says.
+        self.update_controls()
+
         # Update the sprites positions.
         self.sprites.update()
 
+        # Put the hostiles in the spatial hash where they have moved to.
+        self.grid.rebuild(self.hostiles)
+
         # Check to see if a bullet hit a hostile.
-        collisions = pygame.sprite.groupcollide(self.bullets, self.hostiles, True, True)
+        collisions = groupcollide(self.bullets, self.grid, True, True)
+        self.hostiles_shot += sum(len(hit) for hit in collisions.values())
         for collision in collisions:
             # Increase player score.
             self.player.score += collision.width
@@ -170,7 +232,8 @@ class Game(States):
             self.new_hostile()
 
         # Check to see if a hostile hit the player.
-        collisions = pygame.sprite.spritecollide(self.player, self.hostiles, True)
+        collisions = self.grid.collide(self.player, True)
+        self.hostiles_crashed += len(collisions)
         for collision in collisions:
             # Decrease player health.
             self.player.health -= collision.width
@@ -205,14 +268,167 @@ class Game(States):
         self.player_score.draw(screen)
         self.player_health.draw(screen)
 
-        # Update the display.
-        pygame.display.flip()
+    def update_controls(self):
+        """Move the player and shoot as the controller says, and add
+        hostiles every so often."""
+        self.ticks += 1
+
+        # Get the direction to move in and whether to shoot.
+        self.player.direction, shoot = self.controller(self, self.player)
+        if shoot:
+            self.shoot()
+
+        # Add a hostile, if it is time to and there is room.
+        if (self.spawn_interval and self.ticks % self.spawn_interval == 0 and
+                len(self.hostiles) < self.max_hostiles):
+            self.new_hostile()
+
+    def shoot(self):
+        """Shoot a bullet from the player and add it to the relevant
+        groups."""
+        bullet = self.player.shoot()
+        self.sprites.add(bullet)
+        self.bullets.add(bullet)
+
+    def nearest_hostile(self):
+        """Find the hostile lowest down the screen that is still above the
+        player.
+
+        Returns:
+        (pygame.Rect) - rectangle of the hostile, or None if there isn't
+        one.
+        """
+        above = [hostile.rect for hostile in self.hostiles
+                if hostile.rect.bottom <= self.player.rect.top]
+
+        return max(above, key=lambda rect: rect.bottom, default=None)
 
     def new_hostile(self):
         """Create a new hostile and add it to the relevant groups."""
-        hostile = Hostile()
+        hostile = hostile_pool.get()
         self.sprites.add(hostile)
         self.hostiles.add(hostile)
+        self.grid.insert(hostile)
+
+
+class ArrayGame(Game):
+    """Game state with the hostiles and bullets held in entity stores.
+
+    Plays like the game state, but moves, checks and draws every hostile
+    and bullet at once with NumPy. Inherits from Game.
+    """
+    def setup(self):
+        """Setup the game state."""
+        self.running = True
+        self.next = "game over"
+
+        # Get the controller for the player, and count ticks and
+        # collisions.
+        self.controller = States.share.get("controller", keyboard)
+        self.ticks = 0
+        self.hostiles_shot = 0
+        self.hostiles_crashed = 0
+
+        # Create the player and the entity stores.
+        self.player = Player()
+        self.sprites = pygame.sprite.Group(self.player)
+        # Seed the hostiles before the first game only, and carry on with
+        # the same generator after it.
+        self.hostiles = HostileStore(self.seed if self.games == 0 else self.hostiles.rng)
+        self.games += 1
+        self.bullets = BulletStore()
+
+        for i in range(self.hostile_count):
+            self.new_hostile()
+
+        # Create textboxes for showing health and score.
+        self.player_score = Text("Score: " + str(self.player.score), 60, 20)
+        self.player_health = Text("Health: " + str(self.player.health), screen_width - 60, 20)
+
+    def update(self):
+        """Update the game state."""
+        # Move the player and shoot as the controller says.
+        self.update_controls()
+
+        # Update the positions of the player, hostiles and bullets.
+        self.player.update()
+        self.hostiles.update()
+        self.bullets.update()
+
+        # Check to see if bullets hit hostiles.
+        hits, shot = bullet_hits(self.bullets, self.hostiles)
+        self.hostiles_shot += shot
+        if len(hits):
+            # Increase player score and update score textbox.
+            self.player.score += int(self.bullets.width[hits].sum())
+            self.player_score.update_text("Score: " + str(self.player.score))
+
+            # Create new hostiles.
+            for i in range(len(hits)):
+                self.new_hostile()
+
+        # Check to see if hostiles hit the player.
+        hits = self.hostiles.colliding(self.player.rect)
+        self.hostiles_crashed += len(hits)
+        if len(hits):
+            # Decrease player health and update health textbox.
+            self.hostiles.alive[hits] = False
+            self.player.health -= int(self.hostiles.width[hits].sum())
+            self.player_health.update_text("Health: " + str(self.player.health))
+
+            # Create new hostiles.
+            for i in range(len(hits)):
+                self.new_hostile()
+
+        # Check if player is still alive.
+        if self.player.health <= 0:
+            # Put player score in the states shared dictionary.
+            States.share["player score"] = self.player.score
+
+            # Stop the game state.
+            self.running = False
+
+    def draw(self, screen):
+        """Draw the game state to the screen.
+
+        Arguments:
+        screen (pygame.Surface) - screen to draw to.
+        """
+        # Fill the screen with black.
+        screen.fill(black)
+
+        # Draw the hostiles, bullets and player to the screen.
+        self.hostiles.draw(screen)
+        self.bullets.draw(screen)
+        self.sprites.draw(screen)
+
+        # Draw the textboxes to the screen.
+        self.player_score.draw(screen)
+        self.player_health.draw(screen)
+
+    def shoot(self):
+        """Shoot a bullet from the player into the bullet store."""
+        self.bullets.shoot(self.player.rect.x + (self.player.width // 2), self.player.rect.y)
+
+    def nearest_hostile(self):
+        """Find the hostile lowest down the screen that is still above the
+        player.
+
+        Returns:
+        (pygame.Rect) - rectangle of the hostile, or None if there isn't
+        one.
+        """
+        hostiles = self.hostiles
+        i = hostiles.nearest_above(self.player.rect.top)
+        if i is None:
+            return None
+
+        return pygame.Rect(int(hostiles.x[i]), int(hostiles.y[i]),
+                int(hostiles.width[i]), int(hostiles.height[i]))
+
+    def new_hostile(self):
+        """Create a new hostile in the hostile store."""
+        self.hostiles.spawn()
 
 
 class GameOver(States):
@@ -268,9 +484,6 @@ class GameOver(States):
         self.main_menu.draw(screen)
         self.restart.draw(screen)
 
-        # Update the display.
-        pygame.display.flip()
-
     def switch_to_main_menu(self):
         """Switch the current state to the main menu state."""
         self.next = "main menu"
@@ -291,6 +504,7 @@ class Control:
     running (bool) - flag to check if program is running.
     state_dict (dict) - dictionary containing states and their names.
     current_state (str) - name of current state.
+    profiler (FrameProfiler) - profiler timing each frame.
     """
     def __init__(self):
         """Initialise the new control object."""
@@ -305,6 +519,9 @@ class Control:
         self.state_dict = None
         self.current_state = None
 
+        # Create profiler.
+        self.profiler = FrameProfiler()
+
     def setup(self, state_dict, start_state):
         """Setup the control object."""
         # Add state dictionary and start state to control object.
@@ -321,6 +538,9 @@ class Control:
             # Check if program has been closed.
             if event.type == pygame.QUIT:
                 self.running = False
+            # Check if the profiler overlay has been toggled.
+            elif event.type == pygame.KEYDOWN and pygame.key.name(event.key) == profiler_key:
+                self.profiler.toggle()
             # Pass event to current state.
             self.current_state.handle_events(event)
 
@@ -345,19 +565,34 @@ class Control:
         """Perform main loop."""
         while self.running:
             # Update clock.
+            self.profiler.begin_frame()
             self.clock.tick(fps)
+            self.profiler.lap("wait")
 
             # Handle events.
             self.handle_events()
+            self.profiler.lap("events")
 
             # Update the current state.
             self.current_state.update()
+            self.profiler.lap("update")
 
             # Draw the current state to the screen.
             self.current_state.draw(self.screen)
+            self.profiler.lap("draw")
+
+            # Draw the profiler overlay to the screen.
+            self.profiler.draw(self.screen)
+            self.profiler.lap("overlay")
 
             # Update the screen.
             pygame.display.flip()
+            self.profiler.lap("display")
+            self.profiler.end_frame()
+
+        # Write the frame times to a file.
+        if profile_file is not None:
+            self.profiler.dump(profile_file)
 
 
 # Main program.
@@ -368,7 +603,7 @@ if __name__ == "__main__":
     # Create state dictionary.
     state_dict = {
             "main menu": MainMenu(),
-            "game": Game(),
+            "game": ArrayGame() if entity_store else Game(),
             "game over": GameOver(),
             }
 
@@ -0,0 +1,182 @@
+"""Frame time profiler."""
+
+import csv
+import json
+from collections import deque
+from time import perf_counter
+
+import pygame
+
+
+from settings import *
+
+
+class FrameProfiler:
+    """Class to time each part of every frame.
+
+    Keeps the times of the last frames, to work out rolling percentiles,
+    and can draw them over the screen.
+
+    Attributes:
+    sections (tuple) - names of the parts of a frame, in order.
+    times (dict) - deque of the seconds taken by each section over the
+    last frames, plus the whole frame under "frame", not counting "wait".
+    frames (int) - number of frames timed.
+    visible (bool) - flag to check if the overlay is shown.
+    font (pygame.font.Font) - font for the overlay, or None until it is
+    first shown.
+    box (pygame.Surface) - rendered overlay, or None.
+    under (tuple) - copy of the screen under the overlay and where it was
+    taken from, or None.
+    """
+    sections = ("wait", "events", "update", "draw", "overlay", "display")
+
+    def __init__(self, window=profiler_window):
+        """Initialise the new profiler.
+
+        Arguments:
+        window (int) - number of frames to keep times for.
+        """
+        self.times = {section: deque(maxlen=window) for section in self.sections + ("frame",)}
+        self.frames = 0
+        self.visible = False
+        self.font = None
+        self.box = None
+        self.under = None
+
+        self.frame_start = self.lap_start = perf_counter()
+
+    def begin_frame(self):
+        """Start timing a frame."""
+        self.frame_start = self.lap_start = perf_counter()
+
+    def lap(self, section):
+        """Record the time taken by a section of the frame.
+
+        Arguments:
+        section (str) - name of the section that just finished.
+        """
+        now = perf_counter()
+        self.times[section].append(now - self.lap_start)
+        self.lap_start = now
+
+    def end_frame(self):
+        """Finish timing a frame."""
+        self.times["frame"].append(self.lap_start - self.frame_start - self.times["wait"][-1])
+        self.frames += 1
+
+    def percentiles(self, section):
+        """Get the percentiles of the time taken by a section.
+
+        Arguments:
+        section (str) - name of the section.
+
+        Returns:
+        (dict) - 50th, 95th and 99th percentiles, in milliseconds.
+        """
+        times = sorted(self.times[section])
+        if not times:
+            return {"p50": 0, "p95": 0, "p99": 0}
+
+        return {name: times[min(len(times) - 1, int(len(times) * fraction))] * 1000
+                for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))}
+
+    def summary(self):
+        """Get the percentiles of every section.
+
+        Returns:
+        (dict) - percentiles of each section, by name.
+        """
+        return {section: self.percentiles(section) for section in self.times}
+
+    def toggle(self):
+        """Show or hide the overlay."""
+        self.visible = not self.visible
+        self.box = None
+
+    def clear(self, screen):
+        """Put back what was on the screen under the overlay.
+
+        Arguments:
+        screen (pygame.Surface) - screen the overlay was drawn to.
+
+        Returns:
+        rect (pygame.Rect) - area of the screen put back, or None.
+        """
+        if self.under is None:
+            return None
+
+        surface, rect = self.under
+        screen.blit(surface, rect)
+        self.under = None
+
+        return rect
+
+    def draw(self, screen):
+        """Draw the overlay to the screen, if it is shown.
+
+        Arguments:
+        screen (pygame.Surface) - screen to draw to.
+
+        Returns:
+        rect (pygame.Rect) - area of the screen drawn to, or None.
+        """
+        if not self.visible:
+            return None
+
+        # Render the overlay again a few times a second.
+        if self.box is None or self.frames % (fps // 4) == 0:
+            self.box = self.render()
+
+        # Keep what is under the overlay, so it can be put back.
+        rect = self.box.get_rect(topleft=(5, 5)).clip(screen.get_rect())
+        self.under = (screen.subsurface(rect).copy(), rect)
+        screen.blit(self.box, rect)
+
+        return rect
+
+    def render(self):
+        """Render the percentiles of every section onto a translucent box.
+
+        Returns:
+        box (pygame.Surface) - the rendered overlay.
+        """
+        if self.font is None:
+            self.font = pygame.font.Font(pygame.font.get_default_font(), 12)
+
+        rendered = [self.font.render("{:8} p50 {:6.2f}  p95 {:6.2f}  p99 {:6.2f} ms".format(
+            section, *self.percentiles(section).values()), True, white) for section in self.times]
+
+        # Fill the box with translucent black.
+        width = max(line.get_width() for line in rendered) + 10
+        height = sum(line.get_height() for line in rendered) + 10
+        box = pygame.Surface((width, height), pygame.SRCALPHA)
+        box.fill((0, 0, 0, 192))
+
+        # Draw the lines to the box.
+        y = 5
+        for line in rendered:
+            box.blit(line, (5, y))
+            y += line.get_height()
+
+        return box
+
+    def dump(self, path):
+        """Write the times to a file.
+
+        JSON files hold the percentiles of each section, CSV files hold
+        the times of each of the last frames.
+
+        Arguments:
+        path (str) - path of the file, ending in .json or .csv.
+        """
+        with open(path, "w", newline="") as file:
+            if path.endswith(".csv"):
+                writer = csv.writer(file)
+                writer.writerow(["frame"] + [section + "_ms" for section in self.times])
+                first = self.frames - len(self.times["frame"])
+                for i, row in enumerate(zip(*self.times.values())):
+                    writer.writerow([first + i] + ["{:.4f}".format(time * 1000) for time in row])
+            else:
+                json.dump({"frames": self.frames, "window": len(self.times["frame"]),
+                    "fps": fps, "sections": self.summary()}, file, indent=4)
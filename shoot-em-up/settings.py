@@ -11,3 +11,30 @@ black = (0, 0, 0)
 red = (255, 0, 0)
 green = (0, 255, 0)
 blue = (0, 0, 255)
+
+# Frame profiler settings: frames to keep times for, key to show the
+# overlay, and file to write the times to on exit (.json or .csv) or None.
+profiler_window = 600
+profiler_key = "f3"
+profile_file = None
+
+# Most rendered texts to keep in the text cache.
+text_cache_size = 256
+
+# Width and height of the cells of the spatial hash used for collisions.
+grid_cell_size = 64
+
+# Number of hostiles at the start of a game.
+hostile_count = 8
+
+# Keep hostiles and bullets in NumPy arrays instead of sprites, for games
+# with thousands of them. Requires NumPy.
+entity_store = False
+
+# Ticks between extra hostiles being added, or 0 for none, and the most
+# hostiles there can be.
+hostile_spawn_interval = 0
+max_hostiles = 1000
+
+# Ticks between shots for computer controlled players.
+bot_fire_interval = 6
@@ -0,0 +1,247 @@
+"""Soak test for Shoot 'Em Up.
+
+Plays the game without a display for a long time, as fast as possible,
+with the player moved by a controller instead of the keyboard, starting a
+new game whenever the player dies. Reports how many ticks are run each
+second, how many collisions there are, how much memory has grown and the
+percentiles of the time taken by each part of a frame. Run
+`python soak.py --help` for options.
+"""
+
+import os
+
+# Don't open a window or print the PyGame banner.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import tracemalloc
+from time import perf_counter
+
+import pygame
+
+
+from controllers import *
+from main import *
+
+
+controllers = {
+        "still": still,
+        "sweep": sweep,
+        "hunt": hunt
+        }
+
+
+class Soak:
+    """Class to play games over and over and keep count of what happens.
+
+    Attributes:
+    game (Game) - game state to play.
+    screen (pygame.Surface) - screen to draw to, or None to not draw.
+    profiler (FrameProfiler) - profiler timing each tick.
+    ticks (int) - number of ticks run, over every game.
+    games (int) - number of games started.
+    hostiles_shot (int) - number of hostiles hit by bullets in finished
+    games.
+    hostiles_crashed (int) - number of hostiles that hit the player in
+    finished games.
+    immortal (bool) - flag to check if the player can't die, so one game
+    goes on for the whole test.
+    """
+    def __init__(self, game, screen, profiler, immortal=False):
+        """Initialise the new soak test.
+
+        Arguments:
+        game (Game) - game state to play.
+        screen (pygame.Surface) - screen to draw to, or None to not draw.
+        profiler (FrameProfiler) - profiler to time each tick with.
+        immortal (bool) - flag to check if the player can't die.
+        """
+        self.game = game
+        self.screen = screen
+        self.profiler = profiler
+        self.ticks = 0
+        self.games = 0
+        self.hostiles_shot = 0
+        self.hostiles_crashed = 0
+        self.immortal = immortal
+
+    def new_game(self):
+        """Start a new game, counting the collisions of the last one."""
+        if self.games:
+            self.hostiles_shot += self.game.hostiles_shot
+            self.hostiles_crashed += self.game.hostiles_crashed
+
+        self.game.setup()
+        self.games += 1
+
+        # Give the player endless health.
+        if self.immortal:
+            self.game.player.health = float("inf")
+
+    def collisions(self):
+        """Get the number of collisions so far.
+
+        Returns:
+        (tuple) - number of hostiles hit by bullets and that hit the player.
+        """
+        return (self.hostiles_shot + self.game.hostiles_shot,
+                self.hostiles_crashed + self.game.hostiles_crashed)
+
+    def run(self, ticks):
+        """Run the game for a number of ticks, without waiting on a clock.
+
+        Arguments:
+        ticks (int) - number of ticks to run.
+        """
+        profiler = self.profiler
+
+        for i in range(ticks):
+            # Nothing to wait for, but keep the sections the same as the
+            # game's.
+            profiler.begin_frame()
+            profiler.lap("wait")
+
+            # Keep the event queue from filling up.
+            pygame.event.pump()
+            profiler.lap("events")
+
+            # Update the game, starting a new one if the player died.
+            self.game.update()
+            if not self.game.running:
+                self.new_game()
+            profiler.lap("update")
+
+            # Draw the game to the screen.
+            if self.screen is not None:
+                self.game.draw(self.screen)
+            profiler.lap("draw")
+            profiler.lap("overlay")
+
+            # Update the screen.
+            if self.screen is not None:
+                pygame.display.flip()
+            profiler.lap("display")
+            profiler.end_frame()
+
+        self.ticks += ticks
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Play Shoot 'Em Up without "
+            "a display for a long time.")
+    parser.add_argument("-t", "--ticks", type=int, default=100000)
+    parser.add_argument("--mode", choices=["sprites", "arrays"], default="sprites",
+            help="keep hostiles and bullets in sprites or in entity stores")
+    parser.add_argument("--controller", choices=sorted(controllers), default="hunt")
+    parser.add_argument("--hostiles", type=int, default=hostile_count,
+            help="number of hostiles at the start of each game")
+    parser.add_argument("--spawn-interval", type=int, default=hostile_spawn_interval,
+            help="ticks between extra hostiles being added, or 0 for none")
+    parser.add_argument("--max-hostiles", type=int, default=max_hostiles)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("--immortal", action="store_true",
+            help="never let the player die, so hostiles can build up")
+    parser.add_argument("--no-draw", action="store_true",
+            help="only update the game, without drawing it")
+    parser.add_argument("--window", type=int, default=10000,
+            help="ticks to work out the percentiles over")
+    parser.add_argument("--warmup", type=int, default=10000,
+            help="ticks to run before measuring memory growth, at least the "
+            "window, so the times it keeps aren't counted")
+    parser.add_argument("--report-every", type=int, default=10000,
+            help="ticks between progress reports")
+    parser.add_argument("--no-trace", action="store_true",
+            help="don't trace memory, which slows every tick down")
+    parser.add_argument("--profile-file",
+            help="file to write the tick times to (.json or .csv)")
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    # Setup PyGame.
+    pygame.init()
+    screen = pygame.display.set_mode((screen_width, screen_height))
+
+    # Create the game, played by the controller.
+    States.share["controller"] = controllers[arguments.controller]
+    game_class = ArrayGame if arguments.mode == "arrays" else Game
+    game = game_class(arguments.hostiles, arguments.spawn_interval,
+            arguments.max_hostiles, arguments.seed)
+
+    soak = Soak(game, None if arguments.no_draw else screen,
+            FrameProfiler(arguments.window), arguments.immortal)
+    soak.new_game()
+
+    # Run until pools, caches and the profiler have filled before
+    # measuring memory.
+    warmup = min(max(arguments.warmup, arguments.window), arguments.ticks)
+    if not arguments.no_trace:
+        tracemalloc.start()
+    soak.run(warmup)
+    if not arguments.no_trace:
+        baseline = tracemalloc.take_snapshot()
+        baseline_size = tracemalloc.get_traced_memory()[0]
+
+    print("{:>10} {:>10} {:>9} {:>8} {:>8} {:>10}".format("tick", "ticks/s",
+        "hostiles", "shot", "crashed", "memory"))
+
+    start = perf_counter()
+    remaining = arguments.ticks - soak.ticks
+    while remaining > 0:
+        ticks = min(arguments.report_every, remaining)
+        lap_start = perf_counter()
+        soak.run(ticks)
+        elapsed = perf_counter() - lap_start
+        remaining -= ticks
+
+        memory = "-"
+        if not arguments.no_trace:
+            memory = "{:+.1f}KiB".format((tracemalloc.get_traced_memory()[0] - baseline_size) / 1024)
+
+        print("{:>10} {:>10.0f} {:>9} {:>8} {:>8} {:>10}".format(soak.ticks,
+            ticks / elapsed, len(game.hostiles), *soak.collisions(), memory))
+
+    elapsed = perf_counter() - start
+    measured = soak.ticks - warmup
+
+    print()
+    if measured:
+        print("{} ticks in {:.2f}s after warming up, {:.0f} ticks per second.".format(
+            measured, elapsed, measured / elapsed))
+    print("{} games, {} hostiles shot, {} crashed into the player.".format(
+        soak.games, *soak.collisions()))
+
+    # Show how much memory grew after warming up, and where.
+    if not arguments.no_trace:
+        size, peak = tracemalloc.get_traced_memory()
+        print("Memory grew by {:.1f}KiB to {:.1f}KiB, peaking at {:.1f}KiB.".format(
+            (size - baseline_size) / 1024, size / 1024, peak / 1024))
+
+        for difference in tracemalloc.take_snapshot().compare_to(baseline, "lineno")[:5]:
+            print("   ", difference)
+        tracemalloc.stop()
+
+    # Show the percentiles of the tick times.
+    print()
+    for section, times in soak.profiler.summary().items():
+        if section != "wait":
+            print("{:8} p50 {:7.3f}  p95 {:7.3f}  p99 {:7.3f} ms".format(section, *times.values()))
+
+    # Write the tick times to a file.
+    if arguments.profile_file is not None:
+        soak.profiler.dump(arguments.profile_file)
+
+    pygame.quit()
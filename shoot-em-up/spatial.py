@@ -0,0 +1,134 @@
+"""Spatial hash for finding collisions between sprites."""
+
+from settings import *
+
+
+class SpatialHash:
+    """Class for a uniform grid of cells holding the sprites touching them.
+
+    Only sprites in the cells a rectangle touches need to be checked for
+    collisions with it, so checking every sprite of one group against
+    another takes time roughly in proportion to the number of sprites,
+    rather than the product of the sizes of both groups.
+
+    Attributes:
+    cell_size (int) - width and height of each cell, in pixels.
+    cells (dict) - lists of the sprites touching each cell and of their
+    rectangles, by cell column and row.
+    """
+    def __init__(self, cell_size=grid_cell_size):
+        """Initialise the new spatial hash.
+
+        Arguments:
+        cell_size (int) - width and height of each cell, in pixels.
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def cells_touching(self, rect):
+        """Get the cells a rectangle touches.
+
+        Arguments:
+        rect (pygame.Rect) - rectangle to get the cells of.
+
+        Returns:
+        (list) - column and row of each cell.
+        """
+        size = self.cell_size
+        rows = range(rect.top // size, (rect.bottom - 1) // size + 1)
+
+        return [(column, row)
+                for column in range(rect.left // size, (rect.right - 1) // size + 1)
+                for row in rows]
+
+    def insert(self, sprite):
+        """Add a sprite to the cells it touches.
+
+        Arguments:
+        sprite (pygame.sprite.Sprite) - sprite to add.
+        """
+        for cell in self.cells_touching(sprite.rect):
+            if cell in self.cells:
+                sprites, rects = self.cells[cell]
+                sprites.append(sprite)
+                rects.append(sprite.rect)
+            else:
+                self.cells[cell] = ([sprite], [sprite.rect])
+
+    def rebuild(self, sprites):
+        """Empty the spatial hash and add sprites to it.
+
+        Arguments:
+        sprites (iterable) - sprites to add.
+        """
+        self.cells = {}
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def collide(self, sprite, dokill=False):
+        """Find the sprites colliding with a sprite.
+
+        Works like pygame.sprite.spritecollide. Sprites that have been
+        killed since they were added are skipped.
+
+        Arguments:
+        sprite (pygame.sprite.Sprite) - sprite to check.
+        dokill (bool) - flag to check if colliding sprites should be
+        killed.
+
+        Returns:
+        collided (list) - sprites colliding with the sprite.
+        """
+        collided = []
+        rect = sprite.rect
+        cells = self.cells_touching(rect)
+
+        for cell in cells:
+            if cell not in self.cells:
+                continue
+
+            # Check the rectangles in the cell all at once.
+            sprites, rects = self.cells[cell]
+            for i in rect.collidelistall(rects):
+                if sprites[i].alive():
+                    collided.append(sprites[i])
+
+        # Sprites touching more than one cell may have been found twice.
+        if len(collided) > 1:
+            collided = list(dict.fromkeys(collided))
+
+        if dokill:
+            for other in collided:
+                other.kill()
+
+        return collided
+
+
+def groupcollide(group_a, grid, dokill_a, dokill_b):
+    """Find the sprites of a group colliding with the sprites in a spatial
+    hash.
+
+    Works like pygame.sprite.groupcollide.
+
+    Arguments:
+    group_a (pygame.sprite.Group) - group of sprites to check.
+    grid (SpatialHash) - spatial hash holding the other sprites.
+    dokill_a (bool) - flag to check if sprites in group_a that collide
+    should be killed.
+    dokill_b (bool) - flag to check if sprites in the spatial hash that
+    collide should be killed.
+
+    Returns:
+    collisions (dict) - list of sprites in the spatial hash colliding with
+    each sprite in group_a that collided.
+    """
+    collisions = {}
+
+    for sprite in group_a.sprites():
+        collided = grid.collide(sprite, dokill_b)
+        if collided:
+            collisions[sprite] = collided
+            if dokill_a:
+                sprite.kill()
+
+    return collisions
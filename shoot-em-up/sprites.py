@@ -7,24 +7,118 @@ import random
 from settings import *
 
 
-class Hostile(pygame.sprite.Sprite):
-    """Hostile sprite. Inherits from pygame.sprite.Sprite."""
+# Filled surfaces shared between sprites, by size and colour.
+surfaces = {}
+
+
+def get_surface(size, colour):
+    """Get a shared surface filled with a colour, creating it the first
+    time it is used.
+
+    Arguments:
+    size (tuple) - width and height of the surface.
+    colour (tuple) - colour to fill the surface with.
+
+    Returns:
+    surface (pygame.Surface) - the surface.
+    """
+    key = (size, colour)
+    if key not in surfaces:
+        surfaces[key] = pygame.Surface(size)
+        surfaces[key].fill(colour)
+
+    return surfaces[key]
+
+
+class SpritePool:
+    """Class for a pool of sprites that can be used again once killed.
+
+    Attributes:
+    sprite_class (type) - class of the sprites in the pool, which must have
+    a spawn method taking the same arguments as the class.
+    free (list) - killed sprites ready to be used again.
+    created (int) - number of sprites created.
+    reused (int) - number of times a sprite was used again.
+    """
+    def __init__(self, sprite_class):
+        """Initialise the new pool.
+
+        Arguments:
+        sprite_class (type) - class of the sprites in the pool.
+        """
+        self.sprite_class = sprite_class
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def get(self, *arguments):
+        """Get a sprite, using a killed one again if there is one.
+
+        Arguments:
+        arguments - arguments to spawn the sprite with.
+
+        Returns:
+        sprite (pygame.sprite.Sprite) - the sprite.
+        """
+        if self.free:
+            sprite = self.free.pop()
+            sprite.spawn(*arguments)
+            self.reused += 1
+        else:
+            sprite = self.sprite_class(*arguments)
+            sprite.pool = self
+            self.created += 1
+
+        return sprite
+
+    def release(self, sprite):
+        """Put a killed sprite back in the pool.
+
+        Arguments:
+        sprite (pygame.sprite.Sprite) - sprite to put back.
+        """
+        self.free.append(sprite)
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite that goes back to its pool when killed. Inherits from
+    pygame.sprite.Sprite.
+
+    Attributes:
+    pool (SpritePool) - pool the sprite came from, or None.
+    """
+    pool = None
+
+    def kill(self):
+        """Remove the sprite from all groups and put it back in its pool."""
+        if self.alive():
+            pygame.sprite.Sprite.kill(self)
+            if self.pool is not None:
+                self.pool.release(self)
+
+
+class Hostile(PooledSprite):
+    """Hostile sprite. Inherits from PooledSprite."""
     def __init__(self):
         """Initialise the new hostile."""
         # Setup the underlying PyGame sprite.
         pygame.sprite.Sprite.__init__(self)
 
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.spawn()
+
+    def spawn(self):
+        """Give the hostile a new size and vector."""
         # Set width, height and colour.
         self.width = random.randrange(20, 40, 5)
         self.height = random.randrange(20, 40, 5)
         self.colour = red
 
-        # Create surface to display hostile.
-        self.image = pygame.Surface((self.width, self.height))
-        self.image.fill(self.colour)
+        # Get surface to display hostile.
+        self.image = get_surface((self.width, self.height), self.colour)
 
-        # Create rectangle to store hostile and move it to the top of screen.
-        self.rect = self.image.get_rect()
+        # Set rectangle to store hostile at the top left of the screen.
+        self.rect.update(0, 0, self.width, self.height)
 
         # Set initial vector.
         self.dx = random.randint(-4, 4)
@@ -72,18 +166,28 @@ class Player(pygame.sprite.Sprite):
         self.rect.x = (screen_width // 2) - (self.width // 2)
         self.rect.y = screen_height - self.height - 10
 
-    def update(self):
-        """Update the players position."""
-        # Set vectors and get pressed keys.
-        self.dx = 0
+        # Set direction to move in.
+        self.direction = 0
 
+    def get_direction(self):
+        """Get the direction to move in from the arrow keys.
+
+        Returns:
+        (int) - -1 for left, 1 for right, 0 for not moving.
+        """
         keystates = pygame.key.get_pressed()
 
-        # Check the pressed keys and adjust vectors.
+        # Check the pressed keys.
         if keystates[pygame.K_RIGHT]:
-            self.dx = 10
+            return 1
         elif keystates[pygame.K_LEFT]:
-            self.dx = -10
+            return -1
+        return 0
+
+    def update(self):
+        """Update the players position."""
+        # Set vector from the direction to move in.
+        self.dx = 10 * self.direction
 
         # Move the player according to the vector.
         self.rect.x += self.dx
@@ -102,13 +206,18 @@ class Player(pygame.sprite.Sprite):
         Returns:
         (Bullet) - the bullet that has been shot.
         """
-        return Bullet(self.rect.x + (self.width // 2), self.rect.y)
+        return bullet_pool.get(self.rect.x + (self.width // 2), self.rect.y)
 
 
-class Bullet(pygame.sprite.Sprite):
-    """Bullet sprite. Inherits from pygame.sprite.Sprite."""
+class Bullet(PooledSprite):
+    """Bullet sprite. Inherits from PooledSprite."""
     def __init__(self, x, y):
-        """Initialise the new bullet."""
+        """Initialise the new bullet.
+
+        Arguments:
+        x (int) - X position of the middle of the bullet.
+        y (int) - Y position of the bottom of the bullet.
+        """
         # Setup the underlying PyGame sprite.
         pygame.sprite.Sprite.__init__(self)
 
@@ -117,12 +226,20 @@ class Bullet(pygame.sprite.Sprite):
         self.height = 20
         self.colour = blue
 
-        # Create surface to display bullet.
-        self.image = pygame.Surface((self.width, self.height))
-        self.image.fill(self.colour)
+        # Get surface to display bullet.
+        self.image = get_surface((self.width, self.height), self.colour)
 
         # Create rectangle to store the bullet.
         self.rect = self.image.get_rect()
+        self.spawn(x, y)
+
+    def spawn(self, x, y):
+        """Move the bullet to where it is shot from.
+
+        Arguments:
+        x (int) - X position of the middle of the bullet.
+        y (int) - Y position of the bottom of the bullet.
+        """
         self.rect.x = x - (self.width // 2)
         self.rect.y = y - self.height
 
@@ -136,3 +253,8 @@ class Bullet(pygame.sprite.Sprite):
         # Check if the bullet has gone beyond the edge of the screen.
         if self.rect.y - self.height < 0:
             self.kill()
+
+
+# Pools of hostiles and bullets.
+hostile_pool = SpritePool(Hostile)
+bullet_pool = SpritePool(Bullet)
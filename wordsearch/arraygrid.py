@@ -0,0 +1,167 @@
+"""NumPy backed wordsearch grid.
+
+Requires NumPy. Checks a word against every start position in a direction
+at once, rather than walking the word letter by letter.
+"""
+
+import random
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ArrayGrid:
+    """Class for a wordsearch grid stored as a NumPy array.
+
+    Has the same methods as placement.Grid, so can be used by the placement
+    engine in its place.
+
+    Attributes:
+    width (int) - width of the grid.
+    height (int) - height of the grid.
+    cells (numpy.ndarray) - array of letter codes, indexed by Y then X.
+    Empty cells are 0.
+    """
+    def __init__(self, width, height):
+        """Initialise the new, empty grid.
+
+        Arguments:
+        width (int) - width of the grid.
+        height (int) - height of the grid.
+        """
+        if numpy is None:
+            raise ImportError("ArrayGrid requires NumPy.")
+
+        self.width = width
+        self.height = height
+        self.cells = numpy.zeros((height, width), dtype=numpy.uint8)
+
+    def starts(self, word_length, direction):
+        """Get the range of start positions a word fits in.
+
+        Arguments:
+        word_length (int) - length of the word.
+        direction (tuple) - X and Y step of the word.
+
+        Returns:
+        (tuple) - range of X positions and range of Y positions.
+        """
+        d_x, d_y = direction
+        span = word_length - 1
+
+        # Keep the end of the word within the grid.
+        x_range = range(max(0, -span * d_x),
+                min(self.width, self.width - span * d_x))
+        y_range = range(max(0, -span * d_y),
+                min(self.height, self.height - span * d_y))
+
+        return x_range, y_range
+
+    def slots(self, word, directions):
+        """Find every slot a word can be placed in.
+
+        Arguments:
+        word (str) - word to place.
+        directions (list) - list of directions words can go in.
+
+        Returns:
+        slots (list) - list of (overlap, x, y, d_x, d_y) tuples, where
+        overlap is the number of letters shared with words already placed.
+        """
+        slots = []
+        codes = word.encode("latin-1")
+
+        for d_x, d_y in directions:
+            x_range, y_range = self.starts(len(word), (d_x, d_y))
+
+            if not x_range or not y_range:
+                continue
+
+            fits = numpy.ones((len(y_range), len(x_range)), dtype=bool)
+            overlap = numpy.zeros(fits.shape, dtype=numpy.int32)
+
+            # Compare each letter against the grid shifted along the
+            # direction, covering every start position at once.
+            for i, code in enumerate(codes):
+                top = y_range.start + i * d_y
+                left = x_range.start + i * d_x
+                window = self.cells[top:top + len(y_range),
+                        left:left + len(x_range)]
+
+                matches = window == code
+                fits &= matches | (window == 0)
+                overlap += matches
+
+            # Skip slots where the word is already in the grid.
+            fits &= overlap < len(word)
+
+            for y, x in zip(*numpy.nonzero(fits)):
+                slots.append((int(overlap[y, x]), x_range.start + int(x),
+                    y_range.start + int(y), d_x, d_y))
+
+        return slots
+
+    def place(self, word, start_x, start_y, d_x, d_y):
+        """Put a word into the grid.
+
+        Arguments:
+        word (str) - word to place.
+        start_x (int) - X position of the first letter.
+        start_y (int) - Y position of the first letter.
+        d_x (int) - X step between letters.
+        d_y (int) - Y step between letters.
+
+        Returns:
+        filled (list) - list of (x, y) positions that were empty before.
+        """
+        filled = []
+
+        for i, code in enumerate(word.encode("latin-1")):
+            x = start_x + i * d_x
+            y = start_y + i * d_y
+
+            if not self.cells[y, x]:
+                self.cells[y, x] = code
+                filled.append((x, y))
+
+        return filled
+
+    def remove(self, filled):
+        """Take a word back out of the grid.
+
+        Arguments:
+        filled (list) - list of positions returned by place.
+        """
+        for x, y in filled:
+            self.cells[y, x] = 0
+
+    def fill(self, alphabet_length, rng=None):
+        """Fill empty cells with random letters.
+
+        Arguments:
+        alphabet_length (int) - number of letters to choose from.
+        rng (random.Random) - random number generator to use, or None for
+        the random module.
+        """
+        if rng is None:
+            rng = random
+
+        # Seed a NumPy generator from rng, so the fill follows its seed.
+        generator = numpy.random.default_rng(rng.getrandbits(64))
+
+        empty = self.cells == 0
+        self.cells[empty] = generator.integers(ord("A"),
+                ord("A") + alphabet_length, size=int(empty.sum()),
+                dtype=numpy.uint8)
+
+    def rows(self):
+        """Get the grid as a list of rows.
+
+        Returns:
+        (list) - list of rows, each a list of letters. Empty cells are
+        empty strings.
+        """
+        return [[chr(code) if code else "" for code in row]
+                for row in self.cells.tolist()]
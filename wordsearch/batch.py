@@ -0,0 +1,198 @@
+"""Generate many wordsearches at once.
+
+Wordsearches are generated across several processes and written out as
+they finish, as JSON Lines, plain text, HTML or SVG. Run
+`python batch.py --help` for options.
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from os import cpu_count
+from random import Random
+
+
+import main
+from render import write_wordsearch
+from wordindex import load_word_index
+
+
+# Settings for the current worker process, set by setup_worker.
+worker_settings = {}
+
+
+def setup_worker(settings):
+    """Setup a worker process.
+
+    Loads the word index once, so every wordsearch the worker makes reuses
+    it.
+
+    Arguments:
+    settings (dict) - settings for generating wordsearches.
+    """
+    worker_settings.update(settings)
+    load_word_index(settings["word_file"])
+
+
+def generate(index):
+    """Generate a single wordsearch in a worker process.
+
+    Arguments:
+    index (int) - number of the wordsearch in the batch.
+
+    Returns:
+    (dict) - the wordsearch, or the error if it couldn't be made.
+    """
+    settings = worker_settings
+
+    # Give every wordsearch its own generator, seeded from the batch seed.
+    seed = main.derive_seed(settings["seed"], index)
+    rng = Random(seed)
+
+    words = main.select_words(settings["min_word_length"],
+            settings["max_word_length"], settings["number_of_words"],
+            settings["word_file"], rng=rng)
+
+    try:
+        grid = main.make_wordsearch(words, settings["grid_size"],
+                settings["grid_size"], settings["backend"], rng)
+    except main.PlacementError as error:
+        return {"index": index, "seed": seed, "error": str(error)}
+
+    return {"index": index, "seed": seed, "words": words,
+            "grid": ["".join(row) for row in grid]}
+
+
+def write_result(wordsearch, stream, output_format):
+    """Write a generated wordsearch to a stream.
+
+    Wordsearches that couldn't be made are only written as JSON Lines.
+
+    Arguments:
+    wordsearch (dict) - wordsearch returned by generate.
+    stream (file) - stream to write to.
+    output_format (str) - one of "jsonl", "text", "html" or "svg".
+    """
+    if output_format == "jsonl":
+        stream.write(json.dumps(wordsearch) + "\n")
+        return
+
+    if "error" in wordsearch:
+        return
+
+    # Number each wordsearch in text, where it can't break the document.
+    if output_format == "text":
+        stream.write("#{}\n".format(wordsearch["index"]))
+
+    write_wordsearch(wordsearch["grid"], wordsearch["words"], stream,
+            output_format)
+
+
+def run_batch(settings, start, count, workers, stream, output_format):
+    """Generate a batch of wordsearches and write them out as they finish.
+
+    Arguments:
+    settings (dict) - settings for generating wordsearches.
+    start (int) - index of the first wordsearch to generate.
+    count (int) - number of wordsearches to generate.
+    workers (int) - number of worker processes.
+    stream (file) - stream to write to.
+    output_format (str) - one of "jsonl", "text", "html" or "svg".
+
+    Returns:
+    failures (int) - number of wordsearches that couldn't be made.
+    """
+    failures = 0
+    indexes = iter(range(start, start + count))
+
+    with ProcessPoolExecutor(workers, initializer=setup_worker,
+            initargs=(settings,)) as executor:
+        # Keep a few jobs queued per worker rather than all at once.
+        pending = {executor.submit(generate, index)
+                for index in islice(indexes, workers * 4)}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                wordsearch = future.result()
+
+                if "error" in wordsearch:
+                    failures += 1
+
+                write_result(wordsearch, stream, output_format)
+
+                # Queue another job in place of the finished one.
+                for index in islice(indexes, 1):
+                    pending.add(executor.submit(generate, index))
+
+    return failures
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Generate a batch of "
+            "wordsearches.")
+    parser.add_argument("-n", "--count", type=int, default=100,
+            help="number of wordsearches to generate")
+    parser.add_argument("-s", "--seed", type=int, default=0,
+            help="seed for the batch")
+    parser.add_argument("--start", type=int, default=0,
+            help="index of the first wordsearch, to split a batch up")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+            help="number of worker processes (default: CPU count)")
+    parser.add_argument("-o", "--output", default="-",
+            help="file to write to (default: standard output)")
+    parser.add_argument("-f", "--format",
+            choices=("jsonl", "text", "html", "svg"), default="jsonl",
+            help="output format")
+    parser.add_argument("--word-file", default=main.word_file)
+    parser.add_argument("--grid-size", type=int, default=main.grid_size)
+    parser.add_argument("--words", type=int, default=main.number_of_words,
+            help="number of words per wordsearch")
+    parser.add_argument("--min-length", type=int,
+            default=main.min_word_length)
+    parser.add_argument("--max-length", type=int,
+            default=main.max_word_length)
+    parser.add_argument("--backend", choices=sorted(main.grid_backends),
+            default=main.grid_backend)
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    settings = {
+            "seed": arguments.seed,
+            "word_file": arguments.word_file,
+            "grid_size": arguments.grid_size,
+            "number_of_words": arguments.words,
+            "min_word_length": arguments.min_length,
+            "max_word_length": arguments.max_length,
+            "backend": arguments.backend
+            }
+
+    workers = arguments.workers or cpu_count()
+
+    if arguments.output == "-":
+        failures = run_batch(settings, arguments.start, arguments.count,
+                workers, sys.stdout, arguments.format)
+    else:
+        with open(arguments.output, "w") as stream:
+            failures = run_batch(settings, arguments.start, arguments.count,
+                    workers, stream, arguments.format)
+
+    if failures:
+        print("{} wordsearches couldn't be made.".format(failures),
+                file=sys.stderr)
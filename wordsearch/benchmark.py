@@ -0,0 +1,240 @@
+"""Benchmark wordsearch generation.
+
+Sweeps grid sizes, numbers of words and word lengths, generating a number
+of wordsearches for each combination and recording how long they take and
+how the placement engine behaved. Results are written as JSON or CSV, and
+can be compared against an earlier run to catch regressions. Run
+`python benchmark.py --help` for options.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from itertools import product
+from random import Random
+from statistics import mean, median
+from time import perf_counter
+
+
+import main
+from solver import check_wordsearch
+
+
+# Fields of each result, in the order they are written.
+fields = [
+        "grid_size",
+        "number_of_words",
+        "min_word_length",
+        "max_word_length",
+        "backend",
+        "trials",
+        "mean_time",
+        "median_time",
+        "p95_time",
+        "attempts_per_word",
+        "backtracks_per_word",
+        "overlap_ratio",
+        "failure_rate",
+        "ambiguous_rate"
+        ]
+
+
+def benchmark(grid_size, number_of_words, min_word_length, max_word_length,
+        backend, trials, seed):
+    """Benchmark one combination of settings.
+
+    Arguments:
+    grid_size (int) - width and height of the grids.
+    number_of_words (int) - number of words per wordsearch.
+    min_word_length (int) - minimum word length.
+    max_word_length (int) - maximum word length.
+    backend (str) - name of grid representation to use.
+    trials (int) - number of wordsearches to generate.
+    seed (int) - seed for the run.
+
+    Returns:
+    (dict) - results for the combination.
+    """
+    times = []
+    attempts = []
+    backtracks = []
+    overlaps = []
+    failures = 0
+    ambiguous = 0
+
+    for trial in range(trials):
+        rng = Random(main.derive_seed(seed, trial))
+        words = main.select_words(min_word_length, max_word_length,
+                number_of_words, main.word_file, rng=rng)
+        stats = {}
+
+        start = perf_counter()
+        try:
+            grid = main.make_wordsearch(words, grid_size, grid_size, backend,
+                    rng, stats)
+        except main.PlacementError:
+            grid = None
+        times.append(perf_counter() - start)
+
+        attempts.append(stats["attempts"] / number_of_words)
+        backtracks.append(stats["backtracks"] / number_of_words)
+
+        if grid is None:
+            failures += 1
+            continue
+
+        # Record how many letters are shared, and if any word repeats.
+        overlaps.append(stats["overlaps"] / sum(len(word) for word in words))
+
+        if check_wordsearch(grid, words):
+            ambiguous += 1
+
+    times.sort()
+
+    return {
+            "grid_size": grid_size,
+            "number_of_words": number_of_words,
+            "min_word_length": min_word_length,
+            "max_word_length": max_word_length,
+            "backend": backend,
+            "trials": trials,
+            "mean_time": mean(times),
+            "median_time": median(times),
+            "p95_time": times[min(len(times) - 1, int(len(times) * 0.95))],
+            "attempts_per_word": mean(attempts),
+            "backtracks_per_word": mean(backtracks),
+            "overlap_ratio": mean(overlaps) if overlaps else 0.0,
+            "failure_rate": failures / trials,
+            "ambiguous_rate": ambiguous / max(trials - failures, 1)
+            }
+
+
+def find_regressions(results, baseline, tolerance):
+    """Compare results against a baseline run.
+
+    Arguments:
+    results (list) - list of results.
+    baseline (list) - list of results from an earlier run.
+    tolerance (float) - factor mean time can grow by before it counts as a
+    regression.
+
+    Returns:
+    regressions (list) - list of messages describing each regression.
+    """
+    def key(result):
+        """Get the settings a result was made with."""
+        return tuple(result[field] for field in fields[:5])
+
+    earlier = {key(result): result for result in baseline}
+    regressions = []
+
+    for result in results:
+        old = earlier.get(key(result))
+
+        if old is None:
+            continue
+
+        if result["mean_time"] > old["mean_time"] * tolerance:
+            regressions.append("{}: mean time {:.4f}s, was {:.4f}s".format(
+                key(result), result["mean_time"], old["mean_time"]))
+
+        if result["failure_rate"] > old["failure_rate"]:
+            regressions.append("{}: failure rate {:.2%}, was {:.2%}".format(
+                key(result), result["failure_rate"], old["failure_rate"]))
+
+    return regressions
+
+
+def write_results(results, stream, output_format):
+    """Write results to a stream.
+
+    Arguments:
+    results (list) - list of results.
+    stream (file) - stream to write to.
+    output_format (str) - either "json" or "csv".
+    """
+    if output_format == "json":
+        json.dump(results, stream, indent=4)
+        stream.write("\n")
+    else:
+        writer = csv.DictWriter(stream, fields)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def parse_list(text):
+    """Parse a comma separated list of integers."""
+    return [int(item) for item in text.split(",")]
+
+
+def parse_lengths(text):
+    """Parse a comma separated list of MIN-MAX word length ranges."""
+    return [tuple(int(length) for length in item.split("-"))
+            for item in text.split(",")]
+
+
+def parse_arguments(arguments=None):
+    """Parse command line arguments.
+
+    Arguments:
+    arguments (list) - list of arguments, or None to use sys.argv.
+
+    Returns:
+    (argparse.Namespace) - parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark wordsearch "
+            "generation.")
+    parser.add_argument("--grid-sizes", type=parse_list, default=[10, 14, 20],
+            help="comma separated grid sizes")
+    parser.add_argument("--word-counts", type=parse_list,
+            default=[5, 10, 20], help="comma separated numbers of words")
+    parser.add_argument("--lengths", type=parse_lengths,
+            default=[(3, 6), (4, 10)],
+            help="comma separated MIN-MAX word lengths")
+    parser.add_argument("--backends", type=lambda text: text.split(","),
+            default=[main.grid_backend], help="comma separated backends")
+    parser.add_argument("-n", "--trials", type=int, default=20,
+            help="wordsearches per combination")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("--word-file", default=main.word_file)
+    parser.add_argument("-o", "--output", default="-",
+            help="file to write to (default: standard output)")
+    parser.add_argument("-f", "--format", choices=("json", "csv"),
+            default="json")
+    parser.add_argument("--baseline",
+            help="JSON results of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+            help="factor mean time can grow by before failing")
+
+    return parser.parse_args(arguments)
+
+
+# Main program.
+if __name__ == "__main__":
+    arguments = parse_arguments()
+    main.word_file = arguments.word_file
+
+    results = []
+    for grid_size, number_of_words, lengths, backend in product(
+            arguments.grid_sizes, arguments.word_counts, arguments.lengths,
+            arguments.backends):
+        results.append(benchmark(grid_size, number_of_words, lengths[0],
+            lengths[1], backend, arguments.trials, arguments.seed))
+
+    if arguments.output == "-":
+        write_results(results, sys.stdout, arguments.format)
+    else:
+        with open(arguments.output, "w", newline="") as stream:
+            write_results(results, stream, arguments.format)
+
+    if arguments.baseline:
+        with open(arguments.baseline, "r") as file:
+            regressions = find_regressions(results, json.load(file),
+                    arguments.tolerance)
+
+        # Report regressions and fail, so scripts can catch them.
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
@@ -1,5 +1,14 @@
-from os import name, system
-from random import choice, randint
+import sys
+from hashlib import sha256
+from random import Random
+
+
+from arraygrid import ArrayGrid
+from placement import Grid, PlacementError, place_words
+from render import render_grid, render_words
+from solver import fill_safely
+from terminal import Terminal
+from wordindex import load_word_index
 
 
 # Various settings.
@@ -26,17 +35,39 @@ number_of_words = 10
 
 grid_size = 14
 
+# Number of columns to print the list of words in.
+word_columns = 2
+
+# Seconds to spend placing words before giving up.
+placement_time_limit = 1.0
+
+# Grid representation to use, either "list" or "numpy" (needs NumPy).
+grid_backend = "list"
+
+grid_backends = {
+        "list": Grid,
+        "numpy": ArrayGrid
+        }
+
+# Fill with letters that can't spell the words a second time. Slower than
+# a plain random fill, and fills the grid's rows in Python whichever backend
+# is used, so turn it off to use the NumPy backend's vectorised fill.
+safe_fill = True
+
+# Seed for generating the wordsearch, or None for a random one.
+seed = None
+
+# Terminal to draw the wordsearch to.
+terminal = Terminal()
+
 
 def clear_screen():
-    """Clear the terminal by issuing system commands."""
-    if name == "nt":
-        system("cls")
-    else:
-        system("clear")
+    """Clear the terminal, if output is going to one."""
+    terminal.clear()
 
 
 def select_words(min_word_length, max_word_length, number_of_words,
-        word_file):
+        word_file, letters=None, rng=None):
     """Select words from a word file.
 
     Arguments:
@@ -44,131 +75,93 @@ def select_words(min_word_length, max_word_length, number_of_words,
     max_word_length (int) - maximum word length to select.
     number_of_words (int) - number of words to select.
     word_file (str) - file name of file containing words to select.
+    letters (str) - letters that selected words may use, or None for any.
+    rng (random.Random) - random number generator to use, or None for the
+    random module.
 
     Returns:
     selected_words (list) - list of words.
     """
-    selected_words = []
-
-    # Open file and get list of all words.
-    with(open(word_file, "r")) as file:
-        words = file.read().splitlines()
+    # Load the (cached) index of words and pick from it.
+    index = load_word_index(word_file)
 
-    # Repeat for as many number of words needed.
-    for i in range(number_of_words):
-        # Select random word from list of words.
-        word = choice(words)
-        while not(min_word_length <= len(word) <= max_word_length):
-            word = choice(words)
+    return index.select(min_word_length, max_word_length, number_of_words,
+            letters, rng)
 
-        # Add selected word to word list.
-        selected_words.append(word.upper())
 
-    return selected_words
-
-
-def make_wordsearch(words, grid_width, grid_height):
+def make_wordsearch(words, grid_width, grid_height, backend=grid_backend,
+        rng=None, stats=None):
     """Create a word search based on a set of words and some sizes.
 
     Arguments:
     words (list) - list of words.
     grid_width (int) - width of wordsearch grid.
     grid_height (int) - height of wordsearch grid.
+    backend (str) - name of grid representation to use.
+    rng (random.Random) - random number generator to use, or None for the
+    random module.
+    stats (dict) - dictionary to record placement counts in, or None. See
+    placement.place_words.
 
     Returns:
-    grid (str) - a wordsearch grid.
+    grid (list) - a wordsearch grid, as a list of rows.
+
+    Raises:
+    PlacementError - if the words can't be placed within the time limit.
     """
     # Create empty grid.
-    grid = [["" for x in range(grid_size)] for y in range(grid_size)]
+    grid = grid_backends[backend](grid_width, grid_height)
 
-    # For every word.
-    for word in words:
-        word_length = len(word)
+    # Place every word in the grid.
+    place_words(grid, words, directions, placement_time_limit, rng, stats)
 
-        placed = False
-        placeable = False
-
-        # While word hasn't been added to grid.
-        while not placed:
-            # Check if word can be placed in grid.
-            if not placeable:
-                start_x = randint(0, grid_width - 1)
-                start_y = randint(0, grid_height - 1)
-
-                d_x, d_y = choice(directions)
-
-                placeable = True
-
-            end_x = start_x + (word_length * d_x)
-            end_y = start_y + (word_length * d_y)
-
-            if not(0 <= end_x <= grid_width - 1) or \
-                not(0 <= end_y <= grid_height - 1):
-                # Word won't fit, stop.
-                placeable = False
-            else:
-                # Check if grid areas have any characters already in them.
-                for i in range(word_length):
-                    current_letter = word[i]
-                    
-                    letter_x = start_x + ((i + 1) * d_x)
-                    letter_y = start_y + ((i + 1) * d_y)
-
-                    grid_letter = grid[letter_x][letter_y]
-
-                    if not(len(grid_letter) == 0):
-                        if not(grid_letter == current_letter):
-                            # Word can't be placed, stop.
-                            placeable = False
-                            break
-
-                if placeable:
-                    # Word can be put on wordsearch, add it.
-                    for i in range(word_length):
-                        current_letter = word[i]
+    # Fill grid with random letters.
+    if safe_fill:
+        rows = grid.rows()
+        fill_safely(rows, words, alphabet_length, rng)
+        return rows
 
-                        letter_x = start_x + ((i + 1) * d_x)
-                        letter_y = start_y + ((i + 1) * d_y)
+    grid.fill(alphabet_length, rng)
 
-                        grid[letter_x][letter_y] = current_letter
+    return grid.rows()
 
-                    placed = True
 
-    # Fill grid with random letters.
-    for y in range(len(grid)):
-        row = grid[y]
+def derive_seed(batch_seed, index):
+    """Derive the seed of one wordsearch in a batch.
 
-        for x in range(len(row)):
-            grid_letter = grid[x][y]
+    The seed only depends on the batch seed and the index, so any
+    wordsearch in a batch can be made again by itself, on any machine.
 
-            if len(grid_letter) == 0:
-                grid[x][y] = chr(randint(0, alphabet_length - 1) + ord("A"))
+    Arguments:
+    batch_seed (int) - seed of the whole batch.
+    index (int) - number of the wordsearch in the batch.
 
-    return grid
+    Returns:
+    (int) - seed for the wordsearch.
+    """
+    digest = sha256("{}:{}".format(batch_seed, index).encode()).digest()
+    return int.from_bytes(digest[:8], "big")
 
 
-def pretty_print_words(words):
+def pretty_print_words(words, columns=word_columns, stream=None):
     """Print words nicely.
 
     Arguments:
     words (list) - list of words to print.
+    columns (int) - number of columns to print words in.
+    stream (file) - stream to print to, or None for standard output.
     """
-    for i in range(0, len(words), 2):
-        print("%-12s\t%11s" % (words[i], words[i + 1]))
-    print()
+    (stream or sys.stdout).write(render_words(words, columns))
 
 
-def pretty_print_wordsearch(grid):
+def pretty_print_wordsearch(grid, stream=None):
     """Print a wordsearch nicely.
 
     Arguments:
-    grid (str) - a wordsearch grid.
+    grid (list) - a wordsearch grid, as a list of rows.
+    stream (file) - stream to print to, or None for standard output.
     """
-    for row in grid:
-        for letter in row:
-            print(letter, end=" ")
-        print()
-    print()
+    (stream or sys.stdout).write(render_grid(grid))
 
 
 # Main program.
@@ -177,10 +170,16 @@ if __name__ == "__main__":
     clear_screen()
 
     # Select words and create wordsearch.
+    rng = Random(seed)
     words = select_words(min_word_length, max_word_length, number_of_words,
-            word_file)
-    wordsearch = make_wordsearch(words, grid_size, grid_size)
+            word_file, rng=rng)
 
-    # Show wordsearch and words.
-    pretty_print_wordsearch(wordsearch)
-    pretty_print_words(words)
+    try:
+        wordsearch = make_wordsearch(words, grid_size, grid_size, rng=rng)
+    except PlacementError:
+        # Words couldn't fit, report error.
+        print("Couldn't fit the words into the wordsearch.")
+    else:
+        # Show wordsearch and words.
+        pretty_print_wordsearch(wordsearch)
+        pretty_print_words(words)
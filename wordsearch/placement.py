@@ -0,0 +1,225 @@
+"""Placement engine for fitting words into a wordsearch grid."""
+
+import random
+from time import monotonic
+
+
+class PlacementError(Exception):
+    """Exception raised when words can't be placed in a grid."""
+    pass
+
+
+class Grid:
+    """Class for a wordsearch grid stored as lists of letters.
+
+    Attributes:
+    width (int) - width of the grid.
+    height (int) - height of the grid.
+    cells (list) - list of rows, each a list of letters. Empty cells are
+    empty strings.
+    """
+    def __init__(self, width, height):
+        """Initialise the new, empty grid.
+
+        Arguments:
+        width (int) - width of the grid.
+        height (int) - height of the grid.
+        """
+        self.width = width
+        self.height = height
+        self.cells = [["" for x in range(width)] for y in range(height)]
+
+    def starts(self, word_length, direction):
+        """Get the range of start positions a word fits in.
+
+        Arguments:
+        word_length (int) - length of the word.
+        direction (tuple) - X and Y step of the word.
+
+        Returns:
+        (tuple) - range of X positions and range of Y positions.
+        """
+        d_x, d_y = direction
+        span = word_length - 1
+
+        # Keep the end of the word within the grid.
+        x_range = range(max(0, -span * d_x),
+                min(self.width, self.width - span * d_x))
+        y_range = range(max(0, -span * d_y),
+                min(self.height, self.height - span * d_y))
+
+        return x_range, y_range
+
+    def slots(self, word, directions):
+        """Find every slot a word can be placed in.
+
+        Arguments:
+        word (str) - word to place.
+        directions (list) - list of directions words can go in.
+
+        Returns:
+        slots (list) - list of (overlap, x, y, d_x, d_y) tuples, where
+        overlap is the number of letters shared with words already placed.
+        """
+        slots = []
+
+        for d_x, d_y in directions:
+            x_range, y_range = self.starts(len(word), (d_x, d_y))
+
+            for start_y in y_range:
+                for start_x in x_range:
+                    overlap = 0
+
+                    # Check every letter of the word against the grid.
+                    for i, letter in enumerate(word):
+                        grid_letter = self.cells[start_y + i * d_y][
+                                start_x + i * d_x]
+
+                        if grid_letter == letter:
+                            overlap += 1
+                        elif grid_letter:
+                            break
+                    else:
+                        # Skip slots where the word is already in the grid.
+                        if overlap < len(word):
+                            slots.append((overlap, start_x, start_y, d_x,
+                                d_y))
+
+        return slots
+
+    def place(self, word, start_x, start_y, d_x, d_y):
+        """Put a word into the grid.
+
+        Arguments:
+        word (str) - word to place.
+        start_x (int) - X position of the first letter.
+        start_y (int) - Y position of the first letter.
+        d_x (int) - X step between letters.
+        d_y (int) - Y step between letters.
+
+        Returns:
+        filled (list) - list of (x, y) positions that were empty before.
+        """
+        filled = []
+
+        for i, letter in enumerate(word):
+            x = start_x + i * d_x
+            y = start_y + i * d_y
+
+            if not self.cells[y][x]:
+                self.cells[y][x] = letter
+                filled.append((x, y))
+
+        return filled
+
+    def remove(self, filled):
+        """Take a word back out of the grid.
+
+        Arguments:
+        filled (list) - list of positions returned by place.
+        """
+        for x, y in filled:
+            self.cells[y][x] = ""
+
+    def fill(self, alphabet_length, rng=None):
+        """Fill empty cells with random letters.
+
+        Arguments:
+        alphabet_length (int) - number of letters to choose from.
+        rng (random.Random) - random number generator to use, or None for
+        the random module.
+        """
+        if rng is None:
+            rng = random
+
+        for row in self.cells:
+            for x in range(len(row)):
+                if not row[x]:
+                    row[x] = chr(rng.randint(0, alphabet_length - 1) +
+                            ord("A"))
+
+    def rows(self):
+        """Get the grid as a list of rows.
+
+        Returns:
+        (list) - list of rows, each a list of letters. Empty cells are
+        empty strings.
+        """
+        return [list(row) for row in self.cells]
+
+
+def place_words(grid, words, directions, time_limit=1.0, rng=None,
+        stats=None):
+    """Place words into a grid, backtracking when stuck.
+
+    Words are placed longest first. Slots that overlap letters already in
+    the grid are tried first, and ties are broken randomly.
+
+    Arguments:
+    grid (Grid) - grid to place words into.
+    words (list) - list of words.
+    directions (list) - list of directions words can go in.
+    time_limit (float) - seconds to search for before giving up.
+    rng (random.Random) - random number generator to use, or None for the
+    random module.
+    stats (dict) - dictionary to record counts of slots tried
+    ("attempts"), slots undone ("backtracks") and letters shared between
+    placed words ("overlaps") in, or None.
+
+    Returns:
+    placements (list) - list of (word, x, y, d_x, d_y) tuples.
+
+    Raises:
+    PlacementError - if the words can't be placed within the time limit.
+    """
+    if rng is None:
+        rng = random
+
+    deadline = monotonic() + time_limit
+    order = sorted(words, key=len, reverse=True)
+    placements = []
+    counts = {"attempts": 0, "backtracks": 0, "overlaps": 0}
+
+    def place_from(i):
+        """Place the words from position i onwards of the order."""
+        # All words have been placed.
+        if i == len(order):
+            return True
+
+        # Give up if searching for too long.
+        if monotonic() > deadline:
+            raise PlacementError("Ran out of time placing words.")
+
+        word = order[i]
+
+        # Find slots for word, favouring slots that overlap other words.
+        slots = grid.slots(word, directions)
+        rng.shuffle(slots)
+        slots.sort(key=lambda slot: slot[0], reverse=True)
+
+        for overlap, start_x, start_y, d_x, d_y in slots:
+            # Try the slot and move on to the next word.
+            filled = grid.place(word, start_x, start_y, d_x, d_y)
+            placements.append((word, start_x, start_y, d_x, d_y))
+            counts["attempts"] += 1
+            counts["overlaps"] += overlap
+
+            if place_from(i + 1):
+                return True
+
+            # Dead end, undo the slot.
+            grid.remove(filled)
+            placements.pop()
+            counts["backtracks"] += 1
+            counts["overlaps"] -= overlap
+
+        return False
+
+    try:
+        if not place_from(0):
+            raise PlacementError("Words can't fit in the grid.")
+    finally:
+        if stats is not None:
+            stats.update(counts)
+
+    return placements
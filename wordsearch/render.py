@@ -0,0 +1,153 @@
+"""Rendering wordsearches as text, HTML and SVG.
+
+Every row is built with a single join, and each wordsearch is written to
+its stream in one go, so large grids and batches render quickly.
+"""
+
+import sys
+from html import escape
+
+
+def render_grid(grid):
+    """Render a wordsearch grid as text.
+
+    Arguments:
+    grid (list) - a wordsearch grid, as a list of rows.
+
+    Returns:
+    (str) - the grid, one row per line.
+    """
+    return "".join(" ".join(row) + " \n" for row in grid) + "\n"
+
+
+def render_words(words, columns=2):
+    """Render a list of words as text, in columns.
+
+    Arguments:
+    words (list) - list of words.
+    columns (int) - number of columns to lay words out in.
+
+    Returns:
+    (str) - the words, a row of columns per line.
+
+    Raises:
+    ValueError - if columns is less than 1.
+    """
+    if columns < 1:
+        raise ValueError("columns must be at least 1, not {}".format(columns))
+
+    width = max((len(word) for word in words), default=0)
+    lines = []
+
+    for i in range(0, len(words), columns):
+        row = words[i:i + columns]
+        lines.append("  ".join(word.ljust(width) for word in row).rstrip())
+
+    return "".join(line + "\n" for line in lines) + "\n"
+
+
+def render_html(grid, words, columns=2):
+    """Render a wordsearch as an HTML fragment.
+
+    Arguments:
+    grid (list) - a wordsearch grid, as a list of rows.
+    words (list) - list of words.
+    columns (int) - number of columns to lay words out in.
+
+    Returns:
+    (str) - a table for the grid, followed by a list of the words.
+
+    Raises:
+    ValueError - if columns is less than 1.
+    """
+    if columns < 1:
+        raise ValueError("columns must be at least 1, not {}".format(columns))
+
+    parts = ["<table class=\"wordsearch\">\n"]
+
+    for row in grid:
+        parts.append("<tr>" + "".join("<td>" + escape(letter) + "</td>"
+            for letter in row) + "</tr>\n")
+
+    parts.append("</table>\n")
+    parts.append("<ul class=\"words\" style=\"columns: {}\">\n".format(
+        columns))
+    parts.append("".join("<li>" + escape(word) + "</li>\n"
+        for word in words))
+    parts.append("</ul>\n")
+
+    return "".join(parts)
+
+
+def render_svg(grid, words, columns=2, cell_size=24):
+    """Render a wordsearch as an SVG image.
+
+    SVG is vector based, so the image can be converted to PDF for printing
+    without losing quality.
+
+    Arguments:
+    grid (list) - a wordsearch grid, as a list of rows.
+    words (list) - list of words.
+    columns (int) - number of columns to lay words out in.
+    cell_size (int) - size of each grid cell, in pixels.
+
+    Returns:
+    (str) - an SVG document.
+
+    Raises:
+    ValueError - if columns is less than 1.
+    """
+    if columns < 1:
+        raise ValueError("columns must be at least 1, not {}".format(columns))
+
+    grid_width = max((len(row) for row in grid), default=0) * cell_size
+    grid_height = len(grid) * cell_size
+
+    word_rows = (len(words) + columns - 1) // columns
+    column_width = max(grid_width // columns, 1)
+    height = grid_height + (word_rows + 1) * cell_size
+
+    parts = ["<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"{}\" "
+            "height=\"{}\" font-family=\"monospace\" font-size=\"{}\" "
+            "text-anchor=\"middle\">\n".format(grid_width, height,
+                cell_size * 2 // 3)]
+
+    # Draw each letter in the middle of its cell.
+    for y, row in enumerate(grid):
+        text_y = y * cell_size + cell_size * 3 // 4
+        parts.append("".join("<text x=\"{}\" y=\"{}\">{}</text>".format(
+            x * cell_size + cell_size // 2, text_y, escape(letter))
+            for x, letter in enumerate(row)) + "\n")
+
+    # Lay the words out in columns below the grid.
+    parts.append("<g text-anchor=\"start\">\n")
+    for i, word in enumerate(words):
+        parts.append("<text x=\"{}\" y=\"{}\">{}</text>\n".format(
+            (i % columns) * column_width + cell_size // 2,
+            grid_height + (i // columns + 1) * cell_size + cell_size // 2,
+            escape(word)))
+    parts.append("</g>\n</svg>\n")
+
+    return "".join(parts)
+
+
+formats = {
+        "text": lambda grid, words: render_grid(grid) + render_words(words),
+        "html": render_html,
+        "svg": render_svg
+        }
+
+
+def write_wordsearch(grid, words, stream=None, output_format="text"):
+    """Write a wordsearch to a stream in a single write.
+
+    Arguments:
+    grid (list) - a wordsearch grid, as a list of rows.
+    words (list) - list of words.
+    stream (file) - stream to write to, or None for standard output.
+    output_format (str) - one of "text", "html" or "svg".
+    """
+    if stream is None:
+        stream = sys.stdout
+
+    stream.write(formats[output_format](grid, words))
@@ -0,0 +1,301 @@
+"""Wordsearch solver.
+
+Finds every occurrence of a list of words in a grid with an Aho-Corasick
+automaton, scanning each line of the grid once. The same automaton is used
+to fill grids without spelling any of the words by accident.
+"""
+
+import random
+from collections import deque
+
+
+# Directions lines of the grid are scanned in. Words are also matched
+# backwards, covering the other four directions.
+scan_directions = [
+        (1, 0),
+        (0, 1),
+        (1, 1),
+        (-1, 1)
+        ]
+
+
+class Automaton:
+    """Class for an Aho-Corasick automaton matching a list of words.
+
+    Each word is added forwards and backwards, so scanning a line one way
+    finds words going in both directions along it.
+
+    Attributes:
+    patterns (list) - list of (word, backwards) tuples, where backwards is
+    True if the pattern is the word reversed.
+    goto (list) - list of dictionaries mapping letters to next states, one
+    for each state of the trie.
+    fail (list) - list of states to fall back to when a letter doesn't
+    match.
+    outputs (list) - list of pattern numbers matched on reaching each state.
+    longest (list) - length of the longest pattern matched on reaching each
+    state, 0 if none.
+    """
+    def __init__(self, words):
+        """Initialise the new automaton.
+
+        Arguments:
+        words (list) - list of words to match.
+        """
+        self.patterns = []
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [[]]
+
+        # Build a trie of every word, forwards and backwards.
+        for word in sorted(set(words)):
+            self.add(word, False)
+            if len(word) > 1:
+                self.add(word[::-1], True)
+
+        # Link each state to the longest suffix of it in the trie, breadth
+        # first so shorter states are linked first.
+        queue = deque(self.goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+
+            for letter, next_state in self.goto[state].items():
+                queue.append(next_state)
+
+                fallback = self.fail[state]
+                while fallback and letter not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+
+                self.fail[next_state] = self.goto[fallback].get(letter, 0)
+                self.outputs[next_state] = (self.outputs[next_state] +
+                        self.outputs[self.fail[next_state]])
+
+        self.longest = [max((len(self.patterns[pattern][0])
+            for pattern in outputs), default=0) for outputs in self.outputs]
+
+    def add(self, pattern, backwards):
+        """Add a pattern to the trie.
+
+        Arguments:
+        pattern (str) - letters to match.
+        backwards (bool) - True if the pattern is a word reversed.
+        """
+        state = 0
+
+        for letter in pattern:
+            if letter not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+                self.goto[state][letter] = len(self.goto) - 1
+
+            state = self.goto[state][letter]
+
+        self.outputs[state].append(len(self.patterns))
+        self.patterns.append((pattern[::-1] if backwards else pattern,
+            backwards))
+
+    def step(self, state, letter):
+        """Move the automaton on by one letter.
+
+        Arguments:
+        state (int) - current state.
+        letter (str) - next letter.
+
+        Returns:
+        (int) - next state.
+        """
+        while state and letter not in self.goto[state]:
+            state = self.fail[state]
+
+        return self.goto[state].get(letter, 0)
+
+
+def lines(width, height):
+    """Get every line of a grid, in every scan direction.
+
+    Arguments:
+    width (int) - width of the grid.
+    height (int) - height of the grid.
+
+    Yields:
+    (tuple) - X and Y position of the start of the line, and its direction.
+    """
+    for d_x, d_y in scan_directions:
+        for y in range(height):
+            for x in range(width):
+                # Lines start where the previous cell is off the grid.
+                if not(0 <= x - d_x < width) or not(0 <= y - d_y < height):
+                    yield x, y, d_x, d_y
+
+
+def find_words(grid, words, automaton=None):
+    """Find every occurrence of some words in a grid.
+
+    Arguments:
+    grid (list) - a wordsearch grid, as a list of rows.
+    words (list) - list of words to find.
+    automaton (Automaton) - automaton for the words, to reuse one that has
+    already been built.
+
+    Returns:
+    found (list) - list of (word, x, y, d_x, d_y) tuples, giving the
+    position of the first letter and the direction of the word.
+    """
+    if automaton is None:
+        automaton = Automaton(words)
+
+    height = len(grid)
+    width = len(grid[0]) if height else 0
+    found = []
+
+    for start_x, start_y, d_x, d_y in lines(width, height):
+        x, y = start_x, start_y
+        state = 0
+
+        # Walk along the line, reporting matches that end at each cell.
+        while 0 <= x < width and 0 <= y < height:
+            state = automaton.step(state, grid[y][x])
+
+            for pattern in automaton.outputs[state]:
+                word, backwards = automaton.patterns[pattern]
+                span = len(word) - 1
+
+                if backwards:
+                    # Word starts here and runs back along the line.
+                    found.append((word, x, y, -d_x, -d_y))
+                else:
+                    found.append((word, x - span * d_x, y - span * d_y, d_x,
+                        d_y))
+
+            x += d_x
+            y += d_y
+
+    return found
+
+
+def count_words(grid, words, automaton=None):
+    """Count how many times each word appears in a grid.
+
+    Palindromes read the same both ways, so they are only counted once for
+    each set of cells they cover.
+
+    Arguments:
+    grid (list) - a wordsearch grid, as a list of rows.
+    words (list) - list of words to count.
+    automaton (Automaton) - automaton for the words, to reuse one that has
+    already been built.
+
+    Returns:
+    counts (dict) - dictionary mapping words to number of occurrences.
+    """
+    counts = {word: 0 for word in words}
+    seen = set()
+
+    for word, x, y, d_x, d_y in find_words(grid, words, automaton):
+        span = len(word) - 1
+        cells = frozenset(((x, y), (x + span * d_x, y + span * d_y)))
+
+        if (word, cells) not in seen:
+            seen.add((word, cells))
+            counts[word] += 1
+
+    return counts
+
+
+def check_wordsearch(grid, words):
+    """Check every word appears in a wordsearch exactly once.
+
+    Arguments:
+    grid (list) - a wordsearch grid, as a list of rows.
+    words (list) - list of words that should appear.
+
+    Returns:
+    (list) - list of words that are missing or appear more than once.
+    """
+    counts = count_words(grid, words)
+    return [word for word in counts if counts[word] != 1]
+
+
+def fill_safely(grid, words, alphabet_length, rng=None, automaton=None):
+    """Fill empty cells with letters that don't spell any of the words.
+
+    Cells are filled row by row, keeping the automaton state of every scan
+    direction at each cell, so each letter is checked without rescanning the
+    grid. A letter is rejected if it completes a word, either by itself or
+    along with the letters already placed after it on the same line. If
+    every letter is rejected, a random one is used.
+
+    Arguments:
+    grid (list) - a wordsearch grid, as a list of rows. Empty cells are
+    empty strings, and are filled in place.
+    words (list) - list of words in the wordsearch.
+    alphabet_length (int) - number of letters to choose from.
+    rng (random.Random) - random number generator to use, or None for the
+    random module.
+    automaton (Automaton) - automaton for the words, to reuse one that has
+    already been built.
+    """
+    if rng is None:
+        rng = random
+
+    if automaton is None:
+        automaton = Automaton(words)
+
+    height = len(grid)
+    width = len(grid[0]) if height else 0
+    longest_word = max(automaton.longest, default=0)
+    letters = [chr(i + ord("A")) for i in range(alphabet_length)]
+
+    # Automaton state after each cell, for each scan direction.
+    states = [[[0] * width for y in range(height)] for d in scan_directions]
+
+    def fits(letter, x, y, previous):
+        """Check a letter at a cell doesn't complete any word."""
+        for d, (d_x, d_y) in enumerate(scan_directions):
+            state = automaton.step(previous[d], letter)
+
+            # Follow the letters already placed after the cell, checking
+            # for words that cover the cell.
+            for i in range(longest_word):
+                if automaton.longest[state] > i:
+                    return False
+
+                next_x = x + (i + 1) * d_x
+                next_y = y + (i + 1) * d_y
+
+                if not(0 <= next_x < width and 0 <= next_y < height) or \
+                    not grid[next_y][next_x]:
+                    break
+
+                state = automaton.step(state, grid[next_y][next_x])
+
+        return True
+
+    for y in range(height):
+        for x in range(width):
+            # Get the state of each scan direction before this cell.
+            previous = []
+            for d, (d_x, d_y) in enumerate(scan_directions):
+                if 0 <= x - d_x < width and 0 <= y - d_y < height:
+                    previous.append(states[d][y - d_y][x - d_x])
+                else:
+                    previous.append(0)
+
+            if not grid[y][x]:
+                # Try letters from a random starting point.
+                start = rng.randrange(alphabet_length)
+
+                for i in range(alphabet_length):
+                    letter = letters[(start + i) % alphabet_length]
+                    if fits(letter, x, y, previous):
+                        break
+                else:
+                    letter = letters[start]
+
+                grid[y][x] = letter
+
+            # Move every scan direction on by the cell's letter.
+            for d in range(len(scan_directions)):
+                states[d][y][x] = automaton.step(previous[d], grid[y][x])
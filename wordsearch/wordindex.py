@@ -0,0 +1,152 @@
+"""Word index for selecting words quickly."""
+
+import random
+
+
+class WordIndex:
+    """Class for an index of words, bucketed by length.
+
+    Words are stored sorted by length so that every range of lengths maps
+    to one contiguous slice of the word list, letting a word be picked from
+    the slice without any retries.
+
+    Attributes:
+    words (list) - list of words, sorted by length.
+    offsets (dict) - dictionary mapping a word length to the index of the
+    first word of that length.
+    max_length (int) - length of the longest word in the index.
+    """
+    def __init__(self, words):
+        """Initialise the new word index.
+
+        Arguments:
+        words (iterable) - words to index.
+        """
+        # Normalise words, dropping blank lines.
+        self.words = sorted((word.strip().upper() for word in words
+            if word.strip()), key=len)
+
+        # Find where each length starts in the sorted word list.
+        self.offsets = {}
+        self.max_length = len(self.words[-1]) if self.words else 0
+
+        position = 0
+        for length in range(self.max_length + 2):
+            while (position < len(self.words) and
+                    len(self.words[position]) < length):
+                position += 1
+            self.offsets[length] = position
+
+        # Cache of indexes restricted to a set of letters.
+        self.restricted = {}
+
+    def __len__(self):
+        """Return the number of words in the index."""
+        return len(self.words)
+
+    def pool(self, min_word_length, max_word_length):
+        """Get the slice of the word list holding eligible words.
+
+        Arguments:
+        min_word_length (int) - minimum word length.
+        max_word_length (int) - maximum word length.
+
+        Returns:
+        (tuple) - start and end index of the eligible words.
+        """
+        # Clamp lengths to the lengths held in the index.
+        min_word_length = min(max(min_word_length, 0), self.max_length + 1)
+        max_word_length = min(max(max_word_length, -1), self.max_length)
+
+        start = self.offsets[min_word_length]
+        end = self.offsets[max_word_length + 1]
+
+        return start, max(start, end)
+
+    def count(self, min_word_length, max_word_length):
+        """Count the number of eligible words.
+
+        Arguments:
+        min_word_length (int) - minimum word length.
+        max_word_length (int) - maximum word length.
+
+        Returns:
+        (int) - number of words with an eligible length.
+        """
+        start, end = self.pool(min_word_length, max_word_length)
+        return end - start
+
+    def restrict(self, letters):
+        """Get an index of the words only made up of some letters.
+
+        Restricted indexes are built once and cached.
+
+        Arguments:
+        letters (str) - letters that words may use.
+
+        Returns:
+        (WordIndex) - index of words made up of the given letters.
+        """
+        key = frozenset(letters.upper())
+
+        if key not in self.restricted:
+            self.restricted[key] = WordIndex(word for word in self.words
+                    if key.issuperset(word))
+
+        return self.restricted[key]
+
+    def select(self, min_word_length, max_word_length, number_of_words,
+            letters=None, rng=None):
+        """Select random words from the index.
+
+        Arguments:
+        min_word_length (int) - minimum word length to select.
+        max_word_length (int) - maximum word length to select.
+        number_of_words (int) - number of words to select.
+        letters (str) - letters that words may use, or None for any.
+        rng (random.Random) - random number generator to use, or None for
+        the random module.
+
+        Returns:
+        selected_words (list) - list of words.
+        """
+        # Use the restricted index if only some letters are allowed.
+        if letters is not None:
+            return self.restrict(letters).select(min_word_length,
+                    max_word_length, number_of_words, rng=rng)
+
+        start, end = self.pool(min_word_length, max_word_length)
+
+        if start == end:
+            raise ValueError("No words between {} and {} letters long.".format(
+                min_word_length, max_word_length))
+
+        if rng is None:
+            rng = random
+
+        # Pick words directly from the eligible slice.
+        return [self.words[rng.randint(start, end - 1)]
+                for i in range(number_of_words)]
+
+
+# Cache of word indexes that have been loaded, by file name.
+loaded_indexes = {}
+
+
+def load_word_index(word_file):
+    """Load a word index from a word file.
+
+    Each word file is only read once, later calls reuse the same index.
+
+    Arguments:
+    word_file (str) - file name of file containing words.
+
+    Returns:
+    (WordIndex) - index of words in the file.
+    """
+    if word_file not in loaded_indexes:
+        # Open file and index all words.
+        with(open(word_file, "r")) as file:
+            loaded_indexes[word_file] = WordIndex(file.read().splitlines())
+
+    return loaded_indexes[word_file]